@@ -11,22 +11,8 @@ import subprocess
 import importlib
 from ._version import get_versions
 from yggdrasil import config
-_test_package_name = None
-_test_package = None
 logging.basicConfig()
 logger = logging.getLogger(__name__)
-order = ['pytest', 'nose']
-try:
-    _test_package_name = order[0]
-    _test_package = importlib.import_module(_test_package_name)
-except ImportError:  # pragma: debug
-    try:
-        _test_package_name = order[1]
-        _test_package = importlib.import_module(_test_package_name)
-    except ImportError:
-        _test_package_name = None
-        _test_package = None
-    
 
 if platform._is_win:  # pragma: windows
     # This is required to fix crash on Windows in case of Ctrl+C
@@ -77,6 +63,28 @@ def expand_and_add(path, path_list, dir_list):  # pragma: no cover
     return 0
 
 
+def get_test_package(order=['pytest', 'nose']):  # pragma: no cover
+    r"""Import the package that should be used to run tests. This is done
+    when the tests are run, rather than when yggdrasil is imported, so that
+    models do not pay the cost of importing the test runner.
+
+    Args:
+        order (list, optional): Names of test packages in the order that
+            they should be tried. Defaults to ['pytest', 'nose'].
+
+    Returns:
+        tuple: The name of the test package and the imported module. If
+            none of the packages can be imported, (None, None) is returned.
+
+    """
+    for x in order:
+        try:
+            return x, importlib.import_module(x)
+        except ImportError:  # pragma: debug
+            pass
+    return None, None
+
+
 def run_tsts(**kwargs):  # pragma: no cover
     r"""Run tests for the package. Relative paths are interpreted to be
     relative to the package root directory.
@@ -99,6 +107,7 @@ def run_tsts(**kwargs):  # pragma: no cover
             and all languages will be tested.
 
     """
+    _test_package_name, _test_package = get_test_package()
     if '-h' not in sys.argv:
         if _test_package is None:
             raise RuntimeError("Could not locate test runner pytest or nose.")
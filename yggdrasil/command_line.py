@@ -181,13 +181,19 @@ def yggrun():
     parser = argparse.ArgumentParser(description='Run an integration.')
     parser.add_argument('yamlfile', nargs='+',
                         help='One or more yaml specification files.')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help=('Maximum number of compilation processes that '
+                              'should be run at the same time. Defaults to '
+                              'the \'jobs\' option in the \'build\' section '
+                              'of the config file.'))
     args = parser.parse_args()
     prog = sys.argv[0].split(os.path.sep)[-1]
-    runner.run(args.yamlfile, ygg_debug_prefix=prog)
+    runner.run(args.yamlfile, ygg_debug_prefix=prog, jobs=args.jobs)
 
 
 def yggclean():
-    r"""Cleanup dependency files."""
+    r"""Cleanup dependency files and, if all languages are cleaned, the
+    build cache."""
     from yggdrasil.tools import get_supported_lang
     from yggdrasil.components import import_component
     parser = argparse.ArgumentParser(
@@ -197,7 +203,10 @@ def yggclean():
                               'dependencies for.'))
     args = parser.parse_args()
     if (len(args.language) == 0) or ('all' in args.language):
+        from yggdrasil.drivers.CompiledModelDriver import clear_build_cache
         args.language = get_supported_lang()
+        # Cached products are shared between languages
+        clear_build_cache()
     for l in args.language:
         import_component('model', l).cleanup_dependencies()
 
@@ -260,12 +269,16 @@ def regen_metaschema():
     
 
 def regen_schema():
-    r"""Regenerate the yggdrasil schema."""
-    from yggdrasil import schema
+    r"""Regenerate the yggdrasil schema and component manifest."""
+    from yggdrasil import schema, components
     if os.path.isfile(schema._schema_fname):
         os.remove(schema._schema_fname)
     schema.clear_schema()
     schema.init_schema()
+    if os.path.isfile(components._manifest_fname):
+        os.remove(components._manifest_fname)
+    components.clear_manifest()
+    components.get_manifest()
 
 
 def validate_yaml():
@@ -333,6 +346,9 @@ def update_config():
                                   disable_languages=args.disable_languages,
                                   enable_languages=args.enable_languages,
                                   lang_kwargs=lang_kwargs)
+    # Make sure the component manifest is up to date with the schema
+    from yggdrasil import components
+    components.get_manifest()
 
 
 def yggtime_comm():
@@ -2,11 +2,57 @@ from yggdrasil.communication.FileComm import FileComm
 
 
 class AsciiTableComm(FileComm):
-    r"""Class for handling I/O from/to a file on disk."""
-    
+    r"""Class for handling I/O from/to a file on disk.
+
+    Args:
+        name (str): The environment variable where file path is stored.
+        chunk_size (int, optional): Number of rows that should be received
+            from the file in each message. Defaults to 0 and all of the
+            remaining rows are received as a single message. This is only
+            used when as_array is True.
+        **kwargs: Additional keywords arguments are passed to parent class.
+
+    Attributes:
+        chunk_size (int): Number of rows that should be received from the
+            file in each message.
+
+    """
+
     _filetype = 'table'
     _schema_subtype_description = ('The file is an ASCII table that will be '
                                    'read/written one row at a time. If '
                                    '``as_array`` is ``True``, the table will '
                                    'be read/written all at once.')
+    _schema_properties = {
+        'chunk_size': {'type': 'integer', 'default': 0, 'minimum': 0}}
     _default_serializer = 'table'
+
+    def _file_read(self):
+        r"""Read the next message from the current position in the file. If
+        chunk_size is set, only that many rows are read.
+
+        Returns:
+            bytes: Bytes read from the file. An empty bytes string indicates
+                that there are not any messages left in the file.
+
+        """
+        if not ((self.read_meth == 'read') and self.chunk_size
+                and self.serializer.concats_as_str):
+            return super(AsciiTableComm, self)._file_read()
+        out = []
+        nrows = 0
+        while nrows < self.chunk_size:
+            pos = self.fd.tell()
+            line = self.fd.readline()
+            if not line:
+                break
+            if self.append and (not line.endswith(self.platform_newline)):
+                # Wait for the rest of the row to be written
+                self.fd.seek(pos)
+                break
+            out.append(line)
+            if not line.startswith(self.serializer.comment):
+                nrows += 1
+        if nrows == 0:
+            return b''
+        return b''.join(out)
@@ -3,6 +3,63 @@ from yggdrasil.components import import_component
 from yggdrasil.communication import (CommBase, new_comm, get_comm)
 
 
+class ClientFuture(object):
+    r"""Handle for the response to an asynchronous RPC request.
+
+    Args:
+        comm (ClientComm): Client comm that sent the request.
+        request_id (str): ID of the request that the response is associated
+            with. If None, the request failed and the result is set to the
+            provided result.
+        result (tuple, optional): Result that should be returned by the
+            future without receiving a response. Defaults to None.
+
+    Attributes:
+        comm (ClientComm): Client comm that sent the request.
+        request_id (str): ID of the request that the response is associated
+            with.
+
+    """
+
+    def __init__(self, comm, request_id, result=None):
+        self.comm = comm
+        self.request_id = request_id
+        self._result = result
+
+    def done(self):
+        r"""Determine if the response has been received or is waiting to be
+        received.
+
+        Returns:
+            bool: True if the result is available without blocking, False
+                otherwise.
+
+        """
+        if self._result is not None:
+            return True
+        icomm = self.comm.icomm.get(self.request_id, None)
+        return (icomm is None) or (icomm.n_msg_recv > 0)
+
+    def result(self, timeout=False):
+        r"""Get the response to the request, waiting for it if it has not
+        been received yet.
+
+        Args:
+            timeout (float, optional): Time (in seconds) that should be waited
+                for the response. Defaults to False and the call will block
+                until the response is received.
+
+        Returns:
+            tuple (bool, obj): Success or failure of receive and received
+                message.
+
+        """
+        if self._result is None:
+            self._result = self.comm.recv_response(self.request_id,
+                                                   timeout=timeout)
+        return self._result
+
+
 class ClientComm(CommBase.CommBase):
     r"""Class for handling Client side communication.
 
@@ -19,6 +76,9 @@ class ClientComm(CommBase.CommBase):
         response_kwargs (dict): Keyword arguments for the response comm.
         icomm (dict): Response comms keyed to the ID of the associated request.
         icomm_order (list): Response comm keys in the order or the requests.
+        icomm_async (set): Keys for response comms that are associated with
+            asynchronous requests and will be received via a
+            :class:`ClientFuture`.
         ocomm (Comm): Request comm.
 
     """
@@ -38,6 +98,7 @@ class ClientComm(CommBase.CommBase):
         self.ocomm = get_comm(ocomm_name, **ocomm_kwargs)
         self.icomm = dict()
         self.icomm_order = []
+        self.icomm_async = set()
         self.response_kwargs.setdefault('comm', self.ocomm.comm_class)
         self.response_kwargs.setdefault('recv_timeout', self.ocomm.recv_timeout)
         self.response_kwargs.setdefault('language', self.ocomm.language)
@@ -163,10 +224,20 @@ class ClientComm(CommBase.CommBase):
         self.icomm_order.append(header['request_id'])
         return header
 
-    def remove_response_comm(self):
-        r"""Remove response comm."""
-        key = self.icomm_order.pop(0)
-        icomm = self.icomm.pop(key)
+    def remove_response_comm(self, request_id=None):
+        r"""Remove response comm.
+
+        Args:
+            request_id (str, optional): ID of the request associated with the
+                response comm that should be removed. Defaults to None and
+                the oldest response comm is removed.
+
+        """
+        if request_id is None:
+            request_id = self.icomm_order[0]
+        self.icomm_order.remove(request_id)
+        self.icomm_async.discard(request_id)
+        icomm = self.icomm.pop(request_id)
         icomm.close()
 
     # SEND METHODS
@@ -211,10 +282,30 @@ class ClientComm(CommBase.CommBase):
         # if self.is_closed:
         #     self.debug("recv(): Connection closed.")
         #     return (False, None)
-        if len(self.icomm) == 0:  # pragma: debug
+        keys = [k for k in self.icomm_order if k not in self.icomm_async]
+        if len(keys) == 0:  # pragma: debug
             raise RuntimeError("There are not any registered response comms.")
-        out = self.icomm[self.icomm_order[0]].recv(*args, **kwargs)
-        self.remove_response_comm()
+        return self.recv_response(keys[0], *args, **kwargs)
+
+    def recv_response(self, request_id, *args, **kwargs):
+        r"""Receive the response to a specific request from the associated
+        response comm.
+
+        Args:
+            request_id (str): ID of the request that the response should be
+                received for.
+            *args: Arguments are passed to input comm recv method.
+            **kwargs: Keyword arguments are passed to input comm recv method.
+
+        Returns:
+            obj: Output from input comm recv method.
+
+        """
+        if request_id not in self.icomm:  # pragma: debug
+            raise RuntimeError("There is not a response comm registered for "
+                               "request %s." % request_id)
+        out = self.icomm[request_id].recv(*args, **kwargs)
+        self.remove_response_comm(request_id)
         return out
 
     # CALL
@@ -235,6 +326,54 @@ class ClientComm(CommBase.CommBase):
             return (False, self.empty_obj_recv)
         return self.recv(timeout=False)
 
+    def call_async(self, *args, **kwargs):
+        r"""Send an RPC request without waiting for the response. Any number
+        of requests can be outstanding at once and responses are matched to
+        requests by request ID, regardless of the order they arrive in.
+
+        Args:
+            *args: Arguments are passed to output comm send method.
+            **kwargs: Keyword arguments are passed to output comm send method
+
+        Returns:
+            ClientFuture: Future that can be used to retrieve the response.
+
+        """
+        nbefore = len(self.icomm_order)
+        flag = self.send(*args, **kwargs)
+        if not flag:  # pragma: debug
+            return ClientFuture(self, None, result=(False, self.empty_obj_recv))
+        if len(self.icomm_order) == nbefore:
+            # Request filtered, so there will not be a response
+            return ClientFuture(self, None, result=(True, self.empty_obj_recv))
+        request_id = self.icomm_order[-1]
+        self.icomm_async.add(request_id)
+        return ClientFuture(self, request_id)
+
+    def call_many(self, list_of_args, **kwargs):
+        r"""Do several RPC calls, sending all of the requests before waiting
+        for any responses so that the server can process them while the
+        remaining requests are sent.
+
+        Args:
+            list_of_args (list): Arguments for each request. Tuples are
+                expanded as the arguments for a single call, all other
+                elements are treated as the only argument to the call.
+            **kwargs: Keyword arguments are passed to output comm send method
+                for every request.
+
+        Returns:
+            list: Output from input comm recv method for each request in the
+                order that the requests were provided.
+
+        """
+        futures = []
+        for args in list_of_args:
+            if not isinstance(args, tuple):
+                args = (args,)
+            futures.append(self.call_async(*args, **kwargs))
+        return [f.result() for f in futures]
+
     def call_nolimit(self, *args, **kwargs):
         r"""Alias for call."""
         return self.call(*args, **kwargs)
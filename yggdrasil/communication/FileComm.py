@@ -1,5 +1,6 @@
 import os
 import copy
+import bisect
 import tempfile
 from yggdrasil import platform, tools
 from yggdrasil.serialize.SerializeBase import SerializeBase
@@ -102,6 +103,9 @@ class FileComm(CommBase.CommBase):
         # Process file class keywords
         if not hasattr(self, '_fd'):
             self._fd = None
+        self._append_state = None
+        self._line_index = None
+        self._line_index_end = 0
         self.platform_newline = platform._newline
         if self.in_temp:
             self.address = os.path.join(tempfile.gettempdir(), self.address)
@@ -132,7 +136,7 @@ class FileComm(CommBase.CommBase):
         if cls._filetype != 'binary':
             assert('serializer' not in cls._schema_properties)
             cls._schema_properties.update(
-                cls._default_serializer_class._schema_properties)
+                cls.get_default_serializer_class()._schema_properties)
             del cls._schema_properties['seritype']
 
     @classmethod
@@ -173,7 +177,7 @@ class FileComm(CommBase.CommBase):
                 out['contents'] += comment
                 out['recv_partial'].append([])
         else:
-            seri_cls = cls._default_serializer_class
+            seri_cls = cls.get_default_serializer_class()
             if seri_cls.concats_as_str:
                 out['recv_partial'] = [[x] for x in out['recv']]
                 out['recv'] = seri_cls.concatenate(out['recv'], **out['kwargs'])
@@ -440,6 +444,7 @@ class FileComm(CommBase.CommBase):
                 if self.is_open:
                     raise
         self._fd = None
+        self._line_index = None
 
     def open(self):
         r"""Open the file."""
@@ -516,6 +521,8 @@ class FileComm(CommBase.CommBase):
             return 0
         if self.read_meth == 'read':
             return int(self.remaining_bytes > 0)
+        elif (self.read_meth == 'readline') and (not self.is_series):
+            out = self.count_remaining_lines()
         elif self.read_meth == 'readline':
             pos = self.record_position()
             try:
@@ -532,6 +539,59 @@ class FileComm(CommBase.CommBase):
             out = 0
         return out
 
+    def update_line_index(self):
+        r"""Extend the index of the positions of message lines (lines that
+        are not comments) in the current file to include complete lines
+        added since the index was last updated.
+
+        Returns:
+            bytes: Incomplete line at the end of the file that is not included
+                in the index.
+
+        """
+        pos = self.fd.tell()
+        try:
+            self.fd.seek(0, os.SEEK_END)
+            if ((self._line_index is None)
+                    or (self.fd.tell() < self._line_index_end)):
+                # File was replaced or truncated
+                self._line_index = []
+                self._line_index_end = 0
+            self.fd.seek(self._line_index_end)
+            for line in self.fd:
+                if not line.endswith(b'\n'):
+                    return line
+                if not line.startswith(self.serializer.comment):
+                    self._line_index.append(self._line_index_end)
+                self._line_index_end += len(line)
+            return b''
+        finally:
+            self.fd.seek(pos)
+
+    def count_remaining_lines(self):
+        r"""Count the number of message lines (lines that are not comments)
+        between the current position and the end of the current file. Lines
+        are indexed the first time they are counted so that the file is only
+        read once.
+
+        Returns:
+            int: Number of message lines.
+
+        """
+        try:
+            incomplete = self.update_line_index()
+            pos = self.fd.tell()
+        except (AttributeError, ValueError):  # pragma: debug
+            if self.is_open:
+                raise
+            return 0
+        out = len(self._line_index) - bisect.bisect_left(self._line_index, pos)
+        # Incomplete lines will still be returned by readline
+        if ((incomplete and (pos <= self._line_index_end)
+             and (not incomplete.startswith(self.serializer.comment)))):
+            out += 1
+        return out
+
     def on_send_eof(self):
         r"""Close file when EOF to be sent.
 
@@ -551,6 +611,15 @@ class FileComm(CommBase.CommBase):
     def serialize(self, obj, **kwargs):
         r"""Serialize a message using the associated serializer."""
         if (not self.serializer.concats_as_str) and (self.fd.tell() != 0):
+            # Append to the existing file if the serializer supports it
+            out = None
+            if self._append_state is not None:
+                out = self.serializer.serialize_append(obj, self._append_state)
+            if out is not None:
+                msg, pos = out
+                self.fd.seek(pos)
+                self.fd.truncate()
+                return msg
             new_obj = obj
             with open(self.current_address, 'rb') as fd:
                 old_obj = self.deserialize(fd.read())[0]
@@ -559,7 +628,10 @@ class FileComm(CommBase.CommBase):
             obj = obj[0]
             # Reset file so that header will be written
             self.reset_position(truncate=True)
-        return super(FileComm, self).serialize(obj, **kwargs)
+        msg = super(FileComm, self).serialize(obj, **kwargs)
+        if (not self.serializer.concats_as_str) and (not self.serializer.has_header):
+            self._append_state = self.serializer.get_append_state(obj, msg)
+        return msg
             
     def _send(self, msg):
         r"""Write message to a file.
@@ -590,6 +662,22 @@ class FileComm(CommBase.CommBase):
             self.debug("Advanced to %d", self._series_index)
         return True
 
+    def _file_read(self):
+        r"""Read the next message from the current position in the file.
+
+        Returns:
+            bytes: Bytes read from the file. An empty bytes string indicates
+                that there are not any messages left in the file.
+
+        """
+        if self.read_meth == 'read':
+            if self.serializer.is_framed:
+                # Read one frame at a time so that the rest of the file
+                # is not read (and re-read) for every message
+                return self.serializer.read_frame(self.fd)
+            return self.fd.read()
+        return self.fd.readline()
+
     def _recv(self, timeout=0):
         r"""Reads message from a file.
 
@@ -606,10 +694,7 @@ class FileComm(CommBase.CommBase):
         try:
             self.read_header()
             prev_pos = self.fd.tell()
-            if self.read_meth == 'read':
-                out = self.fd.read()
-            elif self.read_meth == 'readline':
-                out = self.fd.readline()
+            out = self._file_read()
         except BaseException:  # pragma: debug
             # Use this to catch case where close called during receive.
             # In the future this should be handled via a lock.
@@ -637,13 +722,6 @@ class FileComm(CommBase.CommBase):
                     # concatenate
                     self.reset_position()
                     flag, out = self._recv()
-                elif (self.read_meth == 'read') and self.serializer.is_framed:
-                    # Rewind if more than one frame read
-                    len0 = len(out)
-                    out = self.serializer.get_first_frame(out)
-                    len1 = len(out)
-                    if (len1 > 0) and (len0 != len1):
-                        self.fd.seek(prev_pos + len1)
         return (flag, out)
 
     def purge(self):
@@ -0,0 +1,315 @@
+import os
+import io as sio
+import numpy as np
+from yggdrasil.communication import FileComm
+
+
+class NumpyFileComm(FileComm.FileComm):
+    r"""Class for handling I/O from/to a numpy .npy file on disk. Files are
+    memory mapped when they are read so that the array is not loaded into
+    memory all at once and arrays that are sent are appended to the file
+    as rows, with the shape in the header updated after each write.
+
+    Args:
+        name (str): The environment variable where file path is stored.
+        chunk_size (int, optional): Number of rows that should be received
+            from the file in each message. Defaults to 0 and all of the
+            remaining rows are received as a single message.
+        **kwargs: Additional keywords arguments are passed to parent class.
+
+    Attributes:
+        chunk_size (int): Number of rows that should be received from the
+            file in each message.
+
+    """
+
+    _filetype = 'npy'
+    _schema_subtype_description = ('The file contains a numpy array in the '
+                                   '.npy format that is memory mapped when '
+                                   'read.')
+    _schema_properties = {
+        'chunk_size': {'type': 'integer', 'default': 0, 'minimum': 0}}
+    _default_serializer = 'npy'
+    _default_extension = '.npy'
+
+    @classmethod
+    def get_testing_options(cls, **kwargs):
+        r"""Method to return a dictionary of testing options for this class.
+
+        Args:
+            **kwargs: Keyword arguments are passed to the parent class's method.
+
+        Returns:
+            dict: Dictionary of variables to use for testing.
+
+        """
+        out = super(NumpyFileComm, cls).get_testing_options(**kwargs)
+        # Rows that are appended are received as new messages
+        out['recv_partial'] = [[x] for x in out['send']]
+        return out
+
+    def _init_before_open(self, **kwargs):
+        r"""Set attributes for tracking the array in the file."""
+        self._array = None
+        self._array_info = None
+        self._rows_read = 0
+        super(NumpyFileComm, self)._init_before_open(**kwargs)
+
+    @property
+    def open_mode(self):
+        r"""str: Mode that should be used to open the file."""
+        out = super(NumpyFileComm, self).open_mode
+        # The header is read back when it changes size
+        if out == 'wb':
+            out = 'w+b'
+        return out
+
+    def _file_close(self):
+        super(NumpyFileComm, self)._file_close()
+        self._array = None
+        self._array_info = None
+        self._rows_read = 0
+
+    def read_array_header(self):
+        r"""Read the .npy header from the current file.
+
+        Returns:
+            dict: Shape, data type, and order of the array in the file as well
+                as the size of the header in bytes. None is returned if the
+                file does not contain a complete header.
+
+        """
+        self.fd.seek(0)
+        try:
+            version = np.lib.format.read_magic(self.fd)
+            if version == (1, 0):
+                header = np.lib.format.read_array_header_1_0(self.fd)
+            else:
+                header = np.lib.format.read_array_header_2_0(self.fd)
+        except ValueError:
+            return None
+        shape, fortran_order, dtype = header
+        return {'shape': shape, 'fortran_order': fortran_order,
+                'dtype': dtype, 'header_size': self.fd.tell()}
+
+    def write_array_header(self):
+        r"""Write the .npy header for the array in the file, moving the data
+        if the size of the header changes."""
+        info = self._array_info
+        d = {'descr': np.lib.format.dtype_to_descr(info['dtype']),
+             'fortran_order': info['fortran_order'],
+             'shape': info['shape']}
+        fd = sio.BytesIO()
+        try:
+            np.lib.format.write_array_header_1_0(fd, d)
+        except ValueError:  # pragma: no cover
+            fd = sio.BytesIO()
+            np.lib.format.write_array_header_2_0(fd, d)
+        header = fd.getvalue()
+        old_size = info.get('header_size', None)
+        if (old_size is not None) and (old_size != len(header)):
+            self.fd.seek(old_size)
+            data = self.fd.read()
+            self.fd.seek(0)
+            self.fd.write(header)
+            self.fd.write(data)
+            self.fd.truncate()
+        else:
+            self.fd.seek(0)
+            self.fd.write(header)
+        info['header_size'] = len(header)
+        self.fd.seek(0, os.SEEK_END)
+
+    def write_array(self, arr):
+        r"""Append rows to the array in the file.
+
+        Args:
+            arr (np.ndarray): Rows that should be added to the array.
+
+        Raises:
+            ValueError: If the shape of the rows does not match the shape of
+                the rows already in the file.
+
+        """
+        arr = np.atleast_1d(arr)
+        if self._array_info is None:
+            self._array_info = self.read_array_header()
+        if self._array_info is None:
+            self._array_info = {'shape': (0, ) + arr.shape[1:],
+                                'fortran_order': False,
+                                'dtype': arr.dtype}
+        info = self._array_info
+        if arr.shape[1:] != info['shape'][1:]:
+            raise ValueError(("Cannot append rows with shape %s to an array "
+                              "with shape %s.") % (arr.shape, info['shape']))
+        order = 'F' if info['fortran_order'] else 'C'
+        if info['fortran_order'] and (info['shape'][0] > 0):
+            raise ValueError("Cannot append rows to a Fortran ordered array.")
+        arr = np.asarray(arr, dtype=info['dtype'], order=order)
+        info['shape'] = (info['shape'][0] + arr.shape[0], ) + info['shape'][1:]
+        if info.get('header_size', None) is None:
+            self.write_array_header()
+        self.fd.seek(0, os.SEEK_END)
+        self.fd.write(arr.reshape(-1, order='A').view(np.uint8))
+        self.write_array_header()
+
+    def get_array(self):
+        r"""Get the memory mapped array for the current file. The header is
+        read again if all of the rows have been read so that rows added to
+        the file are included.
+
+        Returns:
+            np.ndarray: Memory mapped array. None is returned if the file does
+                not contain a complete header.
+
+        """
+        if (self._array is None) or (self._rows_read >= len(self._array)):
+            info = self.read_array_header()
+            if info is None:
+                return None
+            shape = info['shape']
+            if len(shape) == 0:
+                shape = (1, )
+            if int(np.prod(shape)) == 0:
+                self._array = np.empty(shape, dtype=info['dtype'])
+            else:
+                self._array = np.memmap(
+                    self.fd, dtype=info['dtype'], mode='r',
+                    offset=info['header_size'], shape=shape,
+                    order=('F' if info['fortran_order'] else 'C'))
+        return self._array
+
+    @property
+    def remaining_rows(self):
+        r"""int: Number of rows remaining in the current file."""
+        if self.is_closed or self.direction == 'send':
+            return 0
+        try:
+            arr = self.get_array()
+        except (AttributeError, ValueError):  # pragma: debug
+            if self.is_open:
+                raise
+            arr = None
+        if arr is None:
+            return 0
+        return len(arr) - self._rows_read
+
+    @property
+    def remaining_bytes(self):
+        r"""int: Remaining bytes in the file."""
+        nrows = self.remaining_rows
+        out = 0
+        if nrows > 0:
+            out = nrows * (self._array.nbytes // len(self._array))
+        if self.is_series and (not self.is_closed) and (self.direction == 'recv'):
+            i = self._series_index + 1
+            while True:
+                fname = self.get_series_address(i)
+                if not os.path.isfile(fname):
+                    break
+                out += os.path.getsize(fname)
+                i += 1
+        return out
+
+    @property
+    def n_msg_recv(self):
+        r"""int: The number of messages in the file."""
+        if self.is_closed:
+            return 0
+        nrows = self.remaining_rows
+        if self.chunk_size:
+            out = -(-nrows // self.chunk_size)
+        else:
+            out = int(nrows > 0)
+        if (out == 0) and self.is_series:
+            out = int(self.remaining_bytes > 0)
+        return out
+
+    def is_empty(self, msg, emsg):
+        r"""Check that a message matches an empty message object.
+
+        Args:
+            msg (object): Message object.
+            emsg (object): Empty message object.
+
+        Returns:
+            bool: True if the object is empty, False otherwise.
+
+        """
+        if isinstance(msg, np.ndarray):
+            return ((msg.size == 0) and (not isinstance(emsg, bytes)))
+        return super(NumpyFileComm, self).is_empty(msg, emsg)
+
+    def serialize(self, obj, **kwargs):
+        r"""Arrays are written to the file directly."""
+        if isinstance(obj, bytes):
+            return super(NumpyFileComm, self).serialize(obj, **kwargs)
+        return obj
+
+    def deserialize(self, msg, **kwargs):
+        r"""Arrays are read from the file directly."""
+        if isinstance(msg, bytes):
+            return super(NumpyFileComm, self).deserialize(msg, **kwargs)
+        return msg, {}
+
+    def _send(self, msg):
+        r"""Append rows to the array in the file.
+
+        Args:
+            msg (np.ndarray, bytes): Rows to add to the file or EOF message.
+
+        Returns:
+            bool: Success or failure of writing to the file.
+
+        """
+        if self.is_eof(msg):
+            return super(NumpyFileComm, self)._send(msg)
+        try:
+            self.write_array(msg)
+            self.fd.flush()
+        except (AttributeError, ValueError):
+            if self.is_open:
+                raise
+            return False  # pragma: debug
+        if self.is_series:
+            self.advance_in_series()
+            self.debug("Advanced to %d", self._series_index)
+        return True
+
+    def _recv(self, timeout=0):
+        r"""Get rows from the memory mapped array in the file.
+
+        Args:
+            timeout (float, optional): Time in seconds to wait for a message.
+                Defaults to self.recv_timeout. Unused.
+
+        Returns:
+            tuple (bool, np.ndarray): Success or failure of reading from the
+                file and the rows read from the file.
+
+        """
+        try:
+            arr = self.get_array()
+        except BaseException:  # pragma: debug
+            # Use this to catch case where close called during receive.
+            arr = None
+        if (arr is None) or (self._rows_read >= len(arr)):
+            if self.advance_in_series():
+                self.debug("Advanced to %d", self._series_index)
+                return self._recv()
+            elif self.append and self.is_open:
+                return True, self.empty_bytes_msg
+            return True, self.eof_msg
+        start = self._rows_read
+        if self.chunk_size:
+            self._rows_read = min(start + self.chunk_size, len(arr))
+        else:
+            self._rows_read = len(arr)
+        return True, np.asarray(arr[start:self._rows_read])
+
+    def purge(self):
+        r"""Purge all messages from the comm."""
+        if self.is_open and self.direction == 'recv':
+            arr = self.get_array()
+            if arr is not None:
+                self._rows_read = len(arr)
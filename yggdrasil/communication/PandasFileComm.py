@@ -16,3 +16,17 @@ class PandasFileComm(AsciiTableComm):
     _filetype = 'pandas'
     _schema_subtype_description = ('The file is a Pandas frame output as a table.')
     _default_serializer = 'pandas'
+
+    @staticmethod
+    def before_registration(cls):
+        r"""Operations that should be performed to modify class attributes prior
+        to registration."""
+        AsciiTableComm.before_registration(cls)
+        # Files are always written as CSV
+        cls._schema_properties.pop('binary', None)
+
+    def _init_before_open(self, **kwargs):
+        r"""Disable the binary frame format for the serializer."""
+        super(PandasFileComm, self)._init_before_open(**kwargs)
+        if getattr(self.serializer, 'binary', False):
+            self.serializer.binary = False
@@ -57,6 +57,20 @@ class FilterBase(ComponentBase):
             raise
         return out
 
+    def evaluate_mask(self, x):
+        r"""Evaluate the filter for each element in a batch of messages.
+
+        Args:
+            x (np.ndarray, list): Batch of message objects (e.g. the rows of
+                a structured array).
+
+        Returns:
+            np.ndarray: Boolean mask that is True for elements that will pass
+                through the filter.
+
+        """
+        return np.array([self(ix) for ix in x], dtype=bool)
+
     @classmethod
     def get_testing_options(cls):
         r"""Get testing options for the filter class.
@@ -1,6 +1,6 @@
 import numpy as np
 from yggdrasil import units
-from yggdrasil.tools import safe_eval
+from yggdrasil.tools import safe_eval, compile_statement
 from yggdrasil.communication.filters.FilterBase import FilterBase
 
 
@@ -27,6 +27,7 @@ class StatementFilter(FilterBase):
     def __init__(self, *args, **kwargs):
         super(StatementFilter, self).__init__(*args, **kwargs)
         self.statement = self.statement.replace('%x%', 'x')
+        self._compiled = compile_statement(self.statement)
 
     def evaluate_filter(self, x):
         r"""Call filter on the provided message.
@@ -38,7 +39,35 @@ class StatementFilter(FilterBase):
             bool: True if the message will pass through the filter, False otherwise.
 
         """
-        return safe_eval(self.statement, x=x)
+        return safe_eval(self._compiled, x=x)
+
+    def evaluate_mask(self, x):
+        r"""Evaluate the filter for each element in a batch of messages. If
+        the batch is a numpy array, the statement is evaluated once with
+        "%x%" set to the entire array and so must be written in terms of
+        vectorized operations (e.g. "%x%['a'] > 2" for a structured array).
+
+        Args:
+            x (np.ndarray, list): Batch of message objects (e.g. the rows of
+                a structured array).
+
+        Returns:
+            np.ndarray: Boolean mask that is True for elements that will pass
+                through the filter.
+
+        Raises:
+            ValueError: If the statement does not produce a boolean mask
+                with an entry for each element in the batch.
+
+        """
+        if not (isinstance(x, np.ndarray) and (x.ndim > 0)):
+            return super(StatementFilter, self).evaluate_mask(x)
+        out = np.asarray(safe_eval(self._compiled, x=x))
+        if (out.dtype != bool) or (out.shape != x.shape[:1]):
+            raise ValueError(("Statement '%s' did not produce a boolean mask "
+                              "for the batch (dtype = %s, shape = %s).")
+                             % (self.statement, out.dtype, out.shape))
+        return out
 
     @classmethod
     def get_testing_options(cls):
@@ -49,8 +78,14 @@ class StatementFilter(FilterBase):
                 pass/fail for those keywords.
         
         """
+        arr = np.array([(1, 2.0), (2, 4.0), (3, 6.0)],
+                       dtype=[('a', 'i4'), ('b', 'f8')])
         out = [{'kwargs': {'statement': '%x% != 2'},
-                'pass': [1, 3], 'fail': [2]},
+                'pass': [1, 3], 'fail': [2],
+                'mask': [(np.arange(4), np.array([True, True, False, True]))]},
+               {'kwargs': {'statement': "%x%['a'] != 2"},
+                'pass': [arr[0], arr[2]], 'fail': [arr[1]],
+                'mask': [(arr, np.array([True, False, True]))]},
                {'kwargs': {'statement': '%x% != array([0, 0, 0])'},
                 'pass': [np.ones(3, int)], 'fail': [np.zeros(3, int)]},
                {'kwargs': {'statement': '%x% != add_units(1, "cm")'},
@@ -36,3 +36,16 @@ class TestFilterBase(YggTestClass):
                 self.assert_equal(inst(msg), False)
             for msg, err in x.get('error', []):
                 self.assert_raises(err, inst, msg)
+
+    def test_evaluate_mask(self):
+        r"""Test evaluating the filter for a batch of messages."""
+        for x in self.get_options():
+            inst = self.import_cls(**x.get('kwargs', {}))
+            msgs = x.get('pass', []) + x.get('fail', [])
+            if msgs:
+                self.assert_equal(
+                    inst.evaluate_mask(msgs).tolist(),
+                    ([True] * len(x.get('pass', []))
+                     + [False] * len(x.get('fail', []))))
+            for msg, mask in x.get('mask', []):
+                self.assert_equal(inst.evaluate_mask(msg), mask)
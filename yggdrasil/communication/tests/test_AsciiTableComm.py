@@ -3,7 +3,7 @@ import numpy as np
 import unittest
 from yggdrasil import units
 from yggdrasil.tests import assert_equal
-from yggdrasil.communication import AsciiTableComm
+from yggdrasil.communication import AsciiTableComm, new_comm
 from yggdrasil.communication.tests import test_AsciiFileComm as parent
 from yggdrasil.metaschema.properties.ScalarMetaschemaProperties import (
     data2dtype)
@@ -89,3 +89,22 @@ class TestAsciiTableComm_single(TestAsciiTableComm):
         r"""Test automated conversion of dictionary to pandas data frame."""
         self.do_send_recv(msg_send=self.testing_options['dict'],
                           msg_recv=self.testing_options['msg'])
+
+    def test_chunk_size(self):
+        r"""Test receiving rows from the table in chunks."""
+        for x in self.testing_options['send']:
+            assert(self.send_instance.send(x))
+        self.send_instance.close()
+        kwargs = self.inst_kwargs
+        kwargs['chunk_size'] = 3
+        recv_inst = new_comm('chunk%s' % self.uuid, **kwargs)
+        try:
+            arr = self.testing_options['recv'][0][0]
+            for i in range(0, len(arr), 3):
+                flag, msg_recv = recv_inst.recv()
+                assert(flag)
+                np.testing.assert_array_equal(msg_recv[0], arr[i:(i + 3)])
+            flag, msg_recv = recv_inst.recv()
+            assert(not flag)
+        finally:
+            self.remove_instance(recv_inst)
@@ -123,6 +123,18 @@ class TestFileComm(parent.TestCommBase):
                 contents = fd.read()
             self.assert_equal(contents, self.testing_options['contents'])
 
+    def test_send_multiple(self):
+        r"""Test sending multiple messages to the same file."""
+        for x in self.testing_options['send']:
+            flag = self.send_instance.send(x)
+            assert(flag)
+        self.recv_message_list(self.recv_instance,
+                               self.testing_options['recv'])
+        if self.testing_options.get('exact_contents', True):
+            with open(self.send_instance.address, 'rb') as fd:
+                contents = fd.read()
+            self.assert_equal(contents, self.testing_options['contents'])
+
     def test_series(self):
         r"""Test sending/receiving to/from a series of files."""
         # Set up series
@@ -170,3 +182,17 @@ class TestFileComm_readline(TestFileComm):
         out = super(TestFileComm_readline, self).testing_options
         out['recv'] = out['send']
         return out
+
+    def test_n_msg_recv_lines(self):
+        r"""Test counting lines as they are received and added to the file."""
+        for x in [b'Line 1\n', b'# Comment\n', b'Line 2\n']:
+            assert(self.send_instance.send(x))
+        self.assert_equal(self.recv_instance.n_msg_recv, 2)
+        flag, msg_recv = self.recv_instance.recv()
+        assert(flag)
+        self.assert_equal(msg_recv, b'Line 1\n')
+        self.assert_equal(self.recv_instance.n_msg_recv, 1)
+        assert(self.send_instance.send(b'Line 3'))
+        self.assert_equal(self.recv_instance.n_msg_recv, 2)
+        assert(self.send_instance.send(b'\n# Comment'))
+        self.assert_equal(self.recv_instance.n_msg_recv, 2)
@@ -0,0 +1,31 @@
+import numpy as np
+from yggdrasil.communication import new_comm
+from yggdrasil.communication.tests import test_FileComm as parent
+
+
+class TestNumpyFileComm(parent.TestFileComm):
+    r"""Test for NumpyFileComm communication class."""
+
+    comm = 'NumpyFileComm'
+
+    def test_chunk_size(self):
+        r"""Test receiving rows from the file in chunks."""
+        arr = np.arange(10, dtype='float64').reshape((5, 2))
+        assert(self.send_instance.send(arr))
+        kwargs = self.inst_kwargs
+        kwargs['chunk_size'] = 2
+        recv_inst = new_comm('chunk%s' % self.uuid, **kwargs)
+        try:
+            self.assert_equal(recv_inst.n_msg_recv, 3)
+            for i in range(0, 5, 2):
+                flag, msg_recv = recv_inst.recv()
+                assert(flag)
+                np.testing.assert_array_equal(msg_recv, arr[i:(i + 2)])
+            self.assert_equal(recv_inst.n_msg_recv, 0)
+            assert(self.send_instance.send(arr[:1]))
+            self.assert_equal(recv_inst.n_msg_recv, 1)
+            flag, msg_recv = recv_inst.recv()
+            assert(flag)
+            np.testing.assert_array_equal(msg_recv, arr[:1])
+        finally:
+            self.remove_instance(recv_inst)
@@ -65,6 +65,46 @@ class TestServerComm(test_CommBase.TestCommBase):
         assert(flag)
         self.assert_equal(msg_recv, self.test_msg)
 
+    def test_call_async(self):
+        r"""Test asynchronous RPC calls with responses retrieved out of order."""
+        msgs = self.testing_options['objects']
+        futures = [self.send_instance.call_async(m) for m in msgs]
+        self.assert_equal(len(self.send_instance.icomm_async), len(msgs))
+        for m in msgs:
+            flag, msg_recv = self.recv_instance.rpcRecv(timeout=self.timeout)
+            assert(flag)
+            self.assert_equal(msg_recv, m)
+            flag = self.recv_instance.rpcSend(msg_recv)
+            assert(flag)
+        for f, m in zip(futures[::-1], msgs[::-1]):
+            flag, msg_recv = f.result(timeout=self.timeout)
+            assert(flag)
+            assert(f.done())
+            self.assert_equal(msg_recv, m)
+        self.assert_equal(len(self.send_instance.icomm), 0)
+        self.assert_equal(len(self.send_instance.icomm_async), 0)
+
+    def test_call_many(self):
+        r"""Test pipelined RPC calls."""
+        msgs = self.testing_options['objects']
+        self.send_instance.sched_task(0.0, self.send_instance.call_many,
+                                      args=[msgs], store_output=True)
+        for m in msgs:
+            flag, msg_recv = self.recv_instance.rpcRecv(timeout=self.timeout)
+            assert(flag)
+            self.assert_equal(msg_recv, m)
+            flag = self.recv_instance.rpcSend(msg_recv)
+            assert(flag)
+        T = self.recv_instance.start_timeout()
+        while (not T.is_out) and (self.send_instance.sched_out is None):  # pragma: debug
+            self.recv_instance.sleep()
+        self.recv_instance.stop_timeout()
+        out = self.send_instance.sched_out
+        self.assert_equal(len(out), len(msgs))
+        for (flag, msg_recv), m in zip(out, msgs):
+            assert(flag)
+            self.assert_equal(msg_recv, m)
+
     def test_call_alias(self):
         r"""Test RPC call aliases."""
         # self.send_instance.sched_task(0.0, self.send_instance.rpcSend,
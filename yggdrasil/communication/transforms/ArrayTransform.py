@@ -1,6 +1,7 @@
 import numpy as np
 import copy
 import pandas
+from yggdrasil import units
 from yggdrasil.communication.transforms.TransformBase import TransformBase
 from yggdrasil.metaschema.datatypes import type2numpy
 from yggdrasil.serialize import (
@@ -10,11 +11,27 @@ from yggdrasil.metaschema.properties.ScalarMetaschemaProperties import (
 
 
 class ArrayTransform(TransformBase):
-    r"""Class for consolidating values into an array."""
+    r"""Class for consolidating values into an array.
+
+    Args:
+        field_names (list, optional): Names that should be used for the
+            fields in the resulting array.
+        field_units (list, optional): Units that the fields in the
+            resulting array should be converted to. Fields without units
+            in the original datatype or with an empty entry are not
+            converted.
+
+    """
     _transformtype = 'array'
     _schema_properties = {'field_names': {'type': 'array',
+                                          'items': {'type': 'string'}},
+                          'field_units': {'type': 'array',
                                           'items': {'type': 'string'}}}
 
+    def __init__(self, *args, **kwargs):
+        self.original_field_units = None
+        super(ArrayTransform, self).__init__(*args, **kwargs)
+
     def set_original_datatype(self, datatype):
         r"""Set datatype.
 
@@ -34,6 +51,26 @@ class ArrayTransform(TransformBase):
                                     enumerate(self.original_datatype['items'])]
             elif datatype['type'] == 'object':
                 self.field_names = list(datatype['properties'].keys())
+        self.original_field_units = self.get_field_units(
+            self.transform_datatype(datatype, convert_units=False))
+        if self.field_units:
+            self.transformed_datatype = self.transform_datatype(datatype)
+
+    @classmethod
+    def get_field_units(cls, datatype):
+        r"""Get the units for the fields in an array datatype.
+
+        Args:
+            datatype (dict): Array datatype.
+
+        Returns:
+            list: Units for each field, None if the datatype does not
+                describe fields.
+
+        """
+        if not isinstance(datatype.get('items', None), list):
+            return None
+        return [x.get('units', '') for x in datatype['items']]
 
     @classmethod
     def get_summary(cls, x, subtype=False):
@@ -271,12 +308,14 @@ class ArrayTransform(TransformBase):
                     x.pop('precision')
         return out
         
-    def transform_datatype(self, datatype):
+    def transform_datatype(self, datatype, convert_units=True):
         r"""Determine the datatype that will result from applying the transform
         to the supplied datatype.
 
         Args:
             datatype (dict): Datatype to transform.
+            convert_units (bool, optional): If True, field_units are applied
+                to the transformed fields. Defaults to True.
 
         Returns:
             dict: Transformed datatype.
@@ -299,6 +338,19 @@ class ArrayTransform(TransformBase):
             assert(len(self.field_names) == len(out['items']))
             for x, n in zip(out['items'], self.field_names):
                 x['title'] = n
+        if convert_units and self.field_units and ('items' in out):
+            assert(len(self.field_units) == len(out['items']))
+            for x, u in zip(out['items'], self.field_units):
+                if units.is_null_unit(u):
+                    continue
+                u0 = x.get('units', '')
+                if ((not units.is_null_unit(u0))
+                        and (x['subtype'] in ['int', 'uint'])
+                        and (not units.is_integral_conversion(
+                            *units.get_conversion_factor(u0, u)))):
+                    x['subtype'] = 'float'
+                    x['precision'] = 64
+                x['units'] = u
         return out
     
     def evaluate_transform(self, x, no_copy=False):
@@ -316,10 +368,12 @@ class ArrayTransform(TransformBase):
         """
         out = x
         np_dtype = type2numpy(self.transformed_datatype)
+        # Arrays are only copied if a copy is requested or the type changes,
+        # all other branches create a new array.
         if isinstance(x, pandas.DataFrame):
-            out = pandas2numpy(x).astype(np_dtype, copy=True)
+            out = pandas2numpy(x).astype(np_dtype, copy=False)
         elif isinstance(x, np.ndarray):
-            out = x.astype(np_dtype, copy=True)
+            out = x.astype(np_dtype, copy=(not no_copy))
         elif np_dtype and isinstance(x, (list, tuple, dict,
                                          np.ndarray)):
             if len(x) == 0:
@@ -332,8 +386,10 @@ class ArrayTransform(TransformBase):
             # warning?
             raise TypeError(("Cannot consolidate object of type %s "
                              "into a structured numpy array.") % type(x))
-        if not no_copy:
-            out = copy.deepcopy(out)
+        if self.field_units and self.original_field_units:
+            # One vectorized conversion for each field with new units
+            out = units.convert_fields(out, self.original_field_units,
+                                       self.field_units)
         return out
     
     @classmethod
@@ -405,6 +461,20 @@ class ArrayTransform(TransformBase):
         x[dtype.names[0]][0] = b'hello'
         y = [x[n] for n in dtype.names]
         x2 = np.zeros((length, length), dtype=dtype)
+        t_units = copy.deepcopy(t)
+        t_units['items'][1]['units'] = 'cm'
+        t_units['items'][2]['units'] = 'g'
+        t_units_out = copy.deepcopy(t_units)
+        t_units_out['items'][1].update(subtype='float', units='m')
+        t_units_out['items'][2]['units'] = 'kg'
+        dtype_units = np.dtype([(n, 'f8') if n == 'f1' else (n, dtype[n])
+                                for n in dtype.names])
+        x_units = x.copy()
+        x_units['f1'] = np.arange(length) * 250
+        x_units['f2'] = np.arange(length) * 1000.0
+        y_units = x_units.astype(dtype_units)
+        y_units['f1'] = np.arange(length) * 2.5
+        y_units['f2'] = np.arange(length)
         # y2 = [x2[n] for n in dtype2.names]
         return [{'kwargs': {'original_datatype': t},
                  'in/out': [(y, x),
@@ -443,6 +513,11 @@ class ArrayTransform(TransformBase):
                 {'kwargs': {'original_datatype': t_arr},
                  'in/out': [(x.tolist(), x)],
                  'in/out_t': [(t_arr, t)]},
+                {'kwargs': {'original_datatype': t_units,
+                            'field_units': ['', 'm', 'kg', '']},
+                 'in/out': [(x_units, y_units),
+                            ([x_units[n] for n in dtype.names], y_units)],
+                 'in/out_t': [(t_units, t_units_out)]},
                 {'kwargs': {'original_datatype': t},
                  'in/out': [(None, TypeError)]},
                 {'kwargs': {},
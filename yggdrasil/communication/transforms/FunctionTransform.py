@@ -1,3 +1,4 @@
+from yggdrasil.memoize import FunctionCache, _cache_schema
 from yggdrasil.communication.transforms.TransformBase import TransformBase
 
 
@@ -11,11 +12,30 @@ class FunctionTransform(TransformBase):
             "<function file>" is the module or Python file containing the function
             and "<function name>" is the name of the function. The function should
             take the message as input and return the transformed message.
+        cache (dict, optional): If provided, the results of the function are
+            cached for messages that have already been seen (see
+            yggdrasil.memoize.FunctionCache for options). This should only be
+            used for pure functions. Defaults to None.
 
     """
     _transformtype = 'function'
     _schema_required = ['function']
-    _schema_properties = {'function': {'type': 'function'}}
+    _schema_properties = {'function': {'type': 'function'},
+                          'cache': _cache_schema}
+
+    def __init__(self, *args, **kwargs):
+        super(FunctionTransform, self).__init__(*args, **kwargs)
+        self._function_cache = None
+        if self.cache:
+            self._function_cache = FunctionCache(self.function, **self.cache)
+
+    @property
+    def cache_status(self):
+        r"""str: Summary of the function cache usage. None if results are
+        not cached."""
+        if self._function_cache is None:
+            return None
+        return self._function_cache.status
 
     def evaluate_transform(self, x, no_copy=False):
         r"""Call transform on the provided message.
@@ -30,6 +50,8 @@ class FunctionTransform(TransformBase):
             object: The transformed message.
 
         """
+        if self._function_cache is not None:
+            return self._function_cache(x)
         return self.function(x)
     
     @classmethod
@@ -60,4 +82,6 @@ class FunctionTransform(TransformBase):
                        'items': [
                            {'type': 'int', 'title': x,
                             'precision': 64, 'units': ''}
-                           for x in 'abc']})]}]
+                           for x in 'abc']})]},
+                {'kwargs': {'function': ftran, 'cache': {'size': 1}},
+                 'in/out': [(1, 1), (2, 8), (2, 8), (1, 1)]}]
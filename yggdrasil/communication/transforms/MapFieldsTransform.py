@@ -16,6 +16,7 @@ class MapFieldsTransform(TransformBase):
     _schema_required = ['map']
     _schema_properties = {'map': {'type': 'object',
                                   'additionalProperties': {'type': 'string'}}}
+    modifies_input = True
 
     def transform_datatype(self, datatype):
         r"""Determine the datatype that will result from applying the transform
@@ -62,12 +63,18 @@ class MapFieldsTransform(TransformBase):
         elif isinstance(x, (list, tuple)):
             pass
         elif isinstance(x, np.ndarray):
-            if not no_copy:
-                out = copy.deepcopy(x)
+            # Fields are renamed in a view with a new dtype so that the
+            # dtype of the original array is not altered
             new_names = list(x.dtype.names)
             for kold, knew in self.map.items():
                 new_names[new_names.index(kold)] = knew
-            out.dtype.names = new_names
+            fields = [x.dtype.fields[k] for k in x.dtype.names]
+            out = x.view(np.dtype({'names': new_names,
+                                   'formats': [f[0] for f in fields],
+                                   'offsets': [f[1] for f in fields],
+                                   'itemsize': x.dtype.itemsize}))
+            if not no_copy:
+                out = out.copy()
         else:
             raise TypeError("Cannot map fields from object of type '%s'" % type(x))
         return out
@@ -135,10 +135,14 @@ class SelectFieldsTransform(TransformBase):
                 out = type(x)([x[self.original_order.index(k)]
                                for k in self.selected])
         elif isinstance(x, (np.ndarray, pandas.DataFrame)):
+            # Field selection returns views into numpy arrays
             if self.as_single:
                 out = x[self.selected[0]]
             else:
                 out = x[self.selected]
+            if not no_copy:
+                out = out.copy()
+            return out
         else:
             raise TypeError("Cannot select fields from object of type '%s'" % type(x))
         if not no_copy:
@@ -1,6 +1,6 @@
 import numpy as np
 from yggdrasil import units
-from yggdrasil.tools import safe_eval
+from yggdrasil.tools import safe_eval, compile_statement
 from yggdrasil.communication.transforms.TransformBase import TransformBase
 
 
@@ -26,6 +26,7 @@ class StatementTransform(TransformBase):
     def __init__(self, *args, **kwargs):
         super(StatementTransform, self).__init__(*args, **kwargs)
         self.statement = self.statement.replace('%x%', 'x')
+        self._compiled = compile_statement(self.statement)
 
     def evaluate_transform(self, x, no_copy=False):
         r"""Call transform on the provided message.
@@ -40,7 +41,25 @@ class StatementTransform(TransformBase):
             bool: True if the message will pass through the transform, False otherwise.
 
         """
-        return safe_eval(self.statement, x=x)
+        return safe_eval(self._compiled, x=x)
+
+    def evaluate_batch(self, x):
+        r"""Call transform on each element in a batch of messages. If the
+        batch is a numpy array, the statement is evaluated once with "%x%"
+        set to the entire array and so must be written in terms of
+        vectorized operations (e.g. "%x%['a'] * 2" for a structured array).
+
+        Args:
+            x (np.ndarray, list): Batch of message objects (e.g. the rows of
+                a structured array).
+
+        Returns:
+            np.ndarray, list: Transformed messages.
+
+        """
+        if not (isinstance(x, np.ndarray) and (x.ndim > 0)):
+            return super(StatementTransform, self).evaluate_batch(x)
+        return safe_eval(self._compiled, x=x)
 
     @classmethod
     def get_testing_options(cls):
@@ -52,8 +71,14 @@ class StatementTransform(TransformBase):
                 keywords.
         
         """
+        arr = np.array([(1, 2.0), (2, 4.0), (3, 6.0)],
+                       dtype=[('a', 'i4'), ('b', 'f8')])
         out = [{'kwargs': {'statement': '%x%**3'},
-                'in/out': [(1, 1), (2, 8)]},
+                'in/out': [(1, 1), (2, 8)],
+                'batch': [(np.arange(3), np.array([0, 1, 8])),
+                          ([1, 2], [1, 8])]},
+               {'kwargs': {'statement': "%x%['a'] * %x%['b']"},
+                'batch': [(arr, np.array([2.0, 8.0, 18.0]))]},
                {'kwargs': {'statement': '%x% * array([1, 1, 1])'},
                 'in/out': [(1, np.ones(3, int)), (2, 2 * np.ones(3, int))]},
                {'kwargs': {'statement': '%x% * '
@@ -11,6 +11,11 @@ class TransformBase(ComponentBase):
         original_datatype (dict, optional): Datatype associated with expected
             messages. Defaults to None.
 
+    Class Attributes:
+        modifies_input (bool): True if the transform alters messages in place
+            when it is called with no_copy=True. Transforms that do not modify
+            their input can be evaluated without making a copy of the message.
+
     """
 
     _transformtype = None
@@ -18,6 +23,7 @@ class TransformBase(ComponentBase):
     _schema_subtype_key = 'transformtype'
     _schema_properties = {'initial_state': {'type': 'object'},
                           'original_datatype': {'type': 'schema'}}
+    modifies_input = False
 
     def __init__(self, *args, **kwargs):
         self._state = {}
@@ -112,6 +118,19 @@ class TransformBase(ComponentBase):
         out = self.evaluate_transform(x, no_copy=no_copy)
         return out
 
+    def evaluate_batch(self, x):
+        r"""Call transform on each element in a batch of messages.
+
+        Args:
+            x (np.ndarray, list): Batch of message objects (e.g. the rows of
+                a structured array).
+
+        Returns:
+            list: Transformed messages.
+
+        """
+        return [self(ix) for ix in x]
+
     @classmethod
     def get_testing_options(cls):
         r"""Get testing options for the transform class.
@@ -1,3 +1,4 @@
+import copy
 import pprint
 from yggdrasil.tests import YggTestClass
 
@@ -45,6 +46,25 @@ class TestTransformBase(YggTestClass):
                             pprint.pprint(x)
                         raise
 
+    def test_transform_no_copy(self):
+        r"""Test transform without copying the message."""
+        for x in self.get_options():
+            inst = self.import_cls(**x.get('kwargs', {}))
+            for msg_in, msg_exp in x.get('in/out', []):
+                if isinstance(msg_exp, type(BaseException)):
+                    continue
+                msg_orig = copy.deepcopy(msg_in)
+                self.assert_equal(inst(msg_in, no_copy=True), msg_exp)
+                if not inst.modifies_input:
+                    self.assert_equal(msg_in, msg_orig)
+
+    def test_evaluate_batch(self):
+        r"""Test transforming a batch of messages."""
+        for x in self.get_options():
+            inst = self.import_cls(**x.get('kwargs', {}))
+            for msg_in, msg_exp in x.get('batch', []):
+                self.assert_equal(inst.evaluate_batch(msg_in), msg_exp)
+
     def test_transform_type(self):
         r"""Test transform_type."""
         for x in self.get_options():
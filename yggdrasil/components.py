@@ -2,7 +2,10 @@ import os
 import glob
 import copy
 import six
+import json
+import hashlib
 import importlib
+import threading
 # import warnings
 from collections import OrderedDict
 from yggdrasil.doctools import docs2args
@@ -35,6 +38,10 @@ _comptype2mod = {'serializer': 'serialize',
 # 'compiler': 'drivers',
 # 'linker': 'drivers',
 # 'archiver': 'drivers'}
+_manifest_fname = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '.ygg_components.json'))
+_manifest_version = 1
+_manifest = None
 
 
 def init_registry():
@@ -128,6 +135,148 @@ def import_all_components(comptype):
                                     % (mod, xbase))
 
 
+def get_schema_hash():
+    r"""Get a hash of the schema file that the component manifest is
+    generated alongside so that a stale manifest can be identified.
+
+    Returns:
+        str: Hex digest of the schema file contents. None is returned if
+            the schema file does not exist.
+
+    """
+    from yggdrasil.schema import _schema_fname
+    if not os.path.isfile(_schema_fname):
+        return None
+    with open(_schema_fname, 'rb') as fd:
+        return hashlib.sha1(fd.read()).hexdigest()
+
+
+def create_manifest():
+    r"""Create a manifest of the registered components by importing all of
+    the component modules. For each component type, the manifest contains
+    the subtype key, the default subtype, the base class, a mapping from
+    subtype to class name, and the module and schema properties for each
+    class.
+
+    Returns:
+        dict: Component manifest.
+
+    """
+    from yggdrasil.schema import get_schema
+    s = get_schema()
+    registry = init_registry()
+    out = {'version': _manifest_version,
+           'schema_hash': get_schema_hash(),
+           'components': {}}
+    for comptype, classes in registry.items():
+        icomp = s.get(comptype, None)
+        if icomp is None:  # pragma: debug
+            continue
+        out['components'][comptype] = {
+            'subtype_key': icomp.subtype_key,
+            'default_subtype': icomp.default_subtype,
+            'base_class': _registry_base_classes[comptype],
+            'subtypes': {k: v for k, v in icomp.subtype2class.items()
+                         if k is not None},
+            'classes': {
+                k: {'module': v.__module__,
+                    'properties': icomp.get_subtype_properties(k)}
+                for k, v in classes.items() if k in icomp.class2subtype}}
+    return out
+
+
+def load_manifest(fname=None):
+    r"""Load the component manifest from a file. If the file dosn't exist
+    or was generated for a different schema, it is created.
+
+    Args:
+        fname (str, optional): Full path to the file that the manifest
+            should be loaded from. Defaults to _manifest_fname.
+
+    Returns:
+        dict: Component manifest.
+
+    """
+    if fname is None:
+        fname = _manifest_fname
+    out = None
+    if os.path.isfile(fname):
+        try:
+            with open(fname, 'r') as fd:
+                out = json.load(fd)
+        except (OSError, ValueError):
+            # Treat unreadable/corrupted manifests as stale
+            out = None
+        if ((not isinstance(out, dict))
+                or (out.get('version', None) != _manifest_version)
+                or (out.get('schema_hash', None) != get_schema_hash())):
+            out = None
+    if out is None:
+        out = create_manifest()
+        # Write to a temporary file that is moved into place so that
+        # concurrent processes never read a partially written manifest
+        tmp = '%s.%d.%d' % (fname, os.getpid(), threading.get_ident())
+        try:
+            with open(tmp, 'w') as fd:
+                json.dump(out, fd, indent=2, sort_keys=True)
+                fd.write('\n')
+            os.replace(tmp, fname)
+        except OSError:  # pragma: debug
+            # The manifest can still be used from memory if the package
+            # directory is read-only
+            if os.path.isfile(tmp):
+                os.remove(tmp)
+    return out
+
+
+def clear_manifest():
+    r"""Clear the global component manifest."""
+    global _manifest
+    _manifest = None
+
+
+def get_manifest(comptype=None):
+    r"""Return the component manifest, loading it the first time it is
+    needed.
+
+    Args:
+        comptype (str, optional): Component type that the manifest entry
+            should be returned for. Defaults to None and the manifest for
+            all component types is returned.
+
+    Returns:
+        dict: Component manifest. If comptype is provided and is not in
+            the manifest, None is returned.
+
+    """
+    global _manifest
+    if _manifest is None:
+        _manifest = load_manifest()
+    if comptype is None:
+        return _manifest['components']
+    return _manifest['components'].get(comptype, None)
+
+
+def get_component_properties(comptype, subtype):
+    r"""Get the names of the schema properties for a component subtype from
+    the manifest without loading the schema.
+
+    Args:
+        comptype (str): Component type.
+        subtype (str): Component subtype or class name.
+
+    Returns:
+        list: Property names. None is returned if the subtype is not in
+            the manifest.
+
+    """
+    info = get_manifest(comptype)
+    if info is None:
+        return None
+    class_name = info['subtypes'].get(subtype, subtype)
+    return info['classes'].get(class_name, {}).get('properties', None)
+
+
 def import_component(comptype, subtype=None, without_schema=False,
                      **kwargs):
     r"""Dynamically import a component by name.
@@ -179,24 +328,27 @@ def import_component(comptype, subtype=None, without_schema=False,
     elif subtype in _registry_class2subtype.get(comptype, {}):
         out_cls = _registry[comptype][_registry_class2subtype[comptype][subtype]]
     else:
+        # Use the manifest to locate the module so that only the module
+        # containing the component is imported
+        info = get_manifest(comptype)
         # Get class name
         if without_schema:
             if subtype is None:  # pragma: debug
                 raise ValueError("subtype must be provided if without_schema is True.")
             class_name = subtype
+            if (info is not None) and (subtype not in info['classes']):
+                class_name = info['subtypes'].get(subtype, subtype)
         else:
-            from yggdrasil.schema import get_schema
-            s = get_schema().get(comptype, None)
-            if s is None:  # pragma: debug
+            if info is None:  # pragma: debug
                 raise ValueError("Unrecognized component type: %s" % comptype)
             if subtype is None:  # pragma: no cover
                 # This will only be called if the test is run before the component
                 # module is imported
-                subtype = s.default_subtype
-            if subtype in s.class2subtype:
+                subtype = info['default_subtype']
+            if subtype in info['classes']:
                 class_name = subtype
             else:
-                class_name = s.subtype2class.get(subtype, None)
+                class_name = info['subtypes'].get(subtype, None)
                 if class_name is None:
                     # Attempt file since they are subclass of comm
                     if (comptype == 'comm'):
@@ -206,8 +358,11 @@ def import_component(comptype, subtype=None, without_schema=False,
                             pass
                     raise ValueError("Unrecognized %s subtype: %s"
                                      % (comptype, subtype))
+        mod_name = 'yggdrasil.%s.%s' % (mod, class_name)
+        if (info is not None) and (class_name in info['classes']):
+            mod_name = info['classes'][class_name]['module']
         try:
-            out_mod = importlib.import_module('yggdrasil.%s.%s' % (mod, class_name))
+            out_mod = importlib.import_module(mod_name)
         except ImportError:  # pragma: debug
             import_all_components(comptype)
             return import_component(comptype, subtype=subtype,
@@ -278,6 +433,8 @@ def get_component_base_class(comptype, subtype=None, without_schema=False,
     """
     if comptype in _registry_base_classes:
         base_class_name = _registry_base_classes[comptype]
+    elif get_manifest(comptype) is not None:
+        base_class_name = get_manifest(comptype)['base_class']
     else:
         default_class = import_component(comptype, subtype=subtype,
                                          without_schema=without_schema,
@@ -552,8 +709,13 @@ class ComponentBase(object):
             if v.get('type', None) == 'array':
                 if isinstance(kwargs.get(k, None), (bytes, str)):
                     kwargs[k] = kwargs[k].split()
-        # Parse keyword arguments using schema
-        if (comptype is not None) and (subtype is not None):
+        # Parse keyword arguments using schema, using the properties in the
+        # manifest if validation is not required
+        props = None
+        if ((skip_component_schema_normalization and (comptype is not None)
+             and (subtype is not None))):
+            props = get_component_properties(comptype, subtype)
+        if (props is None) and (comptype is not None) and (subtype is not None):
             from yggdrasil.schema import get_schema
             s = get_schema().get_component_schema(
                 comptype, subtype, relaxed=True,
@@ -577,7 +739,7 @@ class ComponentBase(object):
                 # kwargs.update(kwargs_comp)
                 # print('normalized')
                 # pprint.pprint(kwargs_comp)
-        else:
+        elif props is None:
             props = self._schema_properties.keys()
         # Set attributes based on properties
         for k in props:
@@ -26,14 +26,23 @@ logger = logging.getLogger(__name__)
 
 
 class YggConfigParser(configparser.ConfigParser, object):
-    r"""Config parser that returns None if option not provided on get."""
+    r"""Config parser that returns None if option not provided on get.
+
+    Attributes:
+        revision (int): Counter that is incremented each time the options
+            are modified so that values derived from the options can be
+            cached.
+
+    """
 
     def __init__(self, files=None):
         self.files = files
+        self.revision = 0
         super(YggConfigParser, self).__init__()
 
     def reload(self):
         r"""Reload parameters from the original files."""
+        self.revision += 1
         self._sections = self._dict()
         if self.files is not None:
             self.read(self.files)
@@ -98,8 +107,19 @@ class YggConfigParser(configparser.ConfigParser, object):
         """Set an option."""
         if not isinstance(value, str):
             value = json.dumps(value)
+        self.revision += 1
         super(YggConfigParser, self).set(section, option, value=value)
 
+    def remove_option(self, section, option):
+        r"""Remove an option."""
+        self.revision += 1
+        return super(YggConfigParser, self).remove_option(section, option)
+
+    def remove_section(self, section):
+        r"""Remove a section."""
+        self.revision += 1
+        return super(YggConfigParser, self).remove_section(section)
+
     def backwards_str2val(self, val):  # pragma: no cover
         try:
             out = json.loads(val)
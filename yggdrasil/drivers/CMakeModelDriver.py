@@ -521,6 +521,7 @@ class CMakeBuilder(LinkerBase):
                                 ('target', '--target'),
                                 ('configuration', '--config')])
     executable_ext = ''
+    build_cache = False
 
     @classmethod
     def call(cls, *args, **kwargs):
@@ -76,6 +76,7 @@ class CCompilerBase(CompilerBase):
     search_regex_end = 'End of search list.'
     search_regex = [r'(?:#include <...> search starts here:)|'
                     r'(?: ([^\n]+?)(?: \(framework directory\))?)\n']
+    include_regex = r'^\s*#\s*include\s*[<"]([^>"]+)[>"]'
 
     @staticmethod
     def before_registration(cls):
@@ -1,10 +1,17 @@
 import os
 import re
 import six
+import glob
 import copy
+import json
+import shutil
+import hashlib
+import uuid
 import logging
 import warnings
+import threading
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from collections import OrderedDict
 from yggdrasil import platform, tools, scanf
 from yggdrasil.drivers.ModelDriver import ModelDriver, remove_products
@@ -23,6 +30,13 @@ if _conda_prefix is not None:
     _system_suffix += '_' + os.path.basename(_conda_prefix)
 if _venv_prefix is not None:
     _system_suffix += '_' + os.path.basename(_venv_prefix)
+_build_cache_version = 1
+_build_cache_size = 1024
+_file_hashes = {}
+_tool_versions = {}
+_build_locks = {}
+_build_locks_lock = threading.Lock()
+_build_semaphore = (None, None)
 
 
 def get_compilation_tool_registry(tooltype):
@@ -123,6 +137,224 @@ def get_compilation_tool(tooltype, name, default=False):
     return default
 
 
+def get_build_cache_dir(cfg=None):
+    r"""Get the directory where compilation products are cached so that
+    they can be reused by later builds with the same inputs.
+
+    Args:
+        cfg (:class:`yggdrasil.config.YggConfigParser`, optional):
+            Config parser with the 'build' options that should be used.
+            Defaults to :data:`yggdrasil.config.ygg_cfg`.
+
+    Returns:
+        str: Full path to the cache directory. None is returned if the
+            build cache is disabled.
+
+    """
+    from yggdrasil import config
+    if cfg is None:
+        cfg = config.ygg_cfg
+    if str(cfg.get('build', 'cache', 'True')).lower() in ['false', '0']:
+        return None
+    return os.path.expanduser(cfg.get(
+        'build', 'cache_dir', os.path.join(config.usr_dir, '.ygg_build_cache')))
+
+
+def get_build_cache_size(cfg=None):
+    r"""Get the maximum size of the build cache.
+
+    Args:
+        cfg (:class:`yggdrasil.config.YggConfigParser`, optional):
+            Config parser with the 'build' options that should be used.
+            Defaults to :data:`yggdrasil.config.ygg_cfg`.
+
+    Returns:
+        int: Maximum size of the build cache in bytes. 0 indicates that
+            the size is not limited.
+
+    """
+    from yggdrasil import config
+    if cfg is None:
+        cfg = config.ygg_cfg
+    try:
+        out = float(cfg.get('build', 'cache_size', _build_cache_size))
+    except ValueError:  # pragma: debug
+        logger.warning("Invalid value for build cache_size option: %s"
+                       % cfg.get('build', 'cache_size'))
+        out = _build_cache_size
+    return max(int(out * 1024 * 1024), 0)
+
+
+def prune_build_cache(max_size=None, cfg=None):
+    r"""Remove the least recently used entries from the build cache until
+    it is smaller than the maximum size.
+
+    Args:
+        max_size (int, optional): Maximum size of the cache in bytes.
+            Defaults to get_build_cache_size.
+        cfg (:class:`yggdrasil.config.YggConfigParser`, optional):
+            Config parser with the 'build' options that should be used.
+            Defaults to :data:`yggdrasil.config.ygg_cfg`.
+
+    Returns:
+        list: Entries that were removed.
+
+    """
+    cache_dir = get_build_cache_dir(cfg=cfg)
+    if max_size is None:
+        max_size = get_build_cache_size(cfg=cfg)
+    if (not cache_dir) or (not max_size) or (not os.path.isdir(cache_dir)):
+        return []
+    entries = []
+    total = 0
+    for prefix in os.listdir(cache_dir):
+        for entry in glob.glob(os.path.join(cache_dir, prefix, '*')):
+            manifest = os.path.join(entry, 'manifest.json')
+            if not os.path.isfile(manifest):
+                # Entries are renamed into place once complete
+                continue
+            size = 0
+            for root, dirs, files in os.walk(entry):
+                size += sum(os.path.getsize(os.path.join(root, x))
+                            for x in files)
+            entries.append((os.path.getmtime(manifest), size, entry))
+            total += size
+    removed = []
+    for _, size, entry in sorted(entries):
+        if total <= max_size:
+            break
+        shutil.rmtree(entry, ignore_errors=True)
+        removed.append(entry)
+        total -= size
+    if removed:
+        logger.debug("Removed %d entries from the build cache"
+                     % len(removed))
+    return removed
+
+
+def clear_build_cache(cfg=None):
+    r"""Remove all entries from the build cache.
+
+    Args:
+        cfg (:class:`yggdrasil.config.YggConfigParser`, optional):
+            Config parser with the 'build' options that should be used.
+            Defaults to :data:`yggdrasil.config.ygg_cfg`.
+
+    """
+    cache_dir = get_build_cache_dir(cfg=cfg)
+    if cache_dir and os.path.isdir(cache_dir):
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def get_build_jobs(cfg=None):
+    r"""Get the maximum number of compilation processes that should be run
+    at the same time.
+
+    Args:
+        cfg (:class:`yggdrasil.config.YggConfigParser`, optional):
+            Config parser with the 'build' options that should be used.
+            Defaults to :data:`yggdrasil.config.ygg_cfg`.
+
+    Returns:
+        int: Maximum number of concurrent compilation processes. Defaults
+            to the number of CPUs if the 'jobs' option is not set.
+
+    """
+    from yggdrasil import config
+    if cfg is None:
+        cfg = config.ygg_cfg
+    try:
+        out = int(cfg.get('build', 'jobs', 0))
+    except ValueError:  # pragma: debug
+        logger.warning("Invalid value for build jobs option: %s"
+                       % cfg.get('build', 'jobs'))
+        out = 0
+    if out <= 0:
+        out = os.cpu_count() or 1
+    return out
+
+
+def get_build_semaphore():
+    r"""Get the semaphore limiting the number of compilation processes that
+    run at the same time (see get_build_jobs).
+
+    Returns:
+        threading.BoundedSemaphore: Semaphore for compilation processes.
+
+    """
+    global _build_semaphore
+    njobs = get_build_jobs()
+    with _build_locks_lock:
+        if _build_semaphore[0] != njobs:
+            _build_semaphore = (njobs, threading.BoundedSemaphore(njobs))
+        return _build_semaphore[1]
+
+
+def get_build_lock(key):
+    r"""Get the lock that should be held while building a product that can
+    be shared by several builds (e.g. internal libraries).
+
+    Args:
+        key (str): Full path to the product.
+
+    Returns:
+        threading.RLock: Lock for the product.
+
+    """
+    key = os.path.normcase(os.path.abspath(key))
+    with _build_locks_lock:
+        if key not in _build_locks:
+            _build_locks[key] = threading.RLock()
+        return _build_locks[key]
+
+
+def run_build_jobs(function, args_list):
+    r"""Call a function for several sets of arguments at the same time.
+    Compilation processes started by the calls are limited by
+    get_build_semaphore.
+
+    Args:
+        function (callable): Function that should be called.
+        args_list (list): Tuples of arguments that the function should be
+            called with.
+
+    Returns:
+        list: Results of each call in the same order as args_list.
+
+    """
+    njobs = min(get_build_jobs(), len(args_list))
+    if njobs <= 1:
+        return [function(*args) for args in args_list]
+    with ThreadPoolExecutor(max_workers=njobs) as executor:
+        futures = [executor.submit(function, *args) for args in args_list]
+        return [x.result() for x in futures]
+
+
+def get_file_hash(fname):
+    r"""Get a hash of a file's contents. Hashes are reused until the file's
+    modification time or size changes.
+
+    Args:
+        fname (str): Full path to the file.
+
+    Returns:
+        str: Hex digest of the file's contents.
+
+    """
+    st = os.stat(fname)
+    stamp = (st.st_mtime_ns, st.st_size)
+    prev = _file_hashes.get(fname, None)
+    if (prev is not None) and (prev[0] == stamp):
+        return prev[1]
+    h = hashlib.sha1()
+    with open(fname, 'rb') as fd:
+        for chunk in iter(lambda: fd.read(1 << 20), b''):
+            h.update(chunk)
+    out = h.hexdigest()
+    _file_hashes[fname] = (stamp, out)
+    return out
+
+
 # TODO: Cannot currently make compilation tools components because
 # of circular imports
 class CompilationToolMeta(type):
@@ -235,6 +467,15 @@ class CompilationToolBase(object):
         remove_product_exts (list): List of extensions or directories matching
             entries in product_exts and product_files that should be removed
             during cleanup. Be careful when adding files to this list.
+        build_cache (bool): If True, the products of calls to the tool are
+            stored in the build cache (see get_build_cache_dir) under a hash
+            of the tool, command, input file contents, and environment so
+            that they can be reused by calls with the same inputs. This
+            should be False for tools whose inputs cannot be determined from
+            the command (e.g. build tools like make).
+        build_cache_env (list): Environment variables that can change the
+            products of the tool and should be included in the build cache
+            key.
 
     """
 
@@ -268,6 +509,10 @@ class CompilationToolBase(object):
     product_files = []
     source_product_exts = []
     remove_product_exts = []
+    build_cache = True
+    build_cache_env = ['CPATH', 'C_INCLUDE_PATH', 'CPLUS_INCLUDE_PATH',
+                       'LIBRARY_PATH', 'INCLUDE', 'LIB', 'SDKROOT',
+                       'CONDA_BUILD_SYSROOT', 'MACOSX_DEPLOYMENT_TARGET']
 
     _language_ext = None  # only update once per class
     
@@ -488,6 +733,7 @@ class CompilationToolBase(object):
         return out
 
     @classmethod
+    @tools.discovery_cache(executable='get_executable')
     def is_installed(cls):
         r"""Determine if this tool is installed by looking for the executable.
 
@@ -606,6 +852,7 @@ class CompilationToolBase(object):
         return tools.get_env_prefixes()
             
     @classmethod
+    @tools.discovery_cache(executable='get_executable')
     def get_search_path(cls, env_only=False):
         r"""Determine the paths searched by the tool for external library files.
 
@@ -779,6 +1026,225 @@ class CompilationToolBase(object):
                 if isrc in products:  # pragma: debug
                     products.remove(isrc)
 
+    @classmethod
+    @tools.discovery_cache(executable='get_executable')
+    def get_tool_version(cls):
+        r"""Determine the version of the tool executable. The result is
+        cached for each executable.
+
+        Returns:
+            str: Output from calling the tool with version_flags.
+
+        """
+        exe = cls.get_executable()
+        if exe not in _tool_versions:
+            _tool_versions[exe] = cls.call(cls.version_flags, skip_flags=True,
+                                           allow_error=True)
+        return _tool_versions[exe]
+
+    @classmethod
+    def get_flag_values(cls, cmd, key):
+        r"""Get the values passed to a flag in a command.
+
+        Args:
+            cmd (list): Command line arguments.
+            key (str): Key in flag_options for the flag.
+
+        Returns:
+            list: Values passed with the flag.
+
+        """
+        flag = cls.flag_options.get(key, None)
+        if isinstance(flag, dict):
+            flag = flag['key']
+        out = []
+        if not flag:
+            return out
+        if '%s' in flag:
+            prefix, suffix = flag.split('%s', 1)
+            for x in cmd:
+                if (((len(x) > len(prefix) + len(suffix)) and x.startswith(prefix)
+                     and x.endswith(suffix))):
+                    out.append(x[len(prefix):(len(x) - len(suffix))])
+        else:
+            for x, y in zip(cmd[:-1], cmd[1:]):
+                if x == flag:
+                    out.append(y)
+        return out
+
+    @classmethod
+    def get_build_dependencies(cls, cmd, working_dir=None):
+        r"""Get files that are used by a call to the tool, but are not part
+        of the command (e.g. included headers).
+
+        Args:
+            cmd (list): Command line arguments for the call.
+            working_dir (str, optional): Working directory that the call will
+                be made from. Defaults to None and the current working
+                directory is used.
+
+        Returns:
+            list: Pairs of the name used to refer to each file (e.g. in an
+                include statement) and the full path to the file.
+
+        """
+        return []
+
+    @classmethod
+    def get_build_cache_key(cls, cmd, out, env=None, working_dir=None,
+                            build_library=False):
+        r"""Get the key that identifies the products of a call to the tool in
+        the build cache. Files in the command (e.g. sources and objects)
+        and dependencies are identified by their contents so that the
+        products can be shared by identical calls in different directories.
+
+        Args:
+            cmd (list): Command line arguments for the call.
+            out (str): Full path to the output file that will be created.
+            env (dict, optional): Environment variables that the call will be
+                made with. Defaults to os.environ.
+            working_dir (str, optional): Working directory that the call will
+                be made from. Defaults to None and the current working
+                directory is used.
+            build_library (bool, optional): If True, a library is being built.
+                The path to libraries is recorded by some linkers so the
+                full path to the output is included in the key. Defaults to
+                False.
+
+        Returns:
+            str: Build cache key. None is returned if the tool does not
+                use the build cache or it is disabled.
+
+        """
+        if not (cls.build_cache and get_build_cache_dir()):
+            return None
+        if env is None:
+            env = os.environ
+        if working_dir is None:
+            working_dir = os.getcwd()
+        try:
+            key = [_build_cache_version, cls.tooltype, cls.toolname,
+                   shutil.which(cmd[0]) or cmd[0], cls.get_tool_version()]
+            for x in cmd[1:]:
+                fname = os.path.join(working_dir, x)
+                if (not build_library) and (out in x):
+                    key.append(x.replace(out, '<out>'))
+                elif os.path.isfile(fname):
+                    key.append('file:%s:%s' % (os.path.basename(x),
+                                               get_file_hash(fname)))
+                else:
+                    key.append(x)
+            for name, fname in cls.get_build_dependencies(
+                    cmd, working_dir=working_dir):
+                key.append('dep:%s:%s' % (name, get_file_hash(fname)))
+            for k in cls.build_cache_env:
+                key.append('env:%s=%s' % (k, env.get(k, '')))
+        except OSError as e:  # pragma: debug
+            logger.debug("Could not create build cache key: %s" % e)
+            return None
+        return hashlib.sha1(json.dumps(key).encode('utf-8')).hexdigest()
+
+    @classmethod
+    def get_build_cache_entry(cls, key):
+        r"""Get the directory where the products for a build cache key are
+        stored.
+
+        Args:
+            key (str): Build cache key.
+
+        Returns:
+            str: Full path to the directory for the entry.
+
+        """
+        return os.path.join(get_build_cache_dir(), key[:2], key)
+
+    @classmethod
+    def store_in_build_cache(cls, key, args, out):
+        r"""Store the products of a call to the tool in the build cache.
+
+        Args:
+            key (str): Build cache key.
+            args (list): Input arguments to the call (usually one or more
+                source files).
+            out (str): Full path to the primary product of the call.
+
+        """
+        entry = cls.get_build_cache_entry(key)
+        if os.path.isdir(entry):
+            return
+        base = os.path.splitext(out)[0]
+        products = [('', out)]
+        for ext in cls.product_exts:
+            inew = base + ext
+            if (inew not in args) and (inew != out) and os.path.exists(inew):
+                products.append((ext, inew))
+        tmp = '%s.%s' % (entry, uuid.uuid4().hex)
+        try:
+            os.makedirs(tmp)
+            manifest = {}
+            for i, (ext, src) in enumerate(products):
+                dst = os.path.join(tmp, 'product%d' % i)
+                if os.path.isdir(src):
+                    shutil.copytree(src, dst)
+                else:
+                    shutil.copy(src, dst)
+                manifest['product%d' % i] = ext
+            with open(os.path.join(tmp, 'manifest.json'), 'w') as fd:
+                json.dump(manifest, fd)
+            os.rename(tmp, entry)
+            logger.debug("Stored %s in the build cache (%s)" % (out, key))
+            prune_build_cache()
+        except OSError as e:
+            # Another process may have stored the same entry
+            logger.debug("Could not store %s in the build cache: %s"
+                         % (out, e))
+        finally:
+            if os.path.isdir(tmp):
+                shutil.rmtree(tmp)
+
+    @classmethod
+    def restore_from_build_cache(cls, key, out):
+        r"""Copy the products for a call to the tool from the build cache.
+
+        Args:
+            key (str): Build cache key.
+            out (str): Full path to the primary product that should be
+                created.
+
+        Returns:
+            bool: True if the products were restored, False if they are not
+                in the cache.
+
+        """
+        entry = cls.get_build_cache_entry(key)
+        try:
+            with open(os.path.join(entry, 'manifest.json'), 'r') as fd:
+                manifest = json.load(fd)
+        except (OSError, ValueError):
+            return False
+        base = os.path.splitext(out)[0]
+        try:
+            for name, ext in sorted(manifest.items()):
+                src = os.path.join(entry, name)
+                dst = (base + ext) if ext else out
+                if os.path.isdir(dst):
+                    shutil.rmtree(dst)
+                if os.path.isdir(src):
+                    shutil.copytree(src, dst)
+                else:
+                    shutil.copy(src, dst)
+        except OSError as e:  # pragma: debug
+            logger.debug("Could not restore %s from the build cache: %s"
+                         % (out, e))
+            return False
+        try:
+            # Mark the entry as recently used so it is pruned last
+            os.utime(os.path.join(entry, 'manifest.json'))
+        except OSError:  # pragma: debug
+            pass
+        logger.debug("Restored %s from the build cache (%s)" % (out, key))
+        return True
+
     @classmethod
     def call(cls, args, language=None, skip_flags=False, dry_run=False,
              out=None, overwrite=False, products=None, allow_error=False,
@@ -882,15 +1348,27 @@ class CompilationToolBase(object):
                 if out != 'clean':
                     cls.append_product(products, args, out)
                 return out
+        # Check for products in the build cache
+        if (not skip_flags) and ('env' not in unused_kwargs):
+            unused_kwargs['env'] = cls.set_env()
+        cache_key = None
+        if (not skip_flags) and (out != 'clean'):
+            cache_key = cls.get_build_cache_key(
+                cmd, out, env=unused_kwargs['env'], working_dir=working_dir,
+                build_library=kwargs.get('build_library', False))
+            if cache_key and cls.restore_from_build_cache(cache_key, out):
+                cls.append_product(products, args, out)
+                return out
         # Run command
         output = ''
+        returncode = None
         try:
-            if (not skip_flags) and ('env' not in unused_kwargs):
-                unused_kwargs['env'] = cls.set_env()
             logger.debug('Command: "%s"' % ' '.join(cmd))
-            proc = tools.popen_nobuffer(cmd, **unused_kwargs)
-            output, err = proc.communicate()
+            with get_build_semaphore():
+                proc = tools.popen_nobuffer(cmd, **unused_kwargs)
+                output, err = proc.communicate()
             output = output.decode("utf-8")
+            returncode = proc.returncode
             if (proc.returncode != 0) and (not allow_error):
                 raise RuntimeError("Command '%s' failed with code %d:\n%s."
                                    % (' '.join(cmd), proc.returncode, output))
@@ -914,6 +1392,8 @@ class CompilationToolBase(object):
                 logger.debug("%s %s produced %s"
                              % (cls.tooltype.title(), cls.toolname, out))
                 cls.append_product(products, args, out)
+                if cache_key and (returncode == 0):
+                    cls.store_in_build_cache(cache_key, args, out)
             return out
         return output
 
@@ -969,6 +1449,11 @@ class CompilerBase(CompilationToolBase):
             operations in succession. If False, the compilation and linking
             steps must be performed separately. If None, this is determined by
             checking if the compiler and linker names match.
+        include_regex (str): Regex that should be used to locate the names
+            of files included by source files. Included files are located
+            relative to the source file and the include directories and
+            their contents are included in the build cache key. If None,
+            included files are not located.
 
     """
     tooltype = 'compiler'
@@ -987,6 +1472,7 @@ class CompilerBase(CompilationToolBase):
     linker_base_classes = None
     combine_with_linker = None
     search_path_env = 'include'
+    include_regex = None
 
     def __init__(self, **kwargs):
         for k in ['linker', 'archiver', 'linker_flags', 'archiver_flags']:
@@ -1164,6 +1650,51 @@ class CompilerBase(CompilationToolBase):
                     del unused_kwargs_comp[k]
         return out
 
+    @classmethod
+    def get_build_dependencies(cls, cmd, working_dir=None):
+        r"""Get files that are used by a call to the tool, but are not part
+        of the command. For compilers this includes files that are included
+        by the source files (see include_regex).
+
+        Args:
+            cmd (list): Command line arguments for the call.
+            working_dir (str, optional): Working directory that the call will
+                be made from. Defaults to None and the current working
+                directory is used.
+
+        Returns:
+            list: Pairs of the name used to refer to each file in the include
+                statement and the full path to the file.
+
+        """
+        out = super(CompilerBase, cls).get_build_dependencies(
+            cmd, working_dir=working_dir)
+        if not cls.include_regex:
+            return out
+        if working_dir is None:
+            working_dir = os.getcwd()
+        regex = re.compile(cls.include_regex, re.MULTILINE)
+        include_dirs = [os.path.join(working_dir, x) for x in
+                        cls.get_flag_values(cmd, 'include_dirs')]
+        stack = [os.path.join(working_dir, x) for x in cmd[1:]
+                 if os.path.splitext(x)[-1] in cls.get_language_ext()]
+        stack = [x for x in stack if os.path.isfile(x)]
+        found = set(stack)
+        while stack:
+            src = stack.pop()
+            with open(src, 'r', errors='ignore') as fd:
+                contents = fd.read()
+            for name in regex.findall(contents):
+                for d in [os.path.dirname(src)] + include_dirs:
+                    fname = os.path.join(d, name)
+                    if os.path.isfile(fname):
+                        if fname not in found:
+                            found.add(fname)
+                            stack.append(fname)
+                            out.append((name, fname))
+                        break
+        return out
+
     @classmethod
     def get_output_file(cls, src, dont_link=False, working_dir=None,
                         libtype=None, no_src_ext=False,
@@ -1291,10 +1822,10 @@ class CompilerBase(CompilationToolBase):
                 kwargs_link = tool.extract_kwargs(kwargs, compiler=cls)
             else:
                 kwargs.pop('linker_language', None)
-            obj_list = []
-            for isrc, iout in zip(args, out_comp):
-                iobj = cls.call(isrc, out=iout, dont_link=True, **kwargs)
-                obj_list.append(iobj)
+            obj_list = run_build_jobs(
+                lambda isrc, iout: cls.call(isrc, out=iout, dont_link=True,
+                                            **kwargs),
+                list(zip(args, out_comp)))
             if dont_link:
                 return obj_list
             # Link/archive
@@ -1392,6 +1923,40 @@ class LinkerBase(CompilationToolBase):
             libname = libname.split(cls.library_prefix)[-1]
         return libname
 
+    @classmethod
+    def get_build_dependencies(cls, cmd, working_dir=None):
+        r"""Get files that are used by a call to the tool, but are not part
+        of the command. For linkers this includes libraries that are
+        located in the library directories.
+
+        Args:
+            cmd (list): Command line arguments for the call.
+            working_dir (str, optional): Working directory that the call will
+                be made from. Defaults to None and the current working
+                directory is used.
+
+        Returns:
+            list: Pairs of the library name and the full path to the library.
+
+        """
+        out = super(LinkerBase, cls).get_build_dependencies(
+            cmd, working_dir=working_dir)
+        if working_dir is None:
+            working_dir = os.getcwd()
+        library_dirs = [os.path.join(working_dir, x) for x in
+                        cls.get_flag_values(cmd, 'library_dirs')]
+        for name in cls.get_flag_values(cmd, 'library_libs'):
+            candidates = [name]
+            for ext in [cls.library_ext, '.a', '.lib']:
+                if ext:
+                    candidates.append(cls.library_prefix + name + ext)
+            for fname in (os.path.join(d, x) for d in library_dirs
+                          for x in candidates):
+                if os.path.isfile(fname):
+                    out.append((name, fname))
+                    break
+        return out
+
     @classmethod
     def extract_kwargs(cls, kwargs, compiler=None, add_kws_link=[],
                        add_kws_both=[]):
@@ -1673,6 +2238,7 @@ class BuildToolBase(CompilerBase):  # pragma: in progress
     tooltype = 'buildtool'
     flag_options = OrderedDict()
     default_buildfile = None
+    build_cache = False
     _schema_properties = {
         'buildfile': {'type': 'string'},
         'builddir': {'type': 'string'},
@@ -2552,6 +3118,7 @@ class CompiledModelDriver(ModelDriver):
         return cls.get_tool('compiler').get_executable()
 
     @classmethod
+    @tools.discovery_cache(executable='language_executable')
     def language_version(cls, **kwargs):
         r"""Determine the version of this language.
 
@@ -2851,9 +3418,18 @@ class CompiledModelDriver(ModelDriver):
         if (((cls.interface_library is not None) and cls.is_installed()
              and (cls.interface_library not in base_libraries))):
             # cls.call_compiler(cls.interface_library)
-            dep_order = cls.get_dependency_order(cls.interface_library)
-            for k in dep_order[::-1]:
-                cls.call_compiler(k, **kwargs)
+            dep_order = cls.get_dependency_order(cls.interface_library)[::-1]
+            # Compile libraries concurrently once their dependencies are built
+            while dep_order:
+                ready = [k for k in dep_order
+                         if not any((x in dep_order) for x in
+                                    cls.internal_libraries.get(k, {}).get(
+                                        'internal_dependencies', []))]
+                if not ready:  # pragma: debug
+                    ready = dep_order[:1]
+                run_build_jobs(lambda k: cls.call_compiler(k, **kwargs),
+                               [(k, ) for k in ready])
+                dep_order = [k for k in dep_order if k not in ready]
 
     @classmethod
     def cleanup_dependencies(cls, products=None, **kwargs):
@@ -2969,8 +3545,13 @@ class CompiledModelDriver(ModelDriver):
                     'out', cls.get_dependency_library(dep, libtype=kwargs['libtype']))
                 if (kwargs['libtype'] == 'static') and ('linker_language' in kwargs):
                     kwargs['archiver_language'] = kwargs.pop('linker_language')
-            return cls.call_compiler(src, suffix=_system_suffix,
-                                     **kwargs)
+            # Libraries can be shared by languages & models built concurrently
+            lock_key = kwargs.get('out', None)
+            if lock_key is None:
+                lock_key = src[0] if isinstance(src, list) else src
+            with get_build_lock(lock_key):
+                return cls.call_compiler(src, suffix=_system_suffix,
+                                         **kwargs)
         # Compile using the compiler after updating the flags
         kwargs = cls.update_compiler_kwargs(**kwargs)
         tool = cls.get_tool('compiler')
@@ -13,6 +13,7 @@ from pprint import pformat
 from yggdrasil import platform, tools, languages
 from yggdrasil.components import import_component
 from yggdrasil.drivers.Driver import Driver
+from yggdrasil.memoize import _cache_schema
 from yggdrasil.metaschema.datatypes import is_default_typedef
 from threading import Event
 try:
@@ -98,6 +99,12 @@ class ModelDriver(Driver):
             located within the file specified by the source file listed in the
             first argument. If not provided, the model must contain it's own
             calls to the |yggdrasil| interface.
+        function_cache (dict, optional): If provided, the results of the
+            wrapped function are cached for inputs that have already been
+            seen (see yggdrasil.memoize.FunctionCache for options). This
+            should only be used for pure functions and is only supported for
+            languages with a 'function_cache' entry in function_param.
+            Defaults to None.
         source_products (list, optional): Files created by running the model
             that are source files. These files will be removed without checking
             their extension so users should avoid adding files to this list
@@ -117,6 +124,11 @@ class ModelDriver(Driver):
             There will be one channel created for each server the model is a
             client of. Defaults to empty list. Use of `client_of` with `function`
             is not currently supported.
+        replicas (int, optional): Number of copies of the model that should
+            be run. Requests from clients are distributed between the copies
+            based on the number of requests each copy has outstanding. Only
+            valid for server models (`is_server`) that do not have any other
+            input or output channels. Defaults to 1.
         overwrite (bool, optional): If True, any existing model products
             (compilation products, wrapper scripts, etc.) are removed prior to
             the run. If False, the products are not removed. Defaults to True.
@@ -225,6 +237,7 @@ class ModelDriver(Driver):
             started.
         client_of (list): The names of server models that this model is a
             client of.
+        replicas (int): Number of copies of the model that are run.
         with_strace (bool): If True, the command is run with strace or dtrace.
         strace_flags (list): Flags to pass to strace/dtrace.
         with_valgrind (bool): If True, the command is run with valgrind.
@@ -281,9 +294,11 @@ class ModelDriver(Driver):
         'overwrite': {'type': 'boolean', 'default': True},
         'preserve_cache': {'type': 'boolean', 'default': False},
         'function': {'type': 'string'},
+        'function_cache': _cache_schema,
         'is_server': {'type': 'boolean', 'default': False},
         'client_of': {'type': 'array', 'items': {'type': 'string'},
                       'default': []},
+        'replicas': {'type': 'integer', 'default': 1, 'minimum': 1},
         'with_strace': {'type': 'boolean', 'default': False},
         'strace_flags': {'type': 'array',
                          'default': ['-e', 'trace=memory'],
@@ -388,7 +403,8 @@ class ModelDriver(Driver):
             lines = self.write_model_wrapper(
                 self.model_function_file, self.function,
                 inputs=self.inputs, outputs=self.outputs,
-                outputs_in_inputs=self.model_outputs_in_inputs)
+                outputs_in_inputs=self.model_outputs_in_inputs,
+                function_cache=self.function_cache)
             with open(args[0], 'w') as fd:
                 fd.write('\n'.join(lines))
         # Parse arguments
@@ -726,6 +742,7 @@ class ModelDriver(Driver):
         return pre_args
         
     @classmethod
+    @tools.discovery_cache(executable='language_executable')
     def language_version(cls, version_flags=None, **kwargs):
         r"""Determine the version of this language.
 
@@ -741,6 +758,7 @@ class ModelDriver(Driver):
         return cls.run_executable(version_flags, **kwargs).splitlines()[0].strip()
 
     @classmethod
+    @tools.discovery_cache(executable='language_executable')
     def is_installed(cls):
         r"""Determine if this model driver is installed on the current
         machine.
@@ -802,6 +820,7 @@ class ModelDriver(Driver):
         return out
     
     @classmethod
+    @tools.discovery_cache(executable='language_executable')
     def is_language_installed(cls):
         r"""Determine if the interpreter/compiler for the associated programming
         language is installed.
@@ -1632,7 +1651,7 @@ class ModelDriver(Driver):
     @classmethod
     def write_model_wrapper(cls, model_file, model_function,
                             inputs=[], outputs=[],
-                            outputs_in_inputs=None):
+                            outputs_in_inputs=None, function_cache=None):
         r"""Return the lines required to wrap a model function as an integrated
         model.
 
@@ -1647,16 +1666,27 @@ class ModelDriver(Driver):
             outputs_in_inputs (bool, optional): If True, the outputs are
                 presented in the function definition as inputs. Defaults
                 to the class attribute outputs_in_inputs.
+            function_cache (dict, optional): Options for caching the results
+                of the model function (see yggdrasil.memoize.FunctionCache).
+                Defaults to None and results are not cached.
 
         Returns:
             list: Lines of code wrapping the provided model with the necessary
                 code to run it as part of an integration.
 
+        Raises:
+            NotImplementedError: If function_cache is provided, but the
+                language does not support caching function results.
+
         """
         # TODO: Determine how to encode dependencies on external variables in models
         if cls.function_param is None:
             raise NotImplementedError("function_param attribute not set for"
                                       "language '%s'" % cls.language)
+        if function_cache and ('function_cache' not in cls.function_param):
+            raise NotImplementedError("Caching function results is not "
+                                      "supported for language '%s'"
+                                      % cls.language)
         lines = []
         flag_var = {'name': 'flag', 'datatype': {'type': 'flag'}}
         iter_var = {'name': 'first_iter', 'datatype': {'type': 'flag'}}
@@ -1750,6 +1780,10 @@ class ModelDriver(Driver):
             prefix.append(cls.format_function_param('import',
                                                     filename=model_file,
                                                     function=model_function))
+        if function_cache:
+            prefix.append(cls.format_function_param(
+                'function_cache', function=model_function,
+                options=repr(function_cache)))
         out = cls.write_executable(lines, prefix=prefix)
         logger.debug('\n' + '\n'.join(out))
         return out
@@ -39,6 +39,8 @@ class PythonModelDriver(InterpretedModelDriver):
     function_param = {
         'import_nofile': 'import {function}',
         'import': 'from {filename} import {function}',
+        'function_cache': ('from yggdrasil.memoize import FunctionCache\n'
+                           '{function} = FunctionCache({function}, **{options})'),
         'istype': 'isinstance({variable}, {type})',
         'len': 'len({variable})',
         'index': '{variable}[{index}]',
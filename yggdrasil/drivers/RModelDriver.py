@@ -1,8 +1,7 @@
 import numpy as np
-import pandas as pd
 import logging
 from collections import OrderedDict
-from yggdrasil import serialize, platform
+from yggdrasil import serialize, platform, tools
 from yggdrasil.drivers.InterpretedModelDriver import InterpretedModelDriver
 from yggdrasil.drivers.PythonModelDriver import PythonModelDriver
 from yggdrasil.drivers.CModelDriver import CModelDriver
@@ -10,6 +9,7 @@ from yggdrasil.languages.R import install
 
 
 logger = logging.getLogger(__name__)
+_DataFrame = tools.lazy_type('pandas', 'DataFrame')
 
 
 class RModelDriver(InterpretedModelDriver):  # pragma: R
@@ -213,7 +213,7 @@ class RModelDriver(InterpretedModelDriver):  # pragma: R
                     for k, v in pyobj.items()}
         elif isinstance(pyobj, np.string_):
             return pyobj.decode("utf-8")
-        elif isinstance(pyobj, pd.DataFrame):
+        elif isinstance(pyobj, _DataFrame):
             # R dosn't have int64 and will cast 64bit ints as floats if passed
             # without casting them to int32 first
             for n in pyobj.columns:
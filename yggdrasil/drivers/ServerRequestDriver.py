@@ -17,6 +17,8 @@ class ServerRequestDriver(ConnectionDriver):
             tools.get_default_comm().
         comm_address (str, optional): Address for the client request driver.
             Defaults to None and a new address is generated.
+        replicas (int, optional): Number of copies of the server model that
+            requests should be distributed between. Defaults to 1.
         **kwargs: Additional keyword arguments are passed to parent class.
 
     Attributes:
@@ -25,6 +27,14 @@ class ServerRequestDriver(ConnectionDriver):
         comm_address (str): Address for the client request driver.
         response_drivers (list): Response drivers created for each request.
         nclients (int): Number of clients signed on.
+        replicas (int): Number of copies of the server model that requests
+            are distributed between.
+        replica_env (list): Environment variables that should be set for
+            each copy of the server model.
+        response_replicas (list): Index of the server model copy that each
+            request in response_drivers was sent to.
+        replica_nsent (list): Number of requests sent to each copy of the
+            server model.
 
     """
 
@@ -32,7 +42,7 @@ class ServerRequestDriver(ConnectionDriver):
     _direction = 'input'
 
     def __init__(self, model_request_name, request_name=None,
-                 comm=None, comm_address=None, **kwargs):
+                 comm=None, comm_address=None, replicas=1, **kwargs):
         if request_name is None:
             request_name = model_request_name + '_SERVER'
         # Input communicator
@@ -49,11 +59,24 @@ class ServerRequestDriver(ConnectionDriver):
         ocomm_kws = kwargs.get('ocomm_kws', {})
         ocomm_kws['comm'] = None
         ocomm_kws['name'] = model_request_name
+        if replicas > 1:
+            # One comm per server model copy, all with the same name so that
+            # every copy uses the same channel name
+            ocomm_kws['comm'] = [{'name': model_request_name}
+                                 for i in range(replicas)]
         kwargs['ocomm_kws'] = ocomm_kws
         # Parent and attributes
         super(ServerRequestDriver, self).__init__(model_request_name, **kwargs)
-        self.env[self.ocomm.name] = self.ocomm.address
+        self.replicas = replicas
+        if self.replicas > 1:
+            self.replica_env = [x.opp_comms for x in self.ocomm.comm_list]
+        else:
+            self.replica_env = [{self.ocomm.name: self.ocomm.address}]
+        self.env.update(self.replica_env[0])
         self.response_drivers = []
+        self.response_replicas = []
+        self.replica_nsent = [0 for i in range(self.replicas)]
+        self._last_replica = -1
         self.nclients = 0
         self.comm = comm
         self.comm_address = self.icomm.address  # opp_address
@@ -95,15 +118,47 @@ class ServerRequestDriver(ConnectionDriver):
             for x in self.response_drivers:
                 x.terminate()
             self.response_drivers = []
+            self.response_replicas = []
 
     def close_comm(self):
         r"""Close response drivers."""
         self.close_response_drivers()
         super(ServerRequestDriver, self).close_comm()
 
+    @property
+    def replica_load(self):
+        r"""list: Number of requests sent to each copy of the server model
+        that have not been responded to yet."""
+        out = [0 for i in range(self.replicas)]
+        with self.lock:
+            for i, x in zip(self.response_replicas, self.response_drivers):
+                if x.is_alive():
+                    out[i] += 1
+        return out
+
+    def select_replica(self):
+        r"""Determine which copy of the server model the next request should
+        be sent to. The copy with the fewest outstanding requests is selected,
+        with ties broken in round-robin order.
+
+        Returns:
+            int: Index of the server model copy.
+
+        """
+        load = self.replica_load
+        order = [(self._last_replica + 1 + i) % self.replicas
+                 for i in range(self.replicas)]
+        out = min(order, key=lambda i: load[i])
+        self._last_replica = out
+        return out
+
     def printStatus(self, *args, **kwargs):
         r"""Also print response drivers."""
         super(ServerRequestDriver, self).printStatus(*args, **kwargs)
+        if self.replicas > 1:
+            print('%-50s%s' % ('', 'sent per replica: %s, outstanding per '
+                               'replica: %s' % (self.replica_nsent,
+                                                self.replica_load)))
         for x in self.response_drivers:
             x.printStatus(*args, **kwargs)
 
@@ -162,6 +217,10 @@ class ServerRequestDriver(ConnectionDriver):
         # Start response driver
         is_eof = kwargs.get('is_eof', False)
         if not is_eof:
+            replica = 0
+            if self.replicas > 1:
+                replica = self.select_replica()
+                kwargs['replica'] = replica
             self.debug("Starting new ServerResponseDriver at: %s" %
                        self.response_address)
             with self.lock:
@@ -174,6 +233,7 @@ class ServerRequestDriver(ConnectionDriver):
                 try:
                     response_driver = ServerResponseDriver(*drv_args, **drv_kwargs)
                     self.response_drivers.append(response_driver)
+                    self.response_replicas.append(replica)
                     response_driver.start()
                     self.debug("ServerResponseDriver started.")
                 except BaseException:  # pragma: debug
@@ -185,3 +245,30 @@ class ServerRequestDriver(ConnectionDriver):
                 'response_address', response_driver.model_response_address)
             kwargs['header_kwargs'].setdefault('request_id', self.request_id)
         return super(ServerRequestDriver, self).send_message(*args, **kwargs)
+
+    def _send_message(self, *args, **kwargs):
+        r"""Send a single message, only sending it to one copy of the server
+        model if there is more than one. Messages without a specified copy
+        (e.g. EOF) are sent to all of the copies.
+
+        Args:
+            *args: Arguments are passed to the output comm send method.
+            replica (int, optional): Index of the server model copy that the
+                message should be sent to. Defaults to None and the message
+                is sent to all copies.
+            *kwargs: Keyword arguments are passed to the output comm send method.
+
+        Returns:
+            bool: Success or failure of send.
+
+        """
+        replica = kwargs.pop('replica', None)
+        if replica is None:
+            return super(ServerRequestDriver, self)._send_message(*args, **kwargs)
+        with self.lock:
+            if self.ocomm.is_closed:
+                return False
+            flag = self.ocomm.comm_list[replica].send(*args, **kwargs)
+            if flag:
+                self.replica_nsent[replica] += 1
+            return flag
@@ -1,4 +1,7 @@
 import os
+import glob
+import shutil
+import tempfile
 from yggdrasil.config import ygg_cfg
 from yggdrasil.tests import assert_equal, assert_raises, YggTestClass
 from yggdrasil.drivers import CompiledModelDriver
@@ -39,6 +42,94 @@ def test_get_compilation_tool():
                                                           default='invalid'), 'invalid')
 
 
+def test_build_cache():
+    r"""Test reuse of compilation products from the build cache."""
+    from yggdrasil import tools
+    from yggdrasil.drivers.CModelDriver import CModelDriver
+    if not CModelDriver.is_language_installed():  # pragma: no cover
+        return
+    tool = CModelDriver.get_tool('compiler')
+    tempdir = tempfile.mkdtemp()
+    cache_dir = os.path.join(tempdir, 'cache')
+    old_cache = ygg_cfg.get('build', 'cache', 'True')
+    old_cache_dir = ygg_cfg.get('build', 'cache_dir', '')
+    ygg_cfg.set('build', 'cache_dir', cache_dir)
+    old_popen = tools.popen_nobuffer
+    ncalls = []
+
+    def popen_nobuffer(*args, **kwargs):
+        ncalls.append(args)
+        return old_popen(*args, **kwargs)
+
+    def cache_entries():
+        return sorted(glob.glob(os.path.join(cache_dir, '*', '*')))
+    tools.popen_nobuffer = popen_nobuffer
+    try:
+        out = {}
+        entries = {}
+        calls = {}
+        for x in ['a', 'b', 'c']:
+            os.mkdir(os.path.join(tempdir, x))
+            with open(os.path.join(tempdir, x, 'test.c'), 'w') as fd:
+                fd.write('#include "test.h"\nint test(void) { return TEST; }\n')
+            with open(os.path.join(tempdir, x, 'test.h'), 'w') as fd:
+                fd.write('#define TEST %d\n' % (2 if (x == 'c') else 1))
+            out[x] = tool.call(os.path.join(tempdir, x, 'test.c'),
+                               working_dir=os.path.join(tempdir, x),
+                               dont_link=True, overwrite=True)
+            entries[x] = cache_entries()
+            calls[x] = len(ncalls)
+            with open(out[x], 'rb') as fd:
+                out[x] = fd.read()
+        # Identical sources share products without calling the compiler,
+        # but different headers do not
+        assert_equal(len(entries['a']), 1)
+        assert_equal(entries['b'], entries['a'])
+        assert_equal(calls['b'], calls['a'])
+        assert_equal(out['a'], out['b'])
+        assert_equal(len(entries['c']), 2)
+        assert(calls['c'] > calls['b'])
+        assert(out['a'] != out['c'])
+        # Least recently used entries are removed first
+        os.utime(os.path.join(entries['a'][0], 'manifest.json'), (0, 0))
+        removed = CompiledModelDriver.prune_build_cache(max_size=1)
+        assert_equal(len(removed), 2)
+        assert_equal(removed[0], entries['a'][0])
+        assert_equal(cache_entries(), [])
+        CompiledModelDriver.clear_build_cache()
+        assert(not os.path.isdir(cache_dir))
+        ygg_cfg.set('build', 'cache', 'False')
+        assert_equal(CompiledModelDriver.get_build_cache_dir(), None)
+    finally:
+        tools.popen_nobuffer = old_popen
+        ygg_cfg.set('build', 'cache', old_cache)
+        ygg_cfg.set('build', 'cache_dir', old_cache_dir)
+        shutil.rmtree(tempdir)
+
+
+def test_get_build_jobs():
+    r"""Test get_build_jobs."""
+    old_jobs = ygg_cfg.get('build', 'jobs', '')
+    try:
+        ygg_cfg.set('build', 'jobs', '3')
+        assert_equal(CompiledModelDriver.get_build_jobs(), 3)
+        assert(CompiledModelDriver.get_build_semaphore()
+               is CompiledModelDriver.get_build_semaphore())
+        ygg_cfg.set('build', 'jobs', '')
+        assert_equal(CompiledModelDriver.get_build_jobs(), os.cpu_count() or 1)
+    finally:
+        ygg_cfg.set('build', 'jobs', old_jobs)
+
+
+def test_run_build_jobs():
+    r"""Test run_build_jobs."""
+    assert_equal(CompiledModelDriver.run_build_jobs(
+        lambda x, y: x + y, [(1, 2), (3, 4), (5, 6)]), [3, 7, 11])
+    assert_equal(CompiledModelDriver.run_build_jobs(lambda x: x, []), [])
+    assert(CompiledModelDriver.get_build_lock('test')
+           is CompiledModelDriver.get_build_lock(os.path.abspath('test')))
+
+
 def test_CompilationToolBase():
     r"""Test error in CompilationToolBase."""
     assert_raises(RuntimeError, CompiledModelDriver.CompilationToolBase,
@@ -244,6 +244,22 @@ class TestModelDriverNoInit(TestModelParam, parent.TestDriverNoInit):
             self.assert_raises(NotImplementedError,
                                self.import_cls.format_function_param,
                                'invalid_key')
+            cache_opts = {'size': 10}
+            inputs = [{'name': 'test:a', 'datatype': 'bytes'}]
+            outputs = [{'name': 'test:y', 'datatype': 'bytes'}]
+            if 'function_cache' in self.import_cls.function_param:
+                lines = self.import_cls.write_model_wrapper(
+                    'test', 'test', inputs=inputs, outputs=outputs,
+                    function_cache=cache_opts)
+                cache_line = self.import_cls.format_function_param(
+                    'function_cache', function='test',
+                    options=repr(cache_opts))
+                assert(cache_line in '\n'.join(lines))
+            else:
+                self.assert_raises(NotImplementedError,
+                                   self.import_cls.write_model_wrapper,
+                                   'test', 'test', inputs=inputs,
+                                   outputs=outputs, function_cache=cache_opts)
         
     def test_write_executable(self):
         r"""Test writing an executable."""
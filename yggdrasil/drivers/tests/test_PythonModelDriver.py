@@ -10,7 +10,24 @@ class TestPythonModelParam(parent.TestInterpretedModelParam):
 class TestPythonModelDriverNoInit(TestPythonModelParam,
                                   parent.TestInterpretedModelDriverNoInit):
     r"""Test runner for PythonModelDriver without init."""
-    pass
+
+    def test_write_model_wrapper_cache(self):
+        r"""Test that the model function is wrapped by FunctionCache."""
+        lines = self.import_cls.write_model_wrapper(
+            'test', 'test', inputs=[{'name': 'a', 'datatype': 'bytes'}],
+            outputs=[{'name': 'b', 'datatype': 'bytes'}],
+            function_cache={'size': 10})
+        lines = '\n'.join(lines).splitlines()
+        assert('from yggdrasil.memoize import FunctionCache' in lines)
+        assert("test = FunctionCache(test, **{'size': 10})" in lines)
+        # Languages without a function_cache entry
+        entry = self.import_cls.function_param.pop('function_cache')
+        try:
+            self.assert_raises(NotImplementedError,
+                               self.import_cls.write_model_wrapper,
+                               'test', 'test', function_cache={'size': 10})
+        finally:
+            self.import_cls.function_param['function_cache'] = entry
         
 
 class TestPythonModelDriverNoStart(TestPythonModelParam,
@@ -8,6 +8,7 @@ export FIB_SERVER_SLEEP_SECONDS="0.01"
 yaml1= 
 yaml2= 
 yaml3= 
+outname='fibCli.txt'
 
 # ----------------Your Commands------------------- #
 case $1 in
@@ -59,6 +60,12 @@ case $1 in
 	yaml2='rpcFibCli_r.yml'
 	yaml3='rpcFibCliPar_r.yml'
 	;;
+    --pipe )
+	echo "Running Python with pipelined client"
+	yaml1='rpcFibSrv_python.yml'
+	yaml2='rpcFibCliPipe_python.yml'
+	outname='fibCliPipe.txt'
+	;;
     * )
 	echo "Running ", $1
 	yaml=$1
@@ -67,5 +74,5 @@ esac
 
 yggrun $yaml1 $yaml2 $yaml3
 
-outfile="${TMPDIR}fibCli.txt"
+outfile="${TMPDIR}${outname}"
 cat $outfile
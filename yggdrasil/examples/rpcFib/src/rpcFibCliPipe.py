@@ -0,0 +1,50 @@
+from __future__ import print_function
+import sys
+import time
+import numpy as np
+from yggdrasil.interface.YggInterface import YggRpcClient, YggOutput
+
+
+def fibClient(args):
+    
+    iterations = int(args[0])
+    print('Hello from Python rpcFibCliPipe: iterations = %d' % iterations)
+
+    # Set up connections matching yaml
+    # RPC client-side connection will be $(server_name)_$(client_name)
+    rpc = YggRpcClient("rpcFibSrv_rpcFibCliPipe", "%d", "%d %d")
+    log = YggOutput("output_log")
+
+    # Time sequential calls that wait for each response before sending the
+    # next request
+    tstart = time.time()
+    for i in range(1, iterations + 1):
+        ret, fib = rpc.call(np.int32(i))
+        if not ret:
+            raise RuntimeError('rpcFibCliPipe(P): RPC CALL ERROR')
+    tseq = time.time() - tstart
+
+    # Time pipelined calls that send all of the requests before waiting for
+    # the responses
+    tstart = time.time()
+    results = rpc.call_many([np.int32(i) for i in range(1, iterations + 1)])
+    tpipe = time.time() - tstart
+
+    for ret, fib in results:
+        if not ret:
+            raise RuntimeError('rpcFibCliPipe(P): RPC CALL ERROR')
+
+        # Log result by sending it to the log connection
+        s = 'fib(%2d<-) = %-2d<-\n' % tuple(fib)
+        print(s, end='')
+        ret = log.send(s)
+        if not ret:
+            raise RuntimeError('rpcFibCliPipe(P): SEND ERROR')
+
+    print('rpcFibCliPipe(P): %d sequential calls took %f s, %d pipelined '
+          'calls took %f s' % (iterations, tseq, iterations, tpipe))
+    print('Goodbye from Python rpcFibCliPipe')
+
+    
+if __name__ == '__main__':
+    fibClient(sys.argv[1:])
@@ -1,5 +1,11 @@
 import os
+import sys
+import copy
+import shutil
+import tempfile
+import subprocess
 import numpy as np
+from yggdrasil import config
 from yggdrasil.communication import get_comm
 from yggdrasil.interface import YggInterface
 from yggdrasil.tools import (
@@ -35,6 +41,43 @@ class ModelEnv(object):
                 os.environ[k] = v
 
 
+def test_import_time():
+    r"""Test that importing the interface, as models do, does not import
+    heavy dependencies and is within the import time budget, both on the
+    first (cold) import and once discovery results are cached. The imports
+    are run with an isolated config that has not been updated by yggconfig
+    so that the user's config and cache are not used."""
+    budget = 2.0  # seconds
+    heavy = ['pytest', 'nose', 'pandas', 'unyt', 'sympy', 'scipy',
+             'matplotlib', 'astropy']
+    cmd = [sys.executable, '-X', 'importtime', '-c',
+           'from yggdrasil.interface.YggInterface import YggInput']
+    tempdir = tempfile.mkdtemp()
+    env = copy.deepcopy(os.environ)
+    env['HOME'] = tempdir
+    for k in ['VIRTUAL_ENV', 'CONDA_PREFIX']:
+        env.pop(k, None)
+    shutil.copy(config.def_config_file,
+                os.path.join(tempdir, config.config_file))
+    try:
+        for i in range(2):
+            output = subprocess.check_output(cmd, stderr=subprocess.STDOUT,
+                                             env=env, cwd=tempdir)
+            imported = {}
+            for line in output.decode('utf-8').splitlines():
+                if line.startswith('import time:') and ('|' in line):
+                    cumulative, name = line.split('|')[1:]
+                    if cumulative.strip().isdigit():
+                        imported[name.strip()] = int(cumulative) * 1.0e-6
+            for x in heavy:
+                assert(x not in imported)
+            assert(imported['yggdrasil.interface.YggInterface'] < budget)
+        assert(os.path.isfile(os.path.join(tempdir,
+                                           '.ygg_discovery_cache.json')))
+    finally:
+        shutil.rmtree(tempdir)
+
+
 def test_maxMsgSize():
     r"""Test max message size."""
     assert_equal(YggInterface.maxMsgSize(), YGG_MSG_MAX)
@@ -0,0 +1,315 @@
+"""Tools for caching the results of pure functions."""
+import os
+import sys
+import copy
+import pickle
+import hashlib
+import logging
+import threading
+import collections
+import numpy as np
+from yggdrasil import units
+
+
+logger = logging.getLogger(__name__)
+_cache_schema = {
+    'type': 'object',
+    'description': (
+        'Options for caching the results of the function for inputs '
+        'that have already been seen. This should only be used for pure '
+        'functions. Supported options are \'size\' (maximum number of '
+        'results to keep, defaults to 128), \'max_bytes\' (maximum '
+        'size of the results kept in memory), \'key\' (method used to '
+        'identify inputs, \'hash\' for a content hash or \'repr\', '
+        'defaults to \'hash\'), and \'directory\' (directory where '
+        'results should be stored so that they persist between runs).'),
+    'properties': {
+        'size': {'type': 'integer', 'minimum': 1},
+        'max_bytes': {'type': 'integer', 'minimum': 0},
+        'key': {'type': 'string', 'enum': ['hash', 'repr']},
+        'directory': {'type': 'string'}},
+    'additionalProperties': False}
+
+
+def _update_hash(h, obj):
+    r"""Update a hash object with the contents of an object.
+
+    Args:
+        h (hashlib._Hash): Hash object to update.
+        obj (object): Object to add to the hash.
+
+    """
+    if isinstance(obj, units._unit_array_type):
+        h.update(b'units:' + str(obj.units).encode('utf-8'))
+        obj = obj.to_ndarray()
+    if isinstance(obj, (np.ndarray, np.generic)):
+        arr = np.ascontiguousarray(obj)
+        h.update(('ndarray:%s:%s:' % (arr.dtype.descr, arr.shape)).encode('utf-8'))
+        if arr.dtype.hasobject:
+            for x in arr.flat:
+                _update_hash(h, x)
+        else:
+            h.update(arr.reshape(-1).view(np.uint8).data)
+    elif isinstance(obj, (bytes, bytearray)):
+        h.update(b'bytes:%d:' % len(obj))
+        h.update(obj)
+    elif isinstance(obj, str):
+        h.update(b'str:')
+        _update_hash(h, obj.encode('utf-8'))
+    elif isinstance(obj, (list, tuple)):
+        h.update(('%s:%d:' % (type(obj).__name__, len(obj))).encode('utf-8'))
+        for x in obj:
+            _update_hash(h, x)
+    elif isinstance(obj, dict):
+        h.update(b'dict:%d:' % len(obj))
+        for k in sorted(obj.keys(), key=repr):
+            _update_hash(h, k)
+            _update_hash(h, obj[k])
+    elif isinstance(obj, (set, frozenset)):
+        # Iteration order depends on string hash randomization so the
+        # elements are added in the order of their hashes
+        h.update(('%s:%d:' % (type(obj).__name__, len(obj))).encode('utf-8'))
+        for x in sorted(content_hash(x) for x in obj):
+            h.update(x.encode('utf-8'))
+    elif (obj is None) or isinstance(obj, (bool, int, float, complex)):
+        h.update(('%s:%r:' % (type(obj).__name__, obj)).encode('utf-8'))
+    else:
+        h.update(('%s:' % type(obj).__name__).encode('utf-8'))
+        h.update(pickle.dumps(obj, protocol=4))
+
+
+def content_hash(obj):
+    r"""Get a hash of an object's contents that is stable between runs.
+    Numpy arrays are hashed using their data buffers.
+
+    Args:
+        obj (object): Object to hash.
+
+    Returns:
+        str: Hex digest of the hash.
+
+    """
+    h = hashlib.sha1()
+    _update_hash(h, obj)
+    return h.hexdigest()
+
+
+def repr_key(obj):
+    r"""Get a string identifying an object's contents. The string
+    representation is used for scalars and strings. Other objects (e.g.
+    numpy arrays, whose representations are truncated) are identified by
+    their content_hash.
+
+    Args:
+        obj (object): Object to get the key for.
+
+    Returns:
+        str: Key for the object.
+
+    """
+    if (obj is None) or isinstance(obj, (bool, int, float, complex,
+                                         str, bytes)):
+        return repr(obj)
+    elif isinstance(obj, (list, tuple)):
+        return '%s(%s)' % (type(obj).__name__,
+                           ', '.join(repr_key(x) for x in obj))
+    elif isinstance(obj, dict):
+        return '{%s}' % ', '.join(
+            '%s: %s' % (repr_key(k), repr_key(obj[k]))
+            for k in sorted(obj.keys(), key=repr))
+    return 'hash:%s' % content_hash(obj)
+
+
+def get_nbytes(obj):
+    r"""Estimate the memory used by an object.
+
+    Args:
+        obj (object): Object to get the size of.
+
+    Returns:
+        int: Size of the object in bytes.
+
+    """
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    elif isinstance(obj, (list, tuple)):
+        return sys.getsizeof(obj) + sum(get_nbytes(x) for x in obj)
+    elif isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(get_nbytes(k) + get_nbytes(v)
+                                        for k, v in obj.items())
+    return sys.getsizeof(obj)
+
+
+class FunctionCache(object):
+    r"""Least recently used cache for the results of a pure function.
+
+    Args:
+        function (callable): Function that results should be cached for.
+        size (int, optional): Maximum number of results that should be
+            kept in memory. Defaults to 128.
+        max_bytes (int, optional): Maximum size of the results that should
+            be kept in memory (in bytes). Defaults to None and the size is
+            not limited.
+        key (str, optional): Method that should be used to identify inputs.
+            'hash' uses a content hash of the inputs (see content_hash) and
+            'repr' uses the string representation of scalar and string
+            inputs (see repr_key). Defaults to 'hash'.
+        directory (str, optional): Directory where results should be
+            pickled so that they persist between runs. Defaults to None and
+            results are only kept in memory.
+
+    Attributes:
+        function (callable): Function that results are cached for.
+        hits (int): Number of calls that used a cached result.
+        misses (int): Number of calls that required calling the function.
+        nbytes (int): Size of the results currently in memory.
+
+    """
+
+    def __init__(self, function, size=128, max_bytes=None, key='hash',
+                 directory=None):
+        if key not in ['hash', 'repr']:
+            raise ValueError("Unsupported cache key method: '%s'" % key)
+        self.function = function
+        self.size = size
+        self.max_bytes = max_bytes
+        self.key = key
+        self.directory = directory
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._cache = collections.OrderedDict()
+        self._lock = threading.RLock()
+
+    def __call__(self, *args, **kwargs):
+        key = self.get_key(args, kwargs)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(self._cache[key][0])
+        out = self.load(key)
+        if out is not None:
+            with self._lock:
+                self.hits += 1
+            out = out[0]
+        else:
+            out = self.function(*args, **kwargs)
+            with self._lock:
+                self.misses += 1
+            self.dump(key, out)
+        self.add(key, copy.deepcopy(out))
+        return out
+
+    def get_key(self, args, kwargs):
+        r"""Get the cache key for a set of inputs.
+
+        Args:
+            args (tuple): Positional arguments.
+            kwargs (dict): Keyword arguments.
+
+        Returns:
+            str: Cache key.
+
+        """
+        if self.key == 'repr':
+            return repr_key((args, kwargs))
+        return content_hash((args, kwargs))
+
+    def add(self, key, result):
+        r"""Add a result to the in-memory cache, removing the least recently
+        used results if the cache is too large.
+
+        Args:
+            key (str): Cache key.
+            result (object): Result of calling the function.
+
+        """
+        nbytes = get_nbytes(result)
+        if (self.max_bytes is not None) and (nbytes > self.max_bytes):
+            return
+        with self._lock:
+            if key in self._cache:
+                self.nbytes -= self._cache.pop(key)[1]
+            self._cache[key] = (result, nbytes)
+            self.nbytes += nbytes
+            while ((len(self._cache) > self.size)
+                   or ((self.max_bytes is not None)
+                       and (self.nbytes > self.max_bytes))):
+                self.nbytes -= self._cache.popitem(last=False)[1][1]
+
+    def get_file(self, key):
+        r"""Get the name of the file where a result is stored on disk.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            str: Path to the file. None is returned if there is not a cache
+                directory.
+
+        """
+        if self.directory is None:
+            return None
+        # Include the function name so that a directory can be shared
+        key = content_hash((getattr(self.function, '__module__', ''),
+                            getattr(self.function, '__qualname__', ''), key))
+        return os.path.join(self.directory, key + '.pkl')
+
+    def load(self, key):
+        r"""Load a result from the cache directory.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            tuple: The result as the only element if the result was found,
+                None otherwise.
+
+        """
+        fname = self.get_file(key)
+        if (fname is None) or (not os.path.isfile(fname)):
+            return None
+        try:
+            with open(fname, 'rb') as fd:
+                return (pickle.load(fd), )
+        except BaseException as e:  # pragma: debug
+            logger.debug("Error loading cached result from %s: %s"
+                         % (fname, e))
+            return None
+
+    def dump(self, key, result):
+        r"""Store a result in the cache directory.
+
+        Args:
+            key (str): Cache key.
+            result (object): Result of calling the function.
+
+        """
+        fname = self.get_file(key)
+        if fname is None:
+            return
+        tmp = '%s.%d.%d' % (fname, os.getpid(), threading.get_ident())
+        try:
+            with open(tmp, 'wb') as fd:
+                pickle.dump(result, fd, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, fname)
+        except BaseException as e:  # pragma: debug
+            logger.debug("Error storing cached result in %s: %s"
+                         % (fname, e))
+            if os.path.isfile(tmp):
+                os.remove(tmp)
+
+    def clear(self):
+        r"""Remove all results from the in-memory cache."""
+        with self._lock:
+            self._cache.clear()
+            self.nbytes = 0
+
+    @property
+    def status(self):
+        r"""str: Summary of cache usage."""
+        return '%d hits, %d misses, %d cached (%d bytes)' % (
+            self.hits, self.misses, len(self._cache), self.nbytes)
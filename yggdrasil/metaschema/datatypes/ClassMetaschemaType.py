@@ -5,6 +5,10 @@ from yggdrasil import platform, tools
 from yggdrasil.metaschema.datatypes.MetaschemaType import MetaschemaType
 
 
+# Classes/functions that have already been imported from strings
+_import_cache = {}
+
+
 class ClassMetaschemaType(MetaschemaType):
     r"""Type for evaluating classes."""
 
@@ -66,6 +70,8 @@ class ClassMetaschemaType(MetaschemaType):
         """
         if not isinstance(obj, (str, bytes)):
             return obj
+        if obj in _import_cache:
+            return _import_cache[obj]
         pkg_mod = obj.split(':')
         if (len(pkg_mod) == 3) and platform._is_win:  # pragma: windows
             pkg_mod = [pkg_mod[0] + ':' + pkg_mod[1], pkg_mod[2]]
@@ -86,7 +92,8 @@ class ClassMetaschemaType(MetaschemaType):
         if not hasattr(modobj, fun):
             raise AttributeError("Module %s has no %s %s"
                                  % (modobj, cls.name, fun))
-        return getattr(modobj, fun)
+        _import_cache[obj] = getattr(modobj, fun)
+        return _import_cache[obj]
 
     @classmethod
     def _generate_data(cls, typedef):
@@ -199,6 +199,127 @@ class ContainerMetaschemaType(MetaschemaType):
                             obj[k], typedef=v))
         return map_out
         
+    @classmethod
+    def get_fingerprint(cls, obj, typedef=None):
+        r"""Get a hashable fingerprint for an object that determines the
+        type definition it will be encoded with. The fingerprint is composed
+        of the fingerprints of the elements in the container.
+
+        Args:
+            obj (object): Coerced object to get the fingerprint for.
+            typedef (dict, optional): Type definition that the object is being
+                encoded against. Defaults to None.
+
+        Returns:
+            tuple: Fingerprint for the object. None is returned if the object
+                cannot be encoded by a specialized encoder.
+
+        """
+        if not (isinstance(obj, cls.python_types) and isinstance(typedef, dict)
+                and isinstance(typedef.get(cls._json_property, None),
+                               cls.python_types)):
+            return None
+        vtypedefs = typedef[cls._json_property]
+        out = []
+        for k, v in cls._iterate(obj):
+            vtypedef = cls._get_element(vtypedefs, k, None)
+            if not (isinstance(vtypedef, dict) and ('type' in vtypedef)):
+                return None
+            vkey = get_type_class(vtypedef['type']).get_fingerprint(
+                v, typedef=vtypedef)
+            if vkey is None:
+                return None
+            out.append((k, vkey))
+        return (type(obj), tuple(out))
+
+    @classmethod
+    def get_metadata_fingerprint(cls, metadata):
+        r"""Get a hashable fingerprint for the type properties in message
+        metadata that determine how the data will be decoded. The fingerprint
+        is composed of the fingerprints of the element metadata.
+
+        Args:
+            metadata (dict): Message metadata.
+
+        Returns:
+            tuple: Fingerprint for the metadata. None is returned if the
+                message cannot be decoded by a specialized decoder.
+
+        """
+        vmetadatas = metadata.get(cls._json_property, None)
+        if not isinstance(vmetadatas, cls.python_types):
+            return None
+        out = []
+        for k, v in cls._iterate(vmetadatas):
+            if not (isinstance(v, dict) and ('type' in v)):
+                return None
+            vkey = get_type_class(v['type']).get_metadata_fingerprint(v)
+            if vkey is None:
+                return None
+            out.append((k, vkey))
+        return (metadata['type'], tuple(out))
+
+    @classmethod
+    def get_specialized_encoder(cls, obj, metadata, typedef=None):
+        r"""Get a function that encodes the data for objects with the same
+        fingerprint as the provided object using specialized encoders for
+        each of the elements.
+
+        Args:
+            obj (object): Coerced object that the encoder is for.
+            metadata (dict): Type definition that the object was encoded with.
+            typedef (dict, optional): Type definition that objects should be
+                transformed to match before they are encoded. Defaults to None.
+                Elements are not transformed.
+
+        Returns:
+            callable: Function that takes an object and returns the encoded
+                data.
+
+        """
+        vmetadatas = metadata[cls._json_property]
+        encoders = []
+        for k, v in cls._iterate(obj):
+            vmetadata = cls._get_element(vmetadatas, k, None)
+            encoders.append(
+                (k, get_type_class(vmetadata['type']).get_specialized_encoder(
+                    v, vmetadata)))
+
+        def encoder(x):
+            container = cls._container_type()
+            for k, vencoder in encoders:
+                cls._assign(container, k, vencoder(x[k]))
+            return container
+        return encoder
+
+    @classmethod
+    def get_specialized_decoder(cls, metadata, typedef=None):
+        r"""Get a function that decodes the data for messages with the same
+        metadata fingerprint as the provided metadata using specialized
+        decoders for each of the elements.
+
+        Args:
+            metadata (dict): Message metadata.
+            typedef (dict, optional): Type definition that decoded objects
+                should be transformed to match. Defaults to None.
+
+        Returns:
+            callable: Function that takes encoded data and returns the decoded
+                object.
+
+        """
+        decoders = []
+        for k, v in cls._iterate(metadata[cls._json_property]):
+            decoders.append(
+                (k, get_type_class(v['type']).get_specialized_decoder(v)))
+
+        def decoder(x):
+            container = cls._container_type()
+            for k, vdecoder in decoders:
+                cls._assign(container, k, vdecoder(x[k]))
+            return cls.transform_type(container, typedef)
+        return decoder
+
     @classmethod
     def extract_typedef(cls, metadata):
         r"""Extract the minimum typedef required for this type from the provided
@@ -1,5 +1,7 @@
 from yggdrasil.metaschema.datatypes import MetaschemaTypeError
 from yggdrasil.metaschema.datatypes.MetaschemaType import MetaschemaType
+from yggdrasil.metaschema.datatypes.ClassMetaschemaType import (
+    ClassMetaschemaType)
 from yggdrasil.metaschema.datatypes.JSONArrayMetaschemaType import (
     JSONArrayMetaschemaType)
 from yggdrasil.metaschema.datatypes.JSONObjectMetaschemaType import (
@@ -94,7 +96,10 @@ class InstanceMetaschemaType(MetaschemaType):
             obj[0], {'items': typedef.get('args', [])})
         kwargs = JSONObjectMetaschemaType.decode_data(
             obj[1], {'properties': typedef.get('kwargs', {})})
-        return typedef['class'](*args, **kwargs)
+        typecls = typedef['class']
+        if isinstance(typecls, str):
+            typecls = ClassMetaschemaType.decode_data(typecls, None)
+        return typecls(*args, **kwargs)
 
     @classmethod
     def _generate_data(cls, typedef):
@@ -112,4 +117,7 @@ class InstanceMetaschemaType(MetaschemaType):
             {'type': 'array', 'items': typedef.get('args', [])})
         kwargs = JSONObjectMetaschemaType.generate_data(
             {'type': 'object', 'properties': typedef.get('kwargs', {})})
-        return typedef['class'](*args, **kwargs)
+        typecls = typedef['class']
+        if isinstance(typecls, str):
+            typecls = ClassMetaschemaType.decode_data(typecls, None)
+        return typecls(*args, **kwargs)
@@ -41,6 +41,36 @@ class JSONMetaschemaTypeBase(MetaschemaType):
         """
         return obj
 
+    @classmethod
+    def get_fingerprint(cls, obj, typedef=None):
+        r"""Get a hashable fingerprint for an object that determines the
+        type definition it will be encoded with.
+
+        Args:
+            obj (object): Coerced object to get the fingerprint for.
+            typedef (dict, optional): Type definition that the object is being
+                encoded against. Defaults to None.
+
+        Returns:
+            tuple: Fingerprint for the object.
+
+        """
+        return (type(obj), )
+
+    @classmethod
+    def get_metadata_fingerprint(cls, metadata):
+        r"""Get a hashable fingerprint for the type properties in message
+        metadata that determine how the data will be decoded.
+
+        Args:
+            metadata (dict): Message metadata.
+
+        Returns:
+            tuple: Fingerprint for the metadata.
+
+        """
+        return (metadata['type'], )
+
 
 class JSONBooleanMetaschemaType(JSONMetaschemaTypeBase):
     r"""JSON base boolean type."""
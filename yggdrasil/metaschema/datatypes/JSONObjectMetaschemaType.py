@@ -1,8 +1,9 @@
 import numpy as np
-import pandas as pd
 from collections import OrderedDict
+from yggdrasil import tools
 from yggdrasil.metaschema.datatypes.ContainerMetaschemaType import (
     ContainerMetaschemaType)
+_DataFrame = tools.lazy_type('pandas', 'DataFrame')
 
 
 class JSONObjectMetaschemaType(ContainerMetaschemaType):
@@ -47,7 +48,7 @@ class JSONObjectMetaschemaType(ContainerMetaschemaType):
 
         """
         from yggdrasil.serialize import pandas2dict, numpy2dict, list2dict
-        if isinstance(obj, pd.DataFrame):
+        if isinstance(obj, _DataFrame):
             obj = pandas2dict(obj)
         elif isinstance(obj, np.ndarray) and (len(obj.dtype) > 0):
             obj = numpy2dict(obj)
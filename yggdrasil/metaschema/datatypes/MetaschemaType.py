@@ -4,19 +4,57 @@ import uuid
 import pprint
 import importlib
 import jsonschema
+from collections import OrderedDict
 from yggdrasil import tools
 from yggdrasil.metaschema import (get_metaschema, get_validator, encoder,
                                   validate_instance)
 from yggdrasil.metaschema.datatypes import (
     MetaschemaTypeError, MetaschemaTypeMeta, compare_schema, YGG_MSG_HEAD,
-    get_type_class, conversions, is_default_typedef)
+    get_type_class, conversions, is_default_typedef, get_numpy_type_key,
+    get_cached_numpy_type, cache_numpy_type)
 from yggdrasil.metaschema.properties import get_metaschema_property
 
 
+_specialized_cache_size = 32
+
+
 def _get_single_array_element(arr):
     return arr[0]
 
 
+def _get_specialized(cache, key):
+    out = cache.get(key, None)
+    if out is not None:
+        try:
+            cache.move_to_end(key)
+        except KeyError:  # pragma: debug
+            # Removed by another thread
+            pass
+    return out
+
+
+def _add_specialized(cache, key, value):
+    cache[key] = value
+    try:
+        while len(cache) > _specialized_cache_size:
+            cache.popitem(last=False)
+    except KeyError:  # pragma: debug
+        # Removed by another thread
+        pass
+
+
+def _add_metadata_kwargs(metadata, kwargs):
+    for k, v in kwargs.items():
+        if (k in metadata) and (v != metadata[k]):
+            error_str = ("Key '%s' set by the type encoder.\n"
+                         + " User defined value:\n%s\n"
+                         + "Type encoder defined value:\n%s\n") % (
+                             k, pprint.pformat(v), pprint.pformat(metadata[k]))
+            raise RuntimeError(error_str)
+        metadata[k] = v
+    return metadata
+
+
 @six.add_metaclass(MetaschemaTypeMeta)
 class MetaschemaType(object):
     r"""Base type that should be subclassed by user defined types. Attributes
@@ -93,6 +131,8 @@ class MetaschemaType(object):
     
     def __init__(self, **typedef):
         self._typedef = {}
+        self._encoders = OrderedDict()
+        self._decoders = OrderedDict()
         typedef.setdefault('type', self.name)
         self.update_typedef(**typedef)
 
@@ -174,6 +214,83 @@ class MetaschemaType(object):
         """
         return obj
 
+    @classmethod
+    def get_fingerprint(cls, obj, typedef=None):
+        r"""Get a hashable fingerprint for an object that determines the
+        type definition it will be encoded with. Objects with the same
+        fingerprint are encoded by the same specialized encoder.
+
+        Args:
+            obj (object): Coerced object to get the fingerprint for.
+            typedef (dict, optional): Type definition that the object is being
+                encoded against. Defaults to None.
+
+        Returns:
+            tuple: Fingerprint for the object. None is returned if the object
+                cannot be encoded by a specialized encoder.
+
+        """
+        return None
+
+    @classmethod
+    def get_metadata_fingerprint(cls, metadata):
+        r"""Get a hashable fingerprint for the type properties in message
+        metadata that determine how the data will be decoded. Messages with
+        the same fingerprint are decoded by the same specialized decoder.
+
+        Args:
+            metadata (dict): Message metadata.
+
+        Returns:
+            tuple: Fingerprint for the metadata. None is returned if the
+                message cannot be decoded by a specialized decoder.
+
+        """
+        return None
+
+    @classmethod
+    def get_specialized_encoder(cls, obj, metadata, typedef=None):
+        r"""Get a function that encodes the data for objects with the same
+        fingerprint as the provided object without deriving the type
+        definition from the object again.
+
+        Args:
+            obj (object): Coerced object that the encoder is for.
+            metadata (dict): Type definition that the object was encoded with.
+            typedef (dict, optional): Type definition that objects should be
+                transformed to match before they are encoded. Defaults to None
+                and objects are not transformed.
+
+        Returns:
+            callable: Function that takes an object and returns the encoded
+                data.
+
+        """
+        def encoder(x):
+            if typedef is not None:
+                x = cls.transform_type(x, typedef)
+            return cls.encode_data(x, metadata)
+        return encoder
+
+    @classmethod
+    def get_specialized_decoder(cls, metadata, typedef=None):
+        r"""Get a function that decodes the data for messages with the same
+        metadata fingerprint as the provided metadata.
+
+        Args:
+            metadata (dict): Message metadata.
+            typedef (dict, optional): Type definition that decoded objects
+                should be transformed to match. Defaults to None.
+
+        Returns:
+            callable: Function that takes encoded data and returns the decoded
+                object.
+
+        """
+        def decoder(x):
+            return cls.transform_type(cls.decode_data(x, metadata), typedef)
+        return decoder
+
     # Methods not to be modified by subclasses
     @classmethod
     def issubtype(cls, t):
@@ -241,7 +358,9 @@ class MetaschemaType(object):
 
     @classmethod
     def encode_type(cls, obj, typedef=None, is_validated=False, **kwargs):
-        r"""Encode an object's type definition.
+        r"""Encode an object's type definition. Type definitions encoded for
+        numpy arrays and scalars are cached based on their type, data type,
+        shape and units.
 
         Args:
             obj (object): Object to encode.
@@ -258,6 +377,20 @@ class MetaschemaType(object):
             dict: Encoded type definition.
 
         """
+        key = None
+        if not kwargs:
+            key = get_numpy_type_key(obj)
+        if key is not None:
+            if not isinstance(typedef, dict):
+                typedef = {}
+            if ('items' in typedef) or ('properties' in typedef):
+                key = None
+            else:
+                key = (cls, key, typedef.get('units', None),
+                       typedef.get('title', None))
+                out = get_cached_numpy_type(key)
+                if out is not None:
+                    return copy.deepcopy(out)
         obj = cls.coerce_type(obj, typedef=typedef)
         if typedef is None:
             typedef = {}
@@ -276,6 +409,8 @@ class MetaschemaType(object):
             else:
                 prop_cls = get_metaschema_property(x)
                 out[x] = prop_cls.encode(obj, typedef=itypedef)
+        if key is not None:
+            cache_numpy_type(key, copy.deepcopy(out))
         return out
 
     @classmethod
@@ -347,6 +482,9 @@ class MetaschemaType(object):
             self._typedef[k] = kwargs.pop(k)
         # Validate
         self.validate_definition(self._typedef)
+        # Specialized encoders/decoders must be rebuilt for the new typedef
+        self._encoders = OrderedDict()
+        self._decoders = OrderedDict()
         return kwargs
 
     @classmethod
@@ -574,14 +712,7 @@ class MetaschemaType(object):
         metadata = cls.encode_type(obj_t, typedef=typedef)
         data = cls.encode_data(obj_t, metadata)
         # Add extra keyword arguments to metadata, ensuring type not overwritten
-        for k, v in kwargs.items():
-            if (k in metadata) and (v != metadata[k]):
-                error_str = ("Key '%s' set by the type encoder.\n"
-                             + " User defined value:\n%s\n"
-                             + "Type encoder defined value:\n%s\n") % (
-                                 k, pprint.pformat(v), pprint.pformat(metadata[k]))
-                raise RuntimeError(error_str)
-            metadata[k] = v
+        metadata = _add_metadata_kwargs(metadata, kwargs)
         return metadata, data
 
     @classmethod
@@ -632,6 +763,77 @@ class MetaschemaType(object):
         out = cls.transform_type(out, typedef)
         return out
 
+    def encode_specialized(self, obj, dont_check=False, **kwargs):
+        r"""Encode an object against the instance's type definition using a
+        specialized encoder for objects with the same fingerprint. The
+        generic encoding is used to create the specialized encoder the first
+        time an object with a new fingerprint is encoded.
+
+        Args:
+            obj (object): Object to encode.
+            dont_check (bool, optional): If True, the object will not be
+                checked against the type definition. Defaults to False.
+            **kwargs: Additional keyword arguments are added to the metadata.
+
+        Returns:
+            tuple(dict, bytes): Encoded object with type definition and data
+                serialized to bytes.
+
+        """
+        typedef = self._typedef
+        obj = self.coerce_type(obj, typedef=typedef, typedef_validated=True,
+                               **kwargs)
+        if not dont_check:
+            self.check_decoded(obj, typedef, raise_errors=True,
+                               typedef_validated=True)
+        key = self.get_fingerprint(obj, typedef=typedef)
+        cached = None
+        if key is not None:
+            cached = _get_specialized(self._encoders, key)
+        if cached is not None:
+            metadata, encoder = cached
+            metadata = copy.copy(metadata)
+            data = encoder(obj)
+        else:
+            obj_t = self.transform_type(obj, typedef)
+            metadata = self.encode_type(obj_t, typedef=typedef)
+            data = self.encode_data(obj_t, metadata)
+            if key is not None:
+                _add_specialized(self._encoders, key, (
+                    copy.deepcopy(metadata),
+                    self.get_specialized_encoder(obj, metadata, typedef=typedef)))
+        metadata = _add_metadata_kwargs(metadata, kwargs)
+        return metadata, data
+
+    def decode_specialized(self, metadata, data, dont_check=False):
+        r"""Decode an object against the instance's type definition using a
+        specialized decoder for messages with the same metadata fingerprint.
+
+        Args:
+            metadata (dict): Meta data describing the data.
+            data (bytes): Encoded data.
+            dont_check (bool, optional): If True, the metadata will not be
+                checked against the type definition. Defaults to False.
+
+        Returns:
+            object: Decoded object.
+
+        """
+        key = None
+        if isinstance(metadata, dict) and (metadata.get('type', None) == self.name):
+            key = self.get_metadata_fingerprint(metadata)
+        if key is None:
+            return self.decode(metadata, data, self._typedef,
+                               typedef_validated=True, dont_check=dont_check)
+        if not dont_check:
+            self.check_encoded(metadata, self._typedef, raise_errors=True,
+                               typedef_validated=True)
+        decoder = _get_specialized(self._decoders, key)
+        if decoder is None:
+            decoder = self.get_specialized_decoder(metadata, typedef=self._typedef)
+            _add_specialized(self._decoders, key, decoder)
+        return decoder(data)
+
     def serialize(self, obj, no_metadata=False, dont_encode=False,
                   dont_check=False, **kwargs):
         r"""Serialize a message.
@@ -659,9 +861,8 @@ class MetaschemaType(object):
             data = obj
             is_raw = True
         else:
-            metadata, data = self.encode(obj, typedef=self._typedef,
-                                         typedef_validated=True,
-                                         dont_check=dont_check, **kwargs)
+            metadata, data = self.encode_specialized(
+                obj, dont_check=dont_check, **kwargs)
             is_raw = False
         for k in ['size', 'data']:
             if k in metadata:
@@ -734,8 +935,7 @@ class MetaschemaType(object):
             return data, metadata
         else:
             data = encoder.decode_json(data)
-            obj = self.decode(metadata, data, self._typedef,
-                              typedef_validated=True, dont_check=dont_check)
+            obj = self.decode_specialized(metadata, data, dont_check=dont_check)
         return obj, metadata
 
     # TESTING METHODS
@@ -1,5 +1,5 @@
 import os
-import copy
+import re
 import numpy as np
 import warnings
 from yggdrasil import tools
@@ -8,7 +8,8 @@ from yggdrasil.metaschema.datatypes import _schema_dir
 from yggdrasil.metaschema.datatypes.JSONObjectMetaschemaType import (
     JSONObjectMetaschemaType)
 from yggdrasil.metaschema.datatypes.PlyMetaschemaType import (
-    PlyDict,
+    PlyDict, ElementArray, get_element_arrays, _columns2array,
+    _lengths2offsets,
     _index_type, _color_type, _coord_type,
     _index_conv, _color_conv, _coord_conv,
     _index_fmt, _color_fmt, _coord_fmt)
@@ -226,7 +227,35 @@ if not os.path.isfile(_schema_file):  # pragma: debug
 
 
 class ObjDict(PlyDict):
-    r"""Enhanced dictionary class for storing Obj information."""
+    r"""Enhanced dictionary class for storing Obj information. Like
+    PlyDict, elements may be stored as arrays until they are accessed.
+    Faces and lines are stored as arrays of the vertex entries with offsets
+    marking the start of each face/line."""
+
+    _index_elements = {'vertex_index': 'vertices',
+                       'vertex_indices': 'vertices',
+                       'texcoord_index': 'texcoords',
+                       'normal_index': 'normals',
+                       'param_index': 'params',
+                       'points': 'vertices',
+                       'curve2Ds': 'params'}
+
+    @classmethod
+    def _faces_from_arrays(cls, index, offsets):
+        r"""Create face arrays from flattened vertex indices and offsets."""
+        return ElementArray(_columns2array(['vertex_index'], [index],
+                                           len(index)),
+                            offsets=offsets)
+
+    @classmethod
+    def _face_arrays(cls, faces):
+        r"""Get the flattened vertex indices and offsets from face arrays."""
+        return faces.data['vertex_index'], faces.offsets
+
+    @classmethod
+    def _face_vertex_indices(cls, faces):
+        r"""Get the lists of vertex indices for face elements."""
+        return [[v['vertex_index'] for v in f] for f in faces]
 
     @property
     def mesh(self):
@@ -349,68 +378,6 @@ class ObjDict(PlyDict):
                 kwargs['normalIndexList'] = array_class(obj_fnormals)
         return smb_class, args, kwargs
 
-    def append(self, solf):
-        r"""Append new ply information to this dictionary.
-
-        Args:
-            solf (ObjDict): Another ply to append to this one.
-
-        """
-        exist_map = {'vertex_index': len(self.get('vertices', [])),
-                     'texcoord_index': len(self.get('texcoords', [])),
-                     'normal_index': len(self.get('normals', [])),
-                     'param_index': len(self.get('params', []))}
-        exist_map.update(points=exist_map['vertex_index'],
-                         curve2Ds=exist_map['param_index'])
-        # Vertex fields
-        for k in ['vertices', 'texcoords', 'normals', 'params']:
-            if k in solf:
-                if k not in self:
-                    self[k] = []
-                self[k] += solf[k]
-        # Points/2D curves
-        for k in ['points', 'curve2Ds']:
-            if k in solf:
-                if k not in self:
-                    self[k] = []
-                for x in solf[k]:
-                    self[k].append([v + exist_map[k] for v in x])
-        # Face/line fields
-        for k in ['lines', 'faces']:
-            if k in solf:
-                if k not in self:
-                    self[k] = []
-                for x in solf[k]:
-                    iele = [{ik: v[ik] + exist_map[ik] for ik in v.keys()} for v in x]
-                    self[k].append(iele)
-        # Curves
-        k = 'curves'
-        if k in solf:
-            if k not in self:
-                self[k] = []
-            for x in solf[k]:
-                iele = copy.deepcopy(x)
-                iele['vertex_indices'] = [v + exist_map['vertex_index']
-                                          for v in x['vertex_indices']]
-        # Surfaces
-        k = 'surfaces'
-        if k in solf:
-            if k not in self:
-                self[k] = []
-            for x in solf[k]:
-                iele = copy.deepcopy(x)
-                iele['vertex_indices'] = [{ik: v[ik] + exist_map[ik] for ik in v.keys()}
-                                          for v in x['vertex_indices']]
-        # Merge material using first in list
-        material = None
-        for x in [self, solf]:
-            if x.get('material', None) is not None:
-                material = x['material']
-                break
-        if material is not None:
-            self['material'] = material
-        return self
-
     def apply_scalar_map(self, *args, **kwargs):
         r"""Set the color of faces in a 3D object based on a scalar map.
         This creates a copy unless no_copy is True.
@@ -545,24 +512,99 @@ class ObjMetaschemaType(JSONObjectMetaschemaType):
             bytes, str: Serialized message.
 
         """
-        # Encode header
+        info = cls.get_encoding_info(obj)
+        header = cls.encode_header(info, comments=comments)
+        body = []
+        for e in info['element_order']:
+            body += cls.encode_elements(obj, e, info)
+        return newline.join(header + body) + newline
+
+    @classmethod
+    def get_encoding_info(cls, obj):
+        r"""Get the information that determines how an object's header and
+        elements are encoded.
+
+        Args:
+            obj (object): Object to encode.
+
+        Returns:
+            dict: Element order and material.
+
+        """
+        return {'element_order': [e for e in _default_element_order if e in obj],
+                'material': obj.get('material', None)}
+
+    @classmethod
+    def encode_header(cls, info, comments=[]):
+        r"""Encode the header lines.
+
+        Args:
+            info (dict): Encoding information returned by get_encoding_info.
+            comments (list, optional): List of comments that should be included in
+                the file header. Defaults to lines describing the automated origin
+                of the file.
+
+        Returns:
+            list: Header lines.
+
+        """
         header = ['# Author ygg_auto',
                   '# Generated by yggdrasil']
         header += ['# ' + c for c in comments]
         header += ['']
-        # Encode body
+        return header
+
+    @classmethod
+    def encode_elements(cls, obj, e, info):
+        r"""Encode the lines for one element type.
+
+        Args:
+            obj (object): Object containing the elements to encode.
+            e (str): Name of the element type to encode.
+            info (dict): Encoding information returned by get_encoding_info.
+
+        Returns:
+            list: Lines for each element of the specified type.
+
+        """
+        if (e not in obj):
+            return []
+        if (e == 'material'):
+            return ['%s %s' % (_map_element2code[e], obj['material'])]
+        code = _map_element2code[e]
+        order = _default_property_order[e]
+        arr = get_element_arrays(obj, e)
+        if (((arr is not None) and (len(arr) > 0)
+             and (arr.data.dtype.names is not None) and (not arr.lists))):
+            props = [k for k in order if k in arr.data.dtype.names]
+            tokens = np.empty((len(arr.data), len(props)), dtype=object)
+            if isinstance(order, tuple) and (arr.offsets is not None):
+                # Faces/lines with the same properties for every vertex
+                for i, k in enumerate(props):
+                    # Add one at write to indexes as .obj is not zero indexed
+                    tokens[:, i] = arr.data[k] + 1
+                entry_fmt = '/'.join([_default_property_formats[k]
+                                      if k in props else '' for k in order])
+                layouts, inverse = np.unique(np.diff(arr.offsets),
+                                             return_inverse=True)
+                row_fmts = np.array([' '.join([code] + n * [entry_fmt])
+                                     for n in layouts.tolist()], dtype=object)
+                fmt = '\n'.join(row_fmts[inverse].tolist())
+                return (fmt % tuple(tokens.ravel().tolist())).split('\n')
+            elif isinstance(order, list) and (arr.offsets is None):
+                # Vertices, normals, etc. with the same properties
+                for i, k in enumerate(props):
+                    tokens[:, i] = arr.data[k]
+                row_fmt = ' '.join([code] + [_default_property_formats[k]
+                                             for k in props])
+                fmt = '\n'.join(len(arr) * [row_fmt])
+                return (fmt % tuple(tokens.ravel().tolist())).split('\n')
         body = []
-        for e in _default_element_order:
-            if (e not in obj):
-                continue
-            if (e == 'material'):
-                body.append('%s %s' % (_map_element2code[e], obj['material']))
-                continue
-            for ie in obj[e]:
-                ivalue = cls._encode_object_property(ie, _default_property_order[e])
-                iline = '%s %s' % (_map_element2code[e], ivalue)
-                body.append(iline.strip())  # Ensure trailing spaces are removed
-        return newline.join(header + body) + newline
+        for ie in obj[e]:
+            ivalue = cls._encode_object_property(ie, order)
+            iline = '%s %s' % (code, ivalue)
+            body.append(iline.strip())  # Ensure trailing spaces are removed
+        return body
         
     @classmethod
     def encode_data_readable(cls, obj, typedef):
@@ -596,29 +638,102 @@ class ObjMetaschemaType(JSONObjectMetaschemaType):
         lines = msg.splitlines()
         metadata = {'comments': []}
         out = {}
-        # Parse
+        # Group lines by element type
         for line_count, line in enumerate(lines):
             if line.startswith('#'):
                 metadata['comments'].append(line)
                 continue
-            values = line.split()
+            values = line.split(None, 1)
             if not values:
                 continue
             if values[0] not in _map_code2element:
                 raise ValueError("Type code '%s' on line %d not understood"
                                  % (values[0], line_count))
             e = _map_code2element[values[0]]
-            if e not in out:
-                out[e] = []
             if e in ['material']:
-                out[e] = values[1]
+                out[e] = values[1].split()[0]
                 continue
-            else:
-                out[e].append(
-                    cls._decode_object_property(values[1:], _default_property_order[e]))
+            out.setdefault(e, [])
+            out[e].append(values[1] if (len(values) > 1) else '')
+        # Parse
+        for e in out.keys():
+            if e != 'material':
+                out[e] = cls.decode_elements(out[e], e)
         # Return
         # out.update(**metadata)
-        return ObjDict(out)
+        return ObjDict.from_dict(out, validate=False)
+
+    @classmethod
+    def decode_elements(cls, lines, e):
+        r"""Decode the elements of one type. Vertices, normals, etc. with
+        the same number of values on each line and faces/lines with the same
+        properties for every vertex are decoded as arrays.
+
+        Args:
+            lines (list): Lines containing the elements without the type code.
+            e (str): Name of the element type.
+
+        Returns:
+            ElementArray, list: Decoded elements.
+
+        """
+        order = _default_property_order[e]
+        out = None
+        if isinstance(order, tuple):
+            out = cls._decode_entries(lines, order)
+        elif isinstance(order, list) and all(isinstance(k, str) for k in order):
+            out = cls._decode_rows(lines, order)
+        if out is None:
+            out = [cls._decode_object_property(x.split(), order) for x in lines]
+        return out
+
+    @classmethod
+    def _decode_rows(cls, lines, order):
+        r"""Decode lines with the same number of scalar values as arrays."""
+        nvalues = set(len(x.split()) for x in lines)
+        if len(nvalues) != 1:
+            return None
+        nvalues = nvalues.pop()
+        if not (0 < nvalues <= len(order)):
+            return None
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            arr = np.fromstring(' '.join(lines), sep=' ')
+        if arr.size != (nvalues * len(lines)):
+            return None
+        arr = arr.reshape(len(lines), nvalues)
+        props = order[:nvalues]
+        columns = [arr[:, i].astype(_default_property_converters[k])
+                   for i, k in enumerate(props)]
+        return ElementArray(_columns2array(props, columns, len(lines)))
+
+    @classmethod
+    def _decode_entries(cls, lines, order):
+        r"""Decode lines of vertex entries that all have the same format
+        (e.g. 'v/t/n') as arrays."""
+        first = lines[0].split()
+        if not first:
+            return None
+        present = [(x != '') for x in first[0].split('/')]
+        if (not present[0]) or (len(present) not in (1, len(order))):
+            return None
+        props = [k for k, p in zip(order, present) if p]
+        entry = '/'.join([r'[+-]?\d+' if p else '' for p in present])
+        line = r'[ \t]*%s(?:[ \t]+%s)*[ \t]*' % (entry, entry)
+        text = '\n'.join(lines)
+        if not re.fullmatch(r'%s(?:\n%s)*' % (line, line), text):
+            return None
+        counts = np.array([len(x.split()) for x in lines], dtype=np.int64)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            arr = np.fromstring(text.replace('/', ' '), sep=' ', dtype=np.int64)
+        if arr.size != (counts.sum() * len(props)):
+            return None
+        # Subtract 1 from indexes because .obj is not zero indexed
+        arr = arr.reshape(-1, len(props)) - 1
+        columns = [arr[:, i] for i in range(len(props))]
+        return ElementArray(_columns2array(props, columns, len(arr)),
+                            offsets=_lengths2offsets(counts))
 
     @classmethod
     def coerce_type(cls, obj, typedef=None, **kwargs):
@@ -1,6 +1,8 @@
 import os
 import copy
+import struct
 import warnings
+import itertools
 import numpy as np
 from yggdrasil import tools
 from yggdrasil.metaschema.encoder import encode_json, decode_json
@@ -24,6 +26,8 @@ _map_ply2py = {'char': 'int8', 'uchar': 'uint8',
                'int': 'int32', 'uint': 'uint32',
                'float': 'float32', 'double': 'float64'}
 _map_py2ply = {v: k for k, v in _map_ply2py.items()}
+_map_plyformat2byteorder = {'binary_little_endian': '<',
+                            'binary_big_endian': '>'}
 _default_element_order = ['material', 'vertices', 'faces', 'edges']
 _default_property_order = {'vertices': ['x', 'y', 'z', 'red', 'green', 'blue'],
                            'faces': [],
@@ -253,8 +257,370 @@ def plural2singular(e_plur):
     return e_sing
 
 
+def _lengths2offsets(lengths):
+    r"""Get the offsets marking the start of each list from the lengths of
+    the lists."""
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+def lists2offsets(lists, dtype=None):
+    r"""Flatten a list of lists into a single array of values and an array of
+    offsets marking the start of each list.
+
+    Args:
+        lists (list): Lists of values (e.g. the vertex indices of each face).
+        dtype (np.dtype, optional): Data type of the returned values.
+            Defaults to the type of the values in the first list.
+
+    Returns:
+        tuple(np.ndarray, np.ndarray): Flattened values and offsets such that
+            the values for list i are values[offsets[i]:offsets[i + 1]].
+
+    """
+    offsets = _lengths2offsets(np.fromiter((len(x) for x in lists),
+                                           dtype=np.int64, count=len(lists)))
+    if dtype is None:
+        dtype = np.int64
+        for x in lists:
+            if len(x) > 0:
+                dtype = np.asarray(x).dtype
+                break
+    values = np.fromiter(itertools.chain.from_iterable(lists), dtype=dtype,
+                         count=int(offsets[-1]))
+    return values, offsets
+
+
+def offsets2lists(values, offsets):
+    r"""Split an array of values into lists using offsets returned by
+    lists2offsets.
+
+    Args:
+        values (np.ndarray, list): Flattened values.
+        offsets (np.ndarray): Offsets marking the start of each list.
+
+    Returns:
+        list: Lists of values.
+
+    """
+    lengths = np.diff(offsets)
+    if (((len(lengths) > 0) and isinstance(values, np.ndarray)
+         and (lengths == lengths[0]).all())):
+        return [list(x) for x in values.reshape(len(lengths), lengths[0])]
+    starts = offsets[:-1].tolist()
+    stops = offsets[1:].tolist()
+    return [list(values[i:j]) for i, j in zip(starts, stops)]
+
+
+def _columns2array(names, columns, size):
+    r"""Create a structured array from columns of values. None is returned
+    if the columns cannot be stored as fields (e.g. if they contain lists)."""
+    columns = [np.asarray(x) for x in columns]
+    if any((x.ndim != 1) or (x.dtype == object) for x in columns):
+        return None
+    out = np.empty(size, dtype=[(k, x.dtype) for k, x in zip(names, columns)])
+    for k, x in zip(names, columns):
+        out[k] = x
+    return out
+
+
+def _items2array(items, names=None):
+    r"""Create an array from a list of scalars or a structured array from a
+    list of dictionaries. None is returned if the dictionaries do not all
+    have the same keys or the values cannot be stored in an array."""
+    if items and isinstance(items[0], dict):
+        if names is None:
+            names = list(items[0].keys())
+            if any(len(x) != len(names) for x in items):
+                return None
+        return _columns2array(names, [[x[k] for x in items] for k in names],
+                              len(items))
+    out = np.array(items)
+    if (out.ndim != 1) or (out.dtype == object):
+        return None
+    return out
+
+
+def _array2items(arr):
+    r"""Get the entries in an array as a list, using a dictionary for each
+    entry in a structured array."""
+    names = arr.dtype.names
+    if names is None:
+        return list(arr)
+    if not names:
+        return [{} for _ in range(len(arr))]
+    return [dict(zip(names, x)) for x in zip(*[list(arr[k]) for k in names])]
+
+
+def _concatenate_entries(arrs, shifts, name=None):
+    r"""Concatenate arrays, adding the shifts for each array to the fields
+    listed in shifts. Shifts for arrays without fields are keyed by name."""
+    names = arrs[0].dtype.names
+    if names is None:
+        if name in shifts:
+            arrs = [x + s for x, s in zip(arrs, shifts[name])]
+        return np.concatenate(arrs)
+    dtype = [(k, np.result_type(*[x.dtype[k] for x in arrs])) for k in names]
+    out = np.empty(sum(len(x) for x in arrs), dtype=dtype)
+    for k in names:
+        parts = [x[k] for x in arrs]
+        if k in shifts:
+            parts = [x + s for x, s in zip(parts, shifts[k])]
+        out[k] = np.concatenate(parts)
+    return out
+
+
+def _concatenate_offsets(offsets):
+    r"""Concatenate offsets for consecutive sets of lists."""
+    out = [offsets[0]]
+    start = offsets[0][-1]
+    for x in offsets[1:]:
+        out.append(x[1:] + start)
+        start += x[-1]
+    return np.concatenate(out)
+
+
+def _gather(buf, positions, dtype):
+    r"""Read values of a data type starting at byte positions in a buffer."""
+    idx = positions[:, None] + np.arange(dtype.itemsize)
+    return buf[idx].view(dtype).ravel()
+
+
+def _shift_indices(x, shifts, name=None):
+    r"""Get a copy of an element with the shifts added to the properties
+    listed in shifts. Shifts for entries in elements that are lists of
+    scalars are keyed by None."""
+    if isinstance(x, dict):
+        return {k: _shift_indices(v, shifts, k) for k, v in x.items()}
+    elif isinstance(x, (list, tuple)):
+        return [_shift_indices(v, shifts, name) for v in x]
+    elif name in shifts:
+        return x + shifts[name]
+    return x
+
+
+class ElementArray(object):
+    r"""Array storage for the elements of one type (e.g. vertices or faces).
+
+    Args:
+        data (np.ndarray): Structured array with a field for each scalar
+            property of the elements or, if offsets is provided, an array
+            of the entries in the lists that make up the elements.
+        offsets (np.ndarray, optional): Offsets marking the start of each
+            element in data for elements that are lists (see lists2offsets).
+            Defaults to None.
+        lists (dict, optional): Flattened values and offsets for each list
+            property of the elements. Defaults to {}.
+        order (list, optional): Order of the properties in each element.
+            Defaults to the fields in data followed by the list properties.
+
+    Attributes:
+        data (np.ndarray): Scalar properties or list entries.
+        offsets (np.ndarray): Offsets for elements that are lists.
+        lists (dict): Flattened values and offsets for list properties.
+        order (list): Order of the properties in each element.
+
+    """
+
+    def __init__(self, data, offsets=None, lists=None, order=None):
+        if lists is None:
+            lists = {}
+        if order is None:
+            order = list(data.dtype.names or []) + list(lists.keys())
+        self.data = data
+        self.offsets = offsets
+        self.lists = lists
+        self.order = order
+
+    def __len__(self):
+        if self.offsets is not None:
+            return len(self.offsets) - 1
+        return len(self.data)
+
+    @classmethod
+    def from_list(cls, elements, order=None):
+        r"""Create arrays from a list of elements.
+
+        Args:
+            elements (list): Dictionaries of properties or lists of entries
+                for each element.
+            order (list, optional): Properties that should be included.
+                Defaults to None and every element must have the same
+                properties.
+
+        Returns:
+            ElementArray: Arrays containing the elements, None if the
+                elements cannot be stored as arrays.
+
+        """
+        try:
+            if elements and not isinstance(elements[0], dict):
+                offsets = _lengths2offsets(np.fromiter(
+                    (len(x) for x in elements), dtype=np.int64,
+                    count=len(elements)))
+                data = _items2array(
+                    list(itertools.chain.from_iterable(elements)), names=order)
+                if data is None:
+                    return None
+                return cls(data, offsets=offsets)
+            if order is None:
+                order = list(elements[0].keys()) if elements else []
+                if any(len(x) != len(order) for x in elements):
+                    return None
+            names = []
+            columns = []
+            lists = {}
+            for k in order:
+                column = [x[k] for x in elements]
+                if column and isinstance(column[0], (list, tuple, np.ndarray)):
+                    offsets = _lengths2offsets(np.fromiter(
+                        (len(x) for x in column), dtype=np.int64,
+                        count=len(column)))
+                    values = _items2array(
+                        list(itertools.chain.from_iterable(column)))
+                    if values is None:
+                        return None
+                    lists[k] = (values, offsets)
+                else:
+                    names.append(k)
+                    columns.append(column)
+            data = _columns2array(names, columns, len(elements))
+        except (KeyError, TypeError, ValueError):
+            return None
+        if data is None:
+            return None
+        return cls(data, lists=lists, order=order)
+
+    def to_list(self):
+        r"""Get the elements as a list.
+
+        Returns:
+            list: Dictionaries of properties or lists of entries for each
+                element.
+
+        """
+        if self.offsets is not None:
+            entries = self.data
+            if entries.dtype.names is not None:
+                entries = _array2items(entries)
+            return offsets2lists(entries, self.offsets)
+        if not self.order:
+            return [{} for _ in range(len(self))]
+        columns = []
+        for k in self.order:
+            if k in self.lists:
+                values, offsets = self.lists[k]
+                if values.dtype.names is not None:
+                    values = _array2items(values)
+                columns.append(offsets2lists(values, offsets))
+            else:
+                columns.append(list(self.data[k]))
+        return [dict(zip(self.order, x)) for x in zip(*columns)]
+
+    def set_fields(self, names, columns):
+        r"""Get a copy with scalar properties added or replaced.
+
+        Args:
+            names (list): Names of the properties.
+            columns (list): Values of each property for every element.
+
+        Returns:
+            ElementArray: Elements with the updated properties.
+
+        """
+        keep = [k for k in self.data.dtype.names if k not in names]
+        data = _columns2array(keep + names,
+                              [self.data[k] for k in keep] + list(columns),
+                              len(self.data))
+        order = self.order + [k for k in names if k not in self.order]
+        return ElementArray(data, lists=self.lists, order=order)
+
+    @classmethod
+    def concatenate(cls, arrays, shifts=None):
+        r"""Concatenate arrays containing elements of the same type.
+
+        Args:
+            arrays (list): ElementArray instances.
+            shifts (dict, optional): Values that should be added to a
+                property (e.g. vertex indices) in each set of elements,
+                keyed by the property name. Shifts for entries in elements
+                that are lists of scalars are keyed by None. Defaults to {}.
+
+        Returns:
+            ElementArray: Concatenated elements, None if the elements do not
+                all have the same properties.
+
+        """
+        if shifts is None:
+            shifts = {}
+        idx = [i for i, x in enumerate(arrays) if len(x) > 0]
+        if not idx:
+            return arrays[0]
+        shifts = {k: [v[i] for i in idx] for k, v in shifts.items()}
+        arrays = [arrays[i] for i in idx]
+        x0 = arrays[0]
+        for x in arrays[1:]:
+            if ((x.order != x0.order) or (list(x.lists) != list(x0.lists))
+                    or ((x.offsets is None) != (x0.offsets is None))
+                    or (x.data.dtype.names != x0.data.dtype.names)
+                    or any(x.lists[k][0].dtype.names != x0.lists[k][0].dtype.names
+                           for k in x0.lists)):
+                return None
+        data = _concatenate_entries([x.data for x in arrays], shifts)
+        offsets = None
+        if x0.offsets is not None:
+            offsets = _concatenate_offsets([x.offsets for x in arrays])
+        lists = {}
+        for k in x0.lists:
+            lists[k] = (
+                _concatenate_entries([x.lists[k][0] for x in arrays],
+                                     shifts, name=k),
+                _concatenate_offsets([x.lists[k][1] for x in arrays]))
+        return cls(data, offsets=offsets, lists=lists, order=x0.order)
+
+
+def get_element_arrays(obj, element_name, property_order=None):
+    r"""Get the elements of one type in a Ply/Obj dictionary as arrays
+    without converting elements stored as arrays to lists.
+
+    Args:
+        obj (dict): Ply/Obj dictionary.
+        element_name (str): Name of the element type.
+        property_order (list, optional): Properties that should be included
+            if the elements are stored as a list. Defaults to None and every
+            element must have the same properties.
+
+    Returns:
+        ElementArray: Arrays containing the elements, None if the elements
+            cannot be stored as arrays.
+
+    """
+    out = dict.__getitem__(obj, element_name)
+    if not isinstance(out, ElementArray):
+        out = ElementArray.from_list(out, order=property_order)
+    return out
+
+
 class PlyDict(dict):
-    r"""Enhanced dictionary class for storing Ply information."""
+    r"""Enhanced dictionary class for storing Ply information.
+
+    Elements (e.g. vertices or faces) may be stored as arrays (see
+    ElementArray). They are converted to lists of dictionaries the first
+    time they are accessed through the dictionary interface (e.g.
+    ply['vertices']) and stored as lists from then on. Objects that are
+    decoded or created with from_arrays, merge or append store their
+    elements as arrays so that these methods, the array accessors (e.g.
+    get_face_array), and encoding do not loop over elements in Python.
+    Elements that are already stored as lists are extended in place by
+    merge and append.
+    """
+
+    # Elements that index properties refer to. Elements with entries that
+    # are indices (rather than dictionaries) are keyed by the element name.
+    _index_elements = {'vertex_index': 'vertices',
+                       'vertex1': 'vertices',
+                       'vertex2': 'vertices'}
 
     def __init__(self, *args, **kwargs):
         super(PlyDict, self).__init__(*args, **kwargs)
@@ -262,10 +628,215 @@ class PlyDict(dict):
         self.setdefault('faces', [])
         self._type_class.validate(self)
 
+    def __getitem__(self, key):
+        out = super(PlyDict, self).__getitem__(key)
+        if isinstance(out, ElementArray):
+            out = out.to_list()
+            super(PlyDict, self).__setitem__(key, out)
+        return out
+
+    def __iter__(self):
+        # Defining __iter__ makes dict(x) and {**x} use __getitem__
+        return super(PlyDict, self).__iter__()
+
+    def __eq__(self, other):
+        return self.as_dict() == other
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __repr__(self):
+        return repr(self.as_dict())
+
+    def __reduce__(self):
+        return (self.__class__.from_dict, (dict(dict.items(self)), False))
+
+    def __deepcopy__(self, memo):
+        return self.__class__.from_dict(
+            copy.deepcopy(dict(dict.items(self)), memo), validate=False)
+
+    def _materialize(self):
+        r"""Convert all elements stored as arrays to lists."""
+        for k in self.keys():
+            self[k]
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def items(self):
+        self._materialize()
+        return super(PlyDict, self).items()
+
+    def values(self):
+        self._materialize()
+        return super(PlyDict, self).values()
+
+    def pop(self, key, *args):
+        if key in self:
+            self[key]
+        return super(PlyDict, self).pop(key, *args)
+
+    def popitem(self):
+        self._materialize()
+        return super(PlyDict, self).popitem()
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        return super(PlyDict, self).setdefault(key, default)
+
+    def copy(self):
+        return self.as_dict()
+
+    @classmethod
+    def from_dict(cls, in_dict, validate=True):
+        r"""Get a version of the object from a dictionary.
+
+        Args:
+            in_dict (dict): Dictionary of elements.
+            validate (bool, optional): If False, the dictionary is not
+                validated against the schema. This should only be used for
+                dictionaries that are known to be valid (e.g. those produced
+                by decoding a serialized object). Defaults to True.
+
+        Returns:
+            PlyDict: Dictionary of elements.
+
+        """
+        if validate:
+            return cls(**in_dict)
+        out = cls.__new__(cls)
+        dict.update(out, dict.items(in_dict))
+        dict.setdefault(out, 'vertices', [])
+        dict.setdefault(out, 'faces', [])
+        return out
+
+    @classmethod
+    def from_arrays(cls, vertices, faces=None, edges=None, material=None):
+        r"""Create a dictionary from arrays of elements. The arrays are
+        stored without being converted to lists.
+
+        Args:
+            vertices (np.ndarray): Vertices as either a structured array with
+                a field for each vertex property or an array with shape
+                (nvert, 3) containing the x, y, z coordinates.
+            faces (np.ndarray, tuple, optional): Vertex indices for each face
+                as either an array with shape (nface, nvert_per_face) or a
+                tuple of flattened indices and offsets (see lists2offsets).
+            edges (np.ndarray, optional): Structured array with a field for
+                each edge property.
+            material (str, optional): Material name.
+
+        Returns:
+            PlyDict: Dictionary of elements.
+
+        Raises:
+            ValueError: If a face refers to a vertex that does not exist.
+
+        """
+        vertices = np.asarray(vertices)
+        if vertices.dtype.names is None:
+            vertices = np.rec.fromarrays(
+                np.atleast_2d(vertices).T, names=['x', 'y', 'z'])
+        nvert = len(vertices)
+        out = {'vertices': ElementArray(vertices)}
+        if faces is None:
+            faces = lists2offsets([])
+        elif not isinstance(faces, tuple):
+            faces = np.asarray(faces)
+            faces = (faces.ravel(),
+                     faces.shape[1] * np.arange(len(faces) + 1,
+                                                dtype=np.int64))
+        index, offsets = (np.asarray(x) for x in faces)
+        if (len(index) > 0) and ((index.min() < 0) or (index.max() >= nvert)):
+            raise ValueError("Face vertex indices must be between 0 and %d."
+                             % (nvert - 1))
+        out['faces'] = cls._faces_from_arrays(index, offsets)
+        if edges is not None:
+            out['edges'] = ElementArray(np.asarray(edges))
+        if material is not None:
+            out['material'] = material
+        return cls.from_dict(out, validate=False)
+
     @classmethod
-    def from_dict(cls, in_dict):
-        r"""Get a version of the object from a dictionary."""
-        out = cls(**in_dict)
+    def _faces_from_arrays(cls, index, offsets):
+        r"""Create face arrays from flattened vertex indices and offsets."""
+        return ElementArray(np.empty(len(offsets) - 1, dtype=[]),
+                            lists={'vertex_index': (index, offsets)})
+
+    @classmethod
+    def _face_arrays(cls, faces):
+        r"""Get the flattened vertex indices and offsets from face arrays."""
+        return faces.lists['vertex_index']
+
+    @classmethod
+    def _face_vertex_indices(cls, faces):
+        r"""Get the lists of vertex indices for face elements."""
+        return [f['vertex_index'] for f in faces]
+
+    def get_element_array(self, element_name, property_order=None):
+        r"""Get a structured array containing the scalar properties of an
+        element type.
+
+        Args:
+            element_name (str): Name of the element type.
+            property_order (list, optional): Properties that should be
+                included. Defaults to all of the scalar properties of the
+                elements.
+
+        Returns:
+            np.ndarray: Structured array with a field for each property.
+
+        Raises:
+            ValueError: If the elements do not all have the properties.
+
+        """
+        order = property_order
+        elements = dict.__getitem__(self, element_name)
+        if (order is None) and elements and isinstance(elements, list):
+            order = list(elements[0].keys())
+        elements = get_element_arrays(self, element_name, property_order=order)
+        if elements is None:
+            raise ValueError("The '%s' elements do not all have the same "
+                             "properties." % element_name)
+        if property_order is None:
+            property_order = get_key_order(
+                [k for k in elements.order if k not in elements.lists],
+                _default_property_order.get(element_name, []))
+        if not property_order:
+            return np.zeros(len(elements), dtype=[])
+        return np.rec.fromarrays([elements.data[k] for k in property_order],
+                                 names=property_order)
+
+    def get_face_array(self):
+        r"""Get the vertex indices for all of the faces.
+
+        Returns:
+            tuple(np.ndarray, np.ndarray): Flattened vertex indices and
+                offsets marking the start of each face (see lists2offsets).
+
+        """
+        faces = get_element_arrays(self, 'faces')
+        if faces is None:
+            return lists2offsets(self._face_vertex_indices(self['faces']))
+        if len(faces) == 0:
+            return lists2offsets([])
+        return self._face_arrays(faces)
+
+    def get_vertex_coords(self):
+        r"""Get the coordinates of the vertices.
+
+        Returns:
+            np.ndarray: Array of x, y, z coordinates with shape (nvert, 3).
+
+        """
+        verts = self.get_element_array('vertices',
+                                       property_order=['x', 'y', 'z'])
+        out = np.empty((len(verts), 3), 'float64')
+        for i, k in enumerate('xyz'):
+            out[:, i] = verts[k]
         return out
 
     def as_dict(self):
@@ -284,9 +855,9 @@ class PlyDict(dict):
 
         """
         if element_name in self:
-            return len(self[element_name])
+            return len(dict.__getitem__(self, element_name))
         elif singular2plural(element_name) in self:
-            return len(self[singular2plural(element_name)])
+            return len(dict.__getitem__(self, singular2plural(element_name)))
         else:
             raise ValueError("'%s' is not a valid property." % element_name)
 
@@ -303,12 +874,8 @@ class PlyDict(dict):
     @property
     def bounds(self):
         r"""tuple: Mins/maxs of vertices in each dimension."""
-        mins = np.empty(3, 'float64')
-        maxs = np.empty(3, 'float64')
-        for i, x in enumerate('xyz'):
-            mins[i] = min([v[x] for v in self['vertices']])
-            maxs[i] = max([v[x] for v in self['vertices']])
-        return mins, maxs
+        coords = self.get_vertex_coords()
+        return coords.min(axis=0), coords.max(axis=0)
 
     @property
     def mesh(self):
@@ -483,28 +1050,16 @@ class PlyDict(dict):
         Args:
             solf (PlyDict): Another ply to append to this one.
 
+        Returns:
+            PlyDict: This dictionary.
+
         """
-        nvert = self.count_elements('vertices')
-        # Vertex fields
-        self['vertices'] += solf['vertices']
-        # Face fields
-        for f in solf['faces']:
-            self['faces'].append({'vertex_index': [v + nvert for v in
-                                                   f['vertex_index']]})
-        # Edge fields
-        if 'edges' in solf:
-            if 'edges' not in self:
-                self['edges'] = []
-            for e in solf['edges']:
-                iedge = {'vertex1': e['vertex1'] + nvert,
-                         'vertex2': e['vertex2'] + nvert}
-                for k in ['red', 'green', 'blue']:
-                    if k in e:
-                        iedge[k] = e[k]
-                self['edges'].append(iedge)
+        return self.merge([solf], no_copy=True)
 
     def merge(self, ply_list, no_copy=False):
-        r"""Merge a list of ply dictionaries.
+        r"""Merge a list of ply dictionaries. Elements stored as arrays are
+        concatenated and the indices in appended elements are shifted by
+        the number of elements they refer to in the preceding dictionaries.
 
         Args:
             ply_list (list): Ply dictionaries.
@@ -523,8 +1078,51 @@ class PlyDict(dict):
             out = self
         else:
             out = copy.deepcopy(self)
-        for x in ply_list:
-            out.append(x)
+        plys = [out] + ply_list
+        elements = []
+        for x in plys:
+            for k, v in dict.items(x):
+                if isinstance(v, (list, ElementArray)) and (k not in elements):
+                    elements.append(k)
+        # Number of each referenced element preceding each dictionary
+        starts = {}
+        for e in set(self._index_elements.values()):
+            counts = [len(dict.get(x, e, [])) for x in plys]
+            starts[e] = [0] + np.cumsum(counts).tolist()
+        for e in elements:
+            idx = [i for i, x in enumerate(plys) if e in x]
+            shifts = {k: [starts[v][i] for i in idx]
+                      for k, v in self._index_elements.items()}
+            if e in self._index_elements:
+                shifts[None] = [starts[self._index_elements[e]][i]
+                                for i in idx]
+            if not isinstance(dict.get(out, e, None), list):
+                arrays = [get_element_arrays(plys[i], e) for i in idx]
+                if all(x is not None for x in arrays):
+                    arrays = ElementArray.concatenate(arrays, shifts)
+                    if arrays is not None:
+                        dict.__setitem__(out, e, arrays)
+                        continue
+            # Elements stored as lists are extended in place
+            if idx[0] != 0:
+                shifts = {k: [0] + v for k, v in shifts.items()}
+                idx = [0] + idx
+            target = out.setdefault(e, [])
+            for j, i in enumerate(idx[1:], 1):
+                x = dict.__getitem__(plys[i], e)
+                if isinstance(x, ElementArray):
+                    x = ElementArray.concatenate(
+                        [x], {k: [v[j]] for k, v in shifts.items()}).to_list()
+                    target += x
+                else:
+                    ishifts = {k: v[j] for k, v in shifts.items()}
+                    target += [_shift_indices(v, ishifts) for v in x]
+        # Merge material using first in list
+        if out.get('material', None) is None:
+            for x in ply_list:
+                if x.get('material', None) is not None:
+                    out['material'] = x['material']
+                    break
         return out
 
     def apply_scalar_map(self, scalar_arr, color_map=None,
@@ -557,42 +1155,29 @@ class PlyDict(dict):
         """
         from matplotlib import cm
         from matplotlib import colors as mpl_colors
+        index, offsets = self.get_face_array()
+        lengths = np.diff(offsets)
+        scalar_arr = np.asarray(scalar_arr, dtype='float64')[:len(lengths)]
         # Scale by area
         if scale_by_area:
-            scalar_arr = copy.deepcopy(scalar_arr)
-            for i, f in enumerate(self['faces']):
-                if _as_obj:
-                    fv = [_f['vertex_index'] for _f in f]
-                else:
-                    fv = f['vertex_index']
-                if len(fv) > 3:
-                    raise NotImplementedError("Area calc not implemented "
-                                              + "for faces above triangle.")
-                v0 = np.array([self['vertices'][fv[0]][k] for k in 'xyz'])
-                v1 = np.array([self['vertices'][fv[1]][k] for k in 'xyz'])
-                v2 = np.array([self['vertices'][fv[2]][k] for k in 'xyz'])
-                a = np.sqrt(np.sum((v0 - v1)**2))
-                b = np.sqrt(np.sum((v1 - v2)**2))
-                c = np.sqrt(np.sum((v2 - v0)**2))
-                s = (a + b + c) / 2.0
-                area = np.sqrt(s * (s - a) * (s - b) * (s - c))
-                scalar_arr[i] = area * scalar_arr[i]
+            if (lengths != 3).any():
+                raise NotImplementedError("Area calc not implemented "
+                                          + "for faces above triangle.")
+            coords = self.get_vertex_coords()
+            tri = coords[index.reshape(-1, 3)]
+            a = np.sqrt(np.sum((tri[:, 0] - tri[:, 1])**2, axis=1))
+            b = np.sqrt(np.sum((tri[:, 1] - tri[:, 2])**2, axis=1))
+            c = np.sqrt(np.sum((tri[:, 2] - tri[:, 0])**2, axis=1))
+            s = (a + b + c) / 2.0
+            area = np.sqrt(s * (s - a) * (s - b) * (s - c))
+            scalar_arr = area * scalar_arr
         # Map vertices onto faces
-        vertex_scalar = [[] for x in self['vertices']]
-        if _as_obj:
-            for i in range(len(self['faces'])):
-                for v in self['faces'][i]:
-                    vertex_scalar[v['vertex_index']].append(scalar_arr[i])
-        else:
-            for i in range(len(self['faces'])):
-                for v in self['faces'][i]['vertex_index']:
-                    vertex_scalar[v].append(scalar_arr[i])
-        for i in range(len(vertex_scalar)):
-            if len(vertex_scalar[i]) == 0:
-                vertex_scalar[i] = 0
-            else:
-                vertex_scalar[i] = np.mean(vertex_scalar[i])
-        vertex_scalar = np.array(vertex_scalar)
+        nvert = self.nvert
+        counts = np.bincount(index, minlength=nvert)
+        totals = np.bincount(index, minlength=nvert,
+                             weights=np.repeat(scalar_arr, lengths))
+        vertex_scalar = np.zeros(nvert, 'float64')
+        np.divide(totals, counts, out=vertex_scalar, where=(counts > 0))
         if scaling == 'log':
             vertex_scalar = np.ma.MaskedArray(vertex_scalar, vertex_scalar <= 0)
         # Get color scaling
@@ -612,14 +1197,19 @@ class PlyDict(dict):
             raise Exception("Scaling must be 'linear' or 'log'.")
         m = cm.ScalarMappable(norm=norm, cmap=cmap)
         # Scale colors
-        vertex_colors = (255 * m.to_rgba(vertex_scalar)).astype('int')[:, :3].tolist()
+        vertex_colors = (255 * m.to_rgba(vertex_scalar))[:, :3].astype(_color_conv)
         if no_copy:
             out = self
         else:
             out = copy.deepcopy(self)
-        for i, c in enumerate(vertex_colors):
-            for j, k in enumerate(['red', 'green', 'blue']):
-                out['vertices'][i][k] = c[j]
+        verts = dict.__getitem__(out, 'vertices')
+        if isinstance(verts, ElementArray):
+            dict.__setitem__(out, 'vertices', verts.set_fields(
+                ['red', 'green', 'blue'], list(vertex_colors.T)))
+        else:
+            for v, c in zip(verts, vertex_colors):
+                for j, k in enumerate(['red', 'green', 'blue']):
+                    v[k] = c[j]
         return out
 
 
@@ -685,17 +1275,54 @@ class PlyMetaschemaType(JSONObjectMetaschemaType):
             newline (str, optional): String that should be used to delineated end
                 of lines. Defaults to '\n'.
             plyformat (str, optional): String describing the ply format and version.
-                Defaults to 'ascii 1.0'.
+                Defaults to 'ascii 1.0'. If the format is
+                'binary_little_endian 1.0' or 'binary_big_endian 1.0', the
+                elements are encoded as binary data.
 
         Returns:
-            bytes, str: Serialized message.
+            bytes, str: Serialized message. Bytes are returned for binary
+                formats.
+
+        """
+        info = cls.get_encoding_info(obj, element_order=element_order,
+                                     property_order=property_order)
+        header = cls.encode_header(info, comments=comments,
+                                   plyformat=plyformat)
+        byteorder = _map_plyformat2byteorder.get(plyformat.split()[0], None)
+        if byteorder is not None:
+            body = [cls.encode_elements_binary(obj, e, info, byteorder)
+                    for e in info['element_order']]
+            return (newline.join(header) + newline).encode('utf-8') + b''.join(body)
+        body = []
+        for e in info['element_order']:
+            body += cls.encode_elements(obj, e, info)
+        return newline.join(header + body) + newline
+
+    @classmethod
+    def get_encoding_info(cls, obj, element_order=None, property_order=None):
+        r"""Get the information that determines how an object's header and
+        elements are encoded.
+
+        Args:
+            obj (object): Object to encode.
+            element_order (list, optional): Order that elements should be written
+                to the file. If not provided, the order is determined based on
+                typical ply files with remaining elements output in sorted order.
+            property_order (dict, optional): Dictionary of property order for
+                each element determining the order that they properties should
+                be written to the file. If not provided, the orders are determined
+                based on typical ply files with remaining elements output in sorted
+                order.
+
+        Returns:
+            dict: Element order, property order, number of each element, ply
+                type of each element property, and the elements as arrays.
+
+        Raises:
+            ValueError: If the elements of one type do not all have the
+                properties that should be written.
 
         """
-        # Add comments to identify generated files
-        default_comments = ['author ygg_auto', 'File generated by yggdrasil']
-        for c in default_comments:
-            if c not in comments:
-                comments.append(c)
         # Default order to allow user definited elements
         if element_order is None:
             element_order = get_key_order(obj.keys(), _default_element_order)
@@ -704,65 +1331,226 @@ class PlyMetaschemaType(JSONObjectMetaschemaType):
             for e in element_order:
                 if e == 'material':
                     continue
-                assert(isinstance(obj[e], (list, tuple)))
-                if len(obj[e]) == 0:
+                elements = dict.__getitem__(obj, e)
+                assert(isinstance(elements, (list, tuple, ElementArray)))
+                if len(elements) == 0:
                     continue
-                property_order[e] = get_key_order(obj[e][0].keys(),
+                if isinstance(elements, ElementArray):
+                    keys = elements.order
+                else:
+                    keys = elements[0].keys()
+                property_order[e] = get_key_order(keys,
                                                   _default_property_order.get(e, []))
         # Get information needed
+        arrays = {}
         size_map = {}
         type_map = {}
         for e in element_order:
             if e == 'material':
                 continue
-            assert(isinstance(obj[e], (list, tuple)))
             type_map[e] = {}
-            size_map[e] = len(obj[e])
+            size_map[e] = len(dict.__getitem__(obj, e))
             if size_map[e] == 0:
                 continue
+            arrays[e] = get_element_arrays(obj, e,
+                                           property_order=property_order[e])
+            if arrays[e] is None:
+                raise ValueError("The '%s' elements do not all have the "
+                                 "properties %s." % (e, property_order[e]))
             for p in property_order[e]:
-                if isinstance(obj[e][0][p], list):
-                    subtype = translate_py2ply(obj[e][0][p][0])
+                if p in arrays[e].lists:
+                    values = arrays[e].lists[p][0]
+                    subtype = translate_py2ply(values.dtype.type(0))
                     type_map[e][p] = 'list uchar %s' % subtype
                 else:
-                    type_map[e][p] = translate_py2ply(obj[e][0][p])
-        # Encode header
+                    type_map[e][p] = translate_py2ply(arrays[e].data[p][0])
+        return {'element_order': element_order, 'property_order': property_order,
+                'size_map': size_map, 'type_map': type_map, 'arrays': arrays,
+                'material': obj.get('material', None)}
+
+    @classmethod
+    def encode_header(cls, info, comments=[], plyformat='ascii 1.0'):
+        r"""Encode the header lines.
+
+        Args:
+            info (dict): Encoding information returned by get_encoding_info.
+            comments (list, optional): List of comments that should be included in
+                the file header. Defaults to lines describing the automated origin
+                of the file.
+            plyformat (str, optional): String describing the ply format and version.
+                Defaults to 'ascii 1.0'.
+
+        Returns:
+            list: Header lines.
+
+        """
+        # Add comments to identify generated files
+        default_comments = ['author ygg_auto', 'File generated by yggdrasil']
+        for c in default_comments:
+            if c not in comments:
+                comments.append(c)
         header = ['ply', 'format %s' % plyformat]
         header += ['comment ' + c for c in comments]
-        for e in element_order:
+        for e in info['element_order']:
             if e == 'material':
-                header += ['comment material: %s' % obj[e]]
+                header += ['comment material: %s' % info['material']]
             else:
                 e_sing = plural2singular(e)
-                header.append('element %s %d' % (e_sing, size_map[e]))
-                if size_map[e] > 0:
-                    for p in property_order[e]:
-                        header.append('property %s %s' % (type_map[e][p], p))
+                header.append('element %s %d' % (e_sing, info['size_map'][e]))
+                if info['size_map'][e] > 0:
+                    for p in info['property_order'][e]:
+                        header.append('property %s %s'
+                                      % (info['type_map'][e][p], p))
         header.append('end_header')
-        # Encode body
-        body = []
-        for e in element_order:
-            if (e not in obj) or (e == 'material'):
-                continue
-            for x in obj[e]:
-                iline = ''
-                for p in property_order[e]:
-                    if type_map[e][p].startswith('list'):
-                        vars = type_map[e][p].split()
-                        ientry = x[p]
-                        ifmt = translate_ply2fmt(vars[2])
-                        iline += translate_ply2fmt(vars[1]) % len(ientry)
-                        for ix in ientry:
-                            iline += ifmt % ix
-                    else:
-                        # if p not in x:
-                        #     if p in ['red', 'green', 'blue']:
-                        #         rgb_index = ['red', 'green', 'blue'].index(p)
-                        #         x[p] = default_rgb[rgb_index]
-                        iline += translate_ply2fmt(type_map[e][p]) % x[p]
-                body.append(iline.strip())  # Ensure trailing spaces are removed
-        return newline.join(header + body) + newline
-        
+        return header
+
+    @staticmethod
+    def get_row_layouts(arr, props):
+        r"""Get the unique combinations of list lengths in the rows for an
+        element type.
+
+        Args:
+            arr (ElementArray): Elements.
+            props (list): Names of the properties in the element.
+
+        Returns:
+            tuple(list, np.ndarray): Lengths of the list properties in each
+                unique layout and the index of the layout for each row.
+
+        """
+        counts = [np.diff(arr.lists[p][1]) for p in props if p in arr.lists]
+        if not counts:
+            return [[]], np.zeros(len(arr), dtype=np.int64)
+        layouts, inverse = np.unique(np.stack(counts, axis=1), axis=0,
+                                     return_inverse=True)
+        return layouts.tolist(), inverse.ravel()
+
+    @classmethod
+    def encode_elements(cls, obj, e, info):
+        r"""Encode the lines for one element type.
+
+        Args:
+            obj (object): Object containing the elements to encode.
+            e (str): Name of the element type to encode.
+            info (dict): Encoding information returned by get_encoding_info.
+
+        Returns:
+            list: Lines for each element of the specified type.
+
+        """
+        arr = info['arrays'].get(e, None)
+        if (e == 'material') or (arr is None):
+            return []
+        props = info['property_order'][e]
+        fmts = [translate_ply2fmt(info['type_map'][e][p].split()[-1]).strip()
+                for p in props]
+        # Values for each row in order with list lengths preceding lists
+        ntokens = np.full(len(arr), len(props), dtype=np.int64)
+        for p in props:
+            if p in arr.lists:
+                ntokens += np.diff(arr.lists[p][1])
+        row_offsets = _lengths2offsets(ntokens)
+        tokens = np.empty(row_offsets[-1], dtype=object)
+        pos = row_offsets[:-1]
+        for p in props:
+            if p in arr.lists:
+                values, offsets = arr.lists[p]
+                count = np.diff(offsets)
+                tokens[pos] = count
+                tokens[np.repeat(pos + 1 - offsets[:-1], count)
+                       + np.arange(offsets[-1])] = values
+                pos = pos + 1 + count
+            else:
+                tokens[pos] = arr.data[p]
+                pos = pos + 1
+        # Format strings depend on the length of the lists in each row
+        layouts, inverse = cls.get_row_layouts(arr, props)
+        row_fmts = []
+        for layout in layouts:
+            counts = iter(layout)
+            row_fmt = []
+            for p, f in zip(props, fmts):
+                if p in arr.lists:
+                    row_fmt += ['%d'] + [f] * next(counts)
+                else:
+                    row_fmt.append(f)
+            row_fmts.append(' '.join(row_fmt))
+        fmt = '\n'.join(np.array(row_fmts, dtype=object)[inverse].tolist())
+        return (fmt % tuple(tokens.tolist())).split('\n')
+
+    @staticmethod
+    def get_element_dtype(props, types, byteorder, counts=None):
+        r"""Get the structured data type for an element type in a binary
+        ply file.
+
+        Args:
+            props (list): Names of the properties in the element.
+            types (list): Ply types of the properties in the element.
+            byteorder (str): Byte order character ('<' or '>').
+            counts (list, optional): Number of entries in each list property.
+                Defaults to None and is required if there are list properties.
+
+        Returns:
+            np.dtype: Structured data type.
+
+        """
+        fields = []
+        counts = iter(counts or [])
+        for i, (p, t) in enumerate(zip(props, types)):
+            vars = t.split()
+            if vars[0] == 'list':
+                fields += [('_count%d' % i,
+                            np.dtype(_map_ply2py[vars[1]]).newbyteorder(byteorder)),
+                           (p, np.dtype(_map_ply2py[vars[2]]).newbyteorder(byteorder),
+                            (next(counts),))]
+            else:
+                fields.append((p, np.dtype(_map_ply2py[t]).newbyteorder(byteorder)))
+        return np.dtype(fields)
+
+    @classmethod
+    def encode_elements_binary(cls, obj, e, info, byteorder='<'):
+        r"""Encode one element type as binary data.
+
+        Args:
+            obj (object): Object containing the elements to encode.
+            e (str): Name of the element type to encode.
+            info (dict): Encoding information returned by get_encoding_info.
+            byteorder (str, optional): Byte order character ('<' or '>').
+                Defaults to '<'.
+
+        Returns:
+            bytes: Encoded elements.
+
+        """
+        arr = info['arrays'].get(e, None)
+        if (e == 'material') or (arr is None):
+            return b''
+        props = info['property_order'][e]
+        types = [info['type_map'][e][p] for p in props]
+        # Rows with lists of different lengths are encoded in groups
+        layouts, inverse = cls.get_row_layouts(arr, props)
+        dtypes = [cls.get_element_dtype(props, types, byteorder, counts=x)
+                  for x in layouts]
+        row_offsets = _lengths2offsets(
+            np.array([x.itemsize for x in dtypes], dtype=np.int64)[inverse])
+        out = np.empty(row_offsets[-1], dtype=np.uint8)
+        for i, dtype in enumerate(dtypes):
+            idx = np.flatnonzero(inverse == i)
+            group = np.empty(len(idx), dtype=dtype)
+            for j, p in enumerate(props):
+                if p in arr.lists:
+                    values, offsets = arr.lists[p]
+                    count = dtype[p].shape[0]
+                    group['_count%d' % j] = count
+                    group[p] = values[offsets[idx][:, None] + np.arange(count)]
+                else:
+                    group[p] = arr.data[p][idx]
+            if len(dtypes) == 1:
+                return group.tobytes()
+            out[row_offsets[idx][:, None] + np.arange(dtype.itemsize)] = (
+                group.view(np.uint8).reshape(len(idx), dtype.itemsize))
+        return out.tobytes()
+
     @classmethod
     def encode_data_readable(cls, obj, typedef):
         r"""Encode an object's data in a readable format.
@@ -791,11 +1579,27 @@ class PlyMetaschemaType(JSONObjectMetaschemaType):
             object: Decoded object.
 
         """
-        msg = tools.bytes2str(msg)
-        lines = msg.splitlines()
+        if isinstance(msg, bytes):
+            end_header = b'end_header'
+            newline = b'\n'
+        else:
+            end_header = 'end_header'
+            newline = '\n'
+        idx_header = msg.find(end_header)
+        if idx_header < 0:
+            header = msg
+        else:
+            idx_body = msg.find(newline, idx_header)
+            if idx_body < 0:
+                idx_body = len(msg)
+            header = msg[:idx_body]
+            body = msg[(idx_body + 1):]
+        lines = tools.bytes2str(header).splitlines()
         metadata = {'comments': [], 'element_order': [], 'property_order': {}}
-        if lines[0] != 'ply':
+        if (not lines) or (lines[0] != 'ply'):
             raise ValueError("The first line must be 'ply'")
+        if idx_header < 0:
+            raise ValueError("The header does not contain 'end_header'")
         # Parse header
         e = None
         p = None
@@ -825,37 +1629,26 @@ class PlyMetaschemaType(JSONObjectMetaschemaType):
                 p = vars[-1]
                 type_map[e][p] = ' '.join(vars[1:-1])
                 metadata['property_order'][e].append(p)
-            elif 'end_header' in line:
-                headline = i + 1
-                break
         # Parse body
-        i = headline
+        byteorder = _map_plyformat2byteorder.get(
+            metadata.get('plyformat', 'ascii').split()[0], None)
+        if byteorder is None:
+            body = tools.bytes2str(body).splitlines()
+        else:
+            body = tools.str2bytes(body)
+        i = 0
         for e in metadata['element_order']:
             if e == 'material':
                 continue
-            for ie in range(size_map[e]):
-                vars = lines[i].split()
-                iv = 0
-                new = {}
-                for p in metadata['property_order'][e]:
-                    if type_map[e][p].startswith('list'):
-                        type_vars = type_map[e][p].split()
-                        count_type = translate_ply2py(type_vars[1])
-                        plist_type = translate_ply2py(type_vars[2])
-                        count = count_type(vars[iv])
-                        plist = []
-                        iv += 1
-                        for ip in range(count):
-                            plist.append(plist_type(vars[iv]))
-                            iv += 1
-                        new[p] = plist
-                    else:
-                        prop_type = translate_ply2py(type_map[e][p])
-                        new[p] = prop_type(vars[iv])
-                        iv += 1
-                assert(iv == len(vars))
-                obj[e].append(new)
-                i += 1
+            props = metadata['property_order'][e]
+            types = [type_map[e][p] for p in props]
+            if byteorder is None:
+                obj[e] = cls.decode_elements(
+                    body[i:(i + size_map[e])], props, types)
+                i += size_map[e]
+            else:
+                obj[e], i = cls.decode_elements_binary(
+                    body, i, size_map[e], props, types, byteorder)
         # Check that all properties filled in
         for e in metadata['element_order']:
             if e not in metadata['property_order']:
@@ -863,7 +1656,234 @@ class PlyMetaschemaType(JSONObjectMetaschemaType):
             for p in metadata['property_order'][e]:
                 assert(len(obj[e]) == size_map[e])
         # Return
-        return PlyDict(obj)
+        return PlyDict.from_dict(obj, validate=False)
+
+    @staticmethod
+    def _columns2elements(props, columns, size):
+        r"""Create arrays for elements from the values of each property.
+        Values for list properties are tuples of flattened values and
+        offsets."""
+        names = [p for p, x in zip(props, columns) if not isinstance(x, tuple)]
+        data = _columns2array(
+            names, [x for x in columns if not isinstance(x, tuple)], size)
+        lists = {p: x for p, x in zip(props, columns) if isinstance(x, tuple)}
+        return ElementArray(data, lists=lists, order=list(props))
+
+    @classmethod
+    def _empty_elements(cls, props, types):
+        r"""Create arrays for an element type with no elements."""
+        columns = []
+        for t in types:
+            vtype = translate_ply2py(t.split()[-1])
+            if t.startswith('list'):
+                columns.append((np.zeros(0, vtype), np.zeros(1, np.int64)))
+            else:
+                columns.append(np.zeros(0, vtype))
+        return cls._columns2elements(props, columns, 0)
+
+    @classmethod
+    def decode_elements(cls, lines, props, types):
+        r"""Decode one element type from lines of ASCII data.
+
+        Args:
+            lines (list): Lines containing the elements, one per line.
+            props (list): Names of the properties in the element.
+            types (list): Ply types of the properties in the element.
+
+        Returns:
+            ElementArray, list: Decoded elements.
+
+        """
+        if not lines:
+            return cls._empty_elements(props, types)
+        vtypes = [translate_ply2py(t.split()[-1]) for t in types]
+        # Layout of the columns from the list lengths in the first line
+        first = lines[0].split()
+        layout = []
+        iv = 0
+        for t in types:
+            if t.startswith('list'):
+                count = int(first[iv])
+                layout.append((iv, count))
+                iv += count + 1
+            else:
+                layout.append((iv, None))
+                iv += 1
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            arr = np.fromstring(' '.join(lines), sep=' ')
+        if arr.size == (iv * len(lines)):
+            arr2d = arr.reshape(len(lines), iv)
+            if all((arr2d[:, iv] == count).all() for iv, count in layout
+                   if count is not None):
+                columns = []
+                for (iv, count), vtype in zip(layout, vtypes):
+                    if count is None:
+                        columns.append(arr2d[:, iv].astype(vtype))
+                    else:
+                        columns.append((
+                            arr2d[:, (iv + 1):(iv + 1 + count)].astype(vtype).ravel(),
+                            count * np.arange(len(lines) + 1, dtype=np.int64)))
+                return cls._columns2elements(props, columns, len(lines))
+        ilist = [i for i, t in enumerate(types) if t.startswith('list')]
+        if len(ilist) == 1:
+            # Lines with one list of different lengths
+            ilist = ilist[0]
+            ntokens = np.array([len(x.split()) for x in lines], dtype=np.int64)
+            starts = _lengths2offsets(ntokens)
+            counts = ntokens - len(props)
+            if ((arr.size == starts[-1]) and (counts >= 0).all()
+                    and (arr[starts[:-1] + ilist] == counts).all()):
+                columns = []
+                for i, vtype in enumerate(vtypes):
+                    if i < ilist:
+                        columns.append(arr[starts[:-1] + i].astype(vtype))
+                    elif i > ilist:
+                        columns.append(
+                            arr[starts[1:] - (len(props) - i)].astype(vtype))
+                    else:
+                        offsets = _lengths2offsets(counts)
+                        idx = (np.repeat(starts[:-1] + ilist + 1 - offsets[:-1],
+                                         counts)
+                               + np.arange(offsets[-1]))
+                        columns.append((arr[idx].astype(vtype), offsets))
+                return cls._columns2elements(props, columns, len(lines))
+        # Lines with several lists of different lengths are decoded individually
+        out = []
+        for line in lines:
+            vars = line.split()
+            iv = 0
+            new = {}
+            for p, t in zip(props, types):
+                if t.startswith('list'):
+                    type_vars = t.split()
+                    count_type = translate_ply2py(type_vars[1])
+                    plist_type = translate_ply2py(type_vars[2])
+                    count = count_type(vars[iv])
+                    plist = []
+                    iv += 1
+                    for ip in range(count):
+                        plist.append(plist_type(vars[iv]))
+                        iv += 1
+                    new[p] = plist
+                else:
+                    prop_type = translate_ply2py(t)
+                    new[p] = prop_type(vars[iv])
+                    iv += 1
+            assert(iv == len(vars))
+            out.append(new)
+        return out
+
+    @classmethod
+    def _read_binary_counts(cls, body, pos, types, byteorder):
+        r"""Read the list lengths for an element in binary data.
+
+        Args:
+            body (bytes): Binary data.
+            pos (int): Position of the start of the element in body.
+            types (list): Ply types of the properties in the element.
+            byteorder (str): Byte order character ('<' or '>').
+
+        Returns:
+            tuple(list, int): Lengths of the list properties and the position
+                of the end of the element in body.
+
+        """
+        counts = []
+        for t in types:
+            vars = t.split()
+            if vars[0] == 'list':
+                count_dtype = np.dtype(_map_ply2py[vars[1]]).newbyteorder(byteorder)
+                count = int(np.frombuffer(body, dtype=count_dtype, count=1,
+                                          offset=pos)[0])
+                counts.append(count)
+                pos += count_dtype.itemsize
+                pos += count * np.dtype(_map_ply2py[vars[2]]).itemsize
+            else:
+                pos += np.dtype(_map_ply2py[t]).itemsize
+        return counts, pos
+
+    @classmethod
+    def decode_elements_binary(cls, body, pos, nelements, props, types,
+                               byteorder='<'):
+        r"""Decode one element type from binary data.
+
+        Args:
+            body (bytes): Binary data.
+            pos (int): Position of the first element in body.
+            nelements (int): Number of elements to decode.
+            props (list): Names of the properties in the element.
+            types (list): Ply types of the properties in the element.
+            byteorder (str, optional): Byte order character ('<' or '>').
+                Defaults to '<'.
+
+        Returns:
+            tuple(ElementArray, int): Decoded elements and the position of
+                the end of the elements in body.
+
+        """
+        if nelements == 0:
+            return cls._empty_elements(props, types), pos
+        vtypes = [translate_ply2py(t.split()[-1]) for t in types]
+        counts, end = cls._read_binary_counts(body, pos, types, byteorder)
+        dtype = cls.get_element_dtype(props, types, byteorder, counts=counts)
+        if (pos + nelements * dtype.itemsize) <= len(body):
+            arr = np.frombuffer(body, dtype=dtype, count=nelements, offset=pos)
+            if all((arr['_count%d' % i] == count).all() for i, count in
+                   zip([i for i, t in enumerate(types) if t.startswith('list')],
+                       counts)):
+                columns = []
+                for p, t, vtype in zip(props, types, vtypes):
+                    col = arr[p].astype(vtype)
+                    if t.startswith('list'):
+                        col = (col.ravel(), col.shape[1] * np.arange(
+                            nelements + 1, dtype=np.int64))
+                    columns.append(col)
+                return (cls._columns2elements(props, columns, nelements),
+                        pos + nelements * dtype.itemsize)
+        # Elements with lists of different lengths are located one at a time
+        layout = []
+        for t in types:
+            vars = t.split()
+            if vars[0] == 'list':
+                count_dtype = np.dtype(_map_ply2py[vars[1]]).newbyteorder(byteorder)
+                layout.append((struct.Struct(byteorder + count_dtype.char),
+                               np.dtype(_map_ply2py[vars[2]]).newbyteorder(byteorder)))
+            else:
+                layout.append((None, np.dtype(_map_ply2py[t]).newbyteorder(byteorder)))
+        starts = []
+        counts = []
+        for i in range(nelements):
+            starts.append(pos)
+            for count_struct, value_dtype in layout:
+                if count_struct is None:
+                    pos += value_dtype.itemsize
+                else:
+                    count = count_struct.unpack_from(body, pos)[0]
+                    counts.append(count)
+                    pos += count_struct.size + count * value_dtype.itemsize
+        counts = np.array(counts, dtype=np.int64).reshape(
+            nelements, sum(x[0] is not None for x in layout))
+        buf = np.frombuffer(body, dtype=np.uint8)
+        ipos = np.array(starts, dtype=np.int64)
+        columns = []
+        ilist = 0
+        for (count_struct, value_dtype), vtype in zip(layout, vtypes):
+            if count_struct is None:
+                columns.append(_gather(buf, ipos, value_dtype).astype(vtype))
+                ipos = ipos + value_dtype.itemsize
+            else:
+                count = counts[:, ilist]
+                ilist += 1
+                offsets = _lengths2offsets(count)
+                ipos = ipos + count_struct.size
+                idx = (np.repeat(ipos - offsets[:-1] * value_dtype.itemsize,
+                                 count)
+                       + np.arange(offsets[-1]) * value_dtype.itemsize)
+                columns.append((_gather(buf, idx, value_dtype).astype(vtype),
+                                offsets))
+                ipos = ipos + count * value_dtype.itemsize
+        return cls._columns2elements(props, columns, nelements), pos
 
     @classmethod
     def updated_fixed_properties(cls, obj):
@@ -215,6 +215,116 @@ class ScalarMetaschemaType(MetaschemaType):
         out = cls.as_python_type(out, typedef)
         return units.convert_to(out, typedef1.get('units', None))
 
+    @classmethod
+    def get_fingerprint(cls, obj, typedef=None):
+        r"""Get a hashable fingerprint for an object that determines the
+        type definition it will be encoded with.
+
+        Args:
+            obj (object): Coerced object to get the fingerprint for.
+            typedef (dict, optional): Type definition that the object is being
+                encoded against. Defaults to None.
+
+        Returns:
+            tuple: Fingerprint for the object. None is returned if the object
+                cannot be encoded by a specialized encoder.
+
+        """
+        obj_nounits = units.get_data(obj)
+        if isinstance(obj_nounits, np.ndarray):
+            dtype = obj_nounits.dtype
+            shape = obj_nounits.shape
+        elif isinstance(obj_nounits, ScalarMetaschemaProperties._all_python_scalars):
+            dtype = ScalarMetaschemaProperties.data2dtype(obj_nounits)
+            shape = None
+        else:
+            return None
+        return (type(obj), dtype.str, shape, units.get_units(obj))
+
+    @classmethod
+    def get_metadata_fingerprint(cls, metadata):
+        r"""Get a hashable fingerprint for the type properties in message
+        metadata that determine how the data will be decoded.
+
+        Args:
+            metadata (dict): Message metadata.
+
+        Returns:
+            tuple: Fingerprint for the metadata.
+
+        """
+        shape = metadata.get('shape', None)
+        if shape is not None:
+            shape = tuple(shape)
+        return (metadata['type'], metadata.get('subtype', None),
+                metadata.get('precision', None), metadata.get('units', None),
+                metadata.get('length', None), shape)
+
+    @classmethod
+    def get_specialized_encoder(cls, obj, metadata, typedef=None):
+        r"""Get a function that encodes the data for objects with the same
+        fingerprint as the provided object. Objects are cast to the encoded
+        data type directly unless units must be converted.
+
+        Args:
+            obj (object): Coerced object that the encoder is for.
+            metadata (dict): Type definition that the object was encoded with.
+            typedef (dict, optional): Type definition that objects should be
+                transformed to match before they are encoded. Defaults to None
+                and objects are not transformed.
+
+        Returns:
+            callable: Function that takes an object and returns the encoded
+                data.
+
+        """
+        if isinstance(typedef, dict) and units.has_units(obj):
+            new_units = typedef.get('units', None)
+            if not (units.is_null_unit(new_units or '')
+                    or (new_units == units.get_units(obj))):
+                return super(ScalarMetaschemaType, cls).get_specialized_encoder(
+                    obj, metadata, typedef=typedef)
+        dtype = ScalarMetaschemaProperties.definition2dtype(metadata)
+
+        def encoder(x):
+            arr = cls.to_array(x)
+            if arr.dtype != dtype:
+                arr = arr.astype(dtype, casting='same_kind')
+            return base64.encodebytes(arr.tobytes()).decode('ascii')
+        return encoder
+
+    @classmethod
+    def get_specialized_decoder(cls, metadata, typedef=None):
+        r"""Get a function that decodes the data for messages with the same
+        metadata fingerprint as the provided metadata. The transformation is
+        skipped if the type definition would not change the decoded object.
+
+        Args:
+            metadata (dict): Message metadata.
+            typedef (dict, optional): Type definition that decoded objects
+                should be transformed to match. Defaults to None.
+
+        Returns:
+            callable: Function that takes encoded data and returns the decoded
+                object.
+
+        """
+        if typedef is not None:
+            typedef1 = dict(metadata, **typedef)
+            if not ((ScalarMetaschemaProperties.definition2dtype(typedef1)
+                     == ScalarMetaschemaProperties.definition2dtype(metadata))
+                    and (typedef1['type'] == metadata['type'])
+                    and (typedef1.get('subtype', None)
+                         == metadata.get('subtype', None))
+                    and (typedef1.get('units', None)
+                         == metadata.get('units', None))):
+                return super(ScalarMetaschemaType, cls).get_specialized_decoder(
+                    metadata, typedef=typedef)
+
+        def decoder(x):
+            return cls.decode_data(x, metadata)
+        return decoder
+
     @classmethod
     def to_array(cls, obj):
         r"""Get np.array representation of the data.
@@ -5,6 +5,7 @@ import copy
 import importlib
 import numpy as np
 from collections import OrderedDict
+from yggdrasil import units
 from yggdrasil.metaschema.encoder import decode_json
 from yggdrasil.metaschema.properties import get_metaschema_property
 
@@ -15,6 +16,9 @@ _base_validator = jsonschema.validators.validator_for({"$schema": ""})
 YGG_MSG_HEAD = b'YGG_MSG_HEAD'
 _property_attributes = ['properties', 'definition_properties',
                         'metadata_properties', 'extract_properties']
+# Types inferred for numpy objects, keyed by get_numpy_type_key
+_numpy_type_cache = OrderedDict()
+_numpy_type_cache_size = 1024
 
 
 class MetaschemaTypeError(TypeError):
@@ -315,8 +319,61 @@ def guess_type_from_msg(msg):
         raise ValueError("Could not guess type.")
 
 
+def get_numpy_type_key(obj):
+    r"""Get a key describing the properties of a numpy array or scalar that
+    determine its type definition.
+
+    Args:
+        obj (object): Python object.
+
+    Returns:
+        tuple: Python type, data type, shape, and units of the object. None
+            is returned if the object is not a numpy array or scalar or its
+            type definition could depend on its contents.
+
+    """
+    obj_nounits = units.get_data(obj)
+    if ((not isinstance(obj_nounits, (np.ndarray, np.generic)))
+            or obj_nounits.dtype.hasobject):
+        return None
+    return (type(obj), obj_nounits.dtype, obj_nounits.shape,
+            units.get_units(obj))
+
+
+def get_cached_numpy_type(key):
+    r"""Get a type inferred for a numpy object from the cache.
+
+    Args:
+        key (tuple): Key identifying the numpy object properties and how the
+            type was inferred.
+
+    Returns:
+        object: Cached type. None is returned if the key is not in the cache.
+
+    """
+    return _numpy_type_cache.get(key, None)
+
+
+def cache_numpy_type(key, value):
+    r"""Add a type inferred for a numpy object to the cache, removing the
+    oldest entry if the cache is full.
+
+    Args:
+        key (tuple): Key identifying the numpy object properties and how the
+            type was inferred.
+        value (object): Type that should be cached.
+
+    """
+    if len(_numpy_type_cache) >= _numpy_type_cache_size:
+        _numpy_type_cache.popitem(last=False)
+    _numpy_type_cache[key] = value
+
+
 def guess_type_from_obj(obj):
-    r"""Guess the type class for a given Python object.
+    r"""Guess the type class for a given Python object. Type classes for
+    numpy arrays and scalars are cached based on their type, data type and
+    number of dimensions. Lists and dictionaries containing only numpy
+    arrays and scalars are assumed to be arrays and objects respectively.
 
     Args:
         obj (object): Python object.
@@ -328,6 +385,24 @@ def guess_type_from_obj(obj):
         ValueError: If a type class cannot be determined.
 
     """
+    key = get_numpy_type_key(obj)
+    if key is not None:
+        key = ('class', key[0], key[1], len(key[2]))
+        cls = get_cached_numpy_type(key)
+        if cls is None:
+            type_encoder = get_metaschema_property('type')
+            cls = get_type_class(type_encoder.encode(obj))
+            cache_numpy_type(key, cls)
+        return cls
+    if isinstance(obj, (list, tuple, dict)) and (len(obj) > 0):
+        if isinstance(obj, dict):
+            values = obj.values()
+            typename = 'object'
+        else:
+            values = obj
+            typename = 'array'
+        if all(get_numpy_type_key(v) is not None for v in values):
+            return get_type_class(typename)
     type_encoder = get_metaschema_property('type')
     cls = get_type_class(type_encoder.encode(obj))
     return cls
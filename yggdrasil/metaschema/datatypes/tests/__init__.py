@@ -1,3 +1,4 @@
+import numpy as np
 from yggdrasil.tests import assert_raises, assert_equal
 from yggdrasil.metaschema import datatypes
 from yggdrasil.metaschema.tests import _valid_objects
@@ -50,6 +51,21 @@ def test_guess_type_from_obj():
                       datatypes.guess_type_from_obj, x)
 
 
+def test_encode_type_numpy_cache():
+    r"""Test that type definitions cached for numpy objects are not changed
+    by modifying the returned type definition."""
+    x = np.zeros((3, 2), dtype='float32')
+    t1 = datatypes.encode_type(x)
+    t1['shape'].append(4)
+    t2 = datatypes.encode_type(np.ones((3, 2), dtype='float32'))
+    assert_equal(t2, {'type': 'ndarray', 'subtype': 'float', 'precision': 32,
+                      'units': '', 'shape': [3, 2]})
+    assert_equal(datatypes.encode_type(np.zeros(3, dtype='float32'))['type'],
+                 '1darray')
+    assert_equal(datatypes.encode_type([x, x])['items'], [t2, t2])
+    assert_equal(datatypes.encode_type({'a': x})['properties'], {'a': t2})
+
+
 def test_encode_decode():
     r"""Test encode/decode for valid objects."""
     for x in _valid_objects.values():
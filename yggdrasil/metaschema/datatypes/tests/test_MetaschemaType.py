@@ -282,6 +282,21 @@ class TestMetaschemaType(YggTestClassInfo):
                 y = self.instance.deserialize(msg)
                 self.assert_result_equal(y[0], x)
 
+    def test_serialize_specialized(self):
+        r"""Test that specialized encoders/decoders match the generic ones."""
+        if self._cls != 'MetaschemaType':
+            for x in self._valid_decoded:
+                typedef = self.instance._typedef
+                x_meta, x_data = self.instance.encode(
+                    x, typedef=typedef, typedef_validated=True)
+                for _ in range(2):
+                    y_meta, y_data = self.instance.encode_specialized(x)
+                    self.assert_equal(y_meta, x_meta)
+                    self.assert_equal(y_data, x_data)
+                for _ in range(2):
+                    y = self.instance.decode_specialized(x_meta, x_data)
+                    self.assert_result_equal(y, x)
+
     def test_serialize_error(self):
         r"""Test serialization errors."""
         if (self._cls != 'MetaschemaType') and (len(self._valid_decoded) > 0):
@@ -315,3 +330,18 @@ class TestMetaschemaType(YggTestClassInfo):
             out = self.instance.serialize(self._valid_decoded[0])
             obj, metadata = self.instance.deserialize(out[:-1])
             self.assert_equal(metadata['incomplete'], True)
+
+
+def test_specialized_cache_size():
+    r"""Test that the number of cached specialized encoders/decoders is
+    limited for messages with varying lengths."""
+    from yggdrasil.metaschema.datatypes import MetaschemaType, get_type_class
+    nmax = MetaschemaType._specialized_cache_size
+    x_type = get_type_class('1darray')(subtype='float', precision=64)
+    for i in range(2 * nmax):
+        x = np.arange(i, dtype='float64')
+        x_meta, x_data = x_type.encode_specialized(x)
+        np.testing.assert_array_equal(
+            x_type.decode_specialized(x_meta, x_data), x)
+    assert_equal(len(x_type._encoders), nmax)
+    assert_equal(len(x_type._decoders), nmax)
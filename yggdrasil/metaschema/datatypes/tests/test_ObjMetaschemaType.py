@@ -122,6 +122,7 @@ class TestObjMetaschemaType(parent.TestPlyMetaschemaType):
         cls._value = _test_value
         cls._fulldef = {'type': cls.get_import_cls().name}
         cls._typedef = {'type': cls._fulldef['type']}
+        cls._binary_formats = []
         cls._valid_encoded = [cls._fulldef]
         cls._valid_decoded = [cls._value,
                               ObjMetaschemaType.ObjDict(**_test_value),
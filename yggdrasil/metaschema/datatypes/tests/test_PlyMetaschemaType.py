@@ -1,5 +1,6 @@
 import os
 import copy
+import pickle
 import shutil
 import tempfile
 import numpy as np
@@ -94,6 +95,25 @@ def test_singular2plural():
     assert_raises(ValueError, PlyMetaschemaType.plural2singular, 'invalid')
 
 
+def test_encode_ragged_lists():
+    r"""Test encoding/decoding elements with list properties of different
+    lengths."""
+    x = {'vertices': copy.deepcopy(_test_value['vertices']),
+         'faces': [{'vertex_index': [0, 1, 2], 'extra': []},
+                   {'vertex_index': [1, 2, 3, 4], 'extra': [1.5]}]}
+    for f in x['faces']:
+        f['vertex_index'] = [np.int32(i) for i in f['vertex_index']]
+        f['extra'] = [np.float32(v) for v in f['extra']]
+    type_cls = PlyMetaschemaType.PlyMetaschemaType
+    for plyformat in ['ascii 1.0', 'binary_little_endian 1.0',
+                      'binary_big_endian 1.0']:
+        msg = type_cls.encode_data(x, None, plyformat=plyformat)
+        if plyformat.startswith('ascii'):
+            assert('  ' not in msg)
+            assert(' \n' not in msg)
+        assert_equal(type_cls.decode_data(msg, None), x)
+
+
 class TestPlyDict(YggTestClassInfo):
     r"""Test for PlyDict class."""
     
@@ -129,6 +149,27 @@ class TestPlyDict(YggTestClassInfo):
         ply1.merge([self.instance], no_copy=True)
         self.assert_equal(ply1, ply2)
 
+    def test_merge_arrays(self):
+        r"""Test merging ply objects with elements stored as arrays."""
+        type_cls = self.import_cls._type_class
+        x = type_cls.decode_data(type_cls.encode_data(self.instance, None),
+                                 None)
+        self.assert_equal(
+            isinstance(dict.__getitem__(x, 'faces'),
+                       PlyMetaschemaType.ElementArray), True)
+        y = x.merge([x, self.instance])
+        self.assert_equal(
+            isinstance(dict.__getitem__(y, 'faces'),
+                       PlyMetaschemaType.ElementArray), True)
+        self.assert_equal(y.count_elements('faces'),
+                          3 * self.instance.count_elements('faces'))
+        self.assert_equal(pickle.loads(pickle.dumps(y)), y)
+        z = copy.deepcopy(self.instance)
+        z.merge([self.instance, self.instance], no_copy=True)
+        self.assert_equal(y, z)
+        y['vertices'][0]['x'] = 10.0
+        self.assert_equal(y['vertices'][0]['x'], 10.0)
+
     def test_append(self):
         r"""Test appending ply objects."""
         basic = self.import_cls(vertices=self.instance['vertices'],
@@ -186,6 +227,24 @@ class TestPlyDict(YggTestClassInfo):
         y = self.import_cls.from_dict(x)
         self.assert_equal(y, self.instance)
 
+    def test_from_arrays(self):
+        r"""Test transformation to/from arrays."""
+        o = self.import_cls(copy.deepcopy(self._simple_test))
+        verts = o.get_element_array('vertices')
+        faces = o.get_face_array()
+        x = self.import_cls.from_arrays(verts, faces=faces)
+        self.assert_equal(x['vertices'], o['vertices'])
+        for a, b in zip(x.get_face_array(), faces):
+            np.testing.assert_array_equal(a, b)
+        np.testing.assert_array_equal(
+            x.get_vertex_coords(),
+            [[v[k] for k in 'xyz'] for v in o['vertices']])
+        y = self.import_cls.from_arrays(vcoords, faces=[[0, 1, 2], [0, 2, 3]])
+        self.assert_equal(y.nvert, len(vcoords))
+        self.assert_equal(y.nface, 2)
+        self.assert_raises(ValueError, self.import_cls.from_arrays,
+                           vcoords, faces=[[0, 1, len(vcoords)]])
+
     def test_properties(self):
         r"""Test explicit exposure of specific element counts as properties
         against counts based on singular elements."""
@@ -218,7 +277,19 @@ class TestPlyMetaschemaType(parent.TestJSONObjectMetaschemaType):
                                  'faces': [{'vertex_index': [0, 1, 2]}]}]
         cls._compatible_objects = [(cls._value, cls._value, None)]
         cls._encode_data_kwargs = {'comments': ['Test comment']}
+        cls._binary_formats = ['binary_little_endian 1.0',
+                               'binary_big_endian 1.0']
 
     def test_decode_data_errors(self):
         r"""Test errors in decode_data."""
         self.assert_raises(ValueError, self.import_cls.decode_data, 'hello', None)
+
+    def test_encode_data_binary(self):
+        r"""Test encoding/decoding binary data."""
+        for plyformat in self._binary_formats:
+            for value in [_test_value, _test_value_simple]:
+                msg = self.import_cls.encode_data(value, self.typedef,
+                                                  plyformat=plyformat)
+                assert(isinstance(msg, bytes))
+                x = self.import_cls.decode_data(msg, self.typedef)
+                self.assert_equal(x, value)
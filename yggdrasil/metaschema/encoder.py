@@ -5,6 +5,8 @@ import rapidjson as json
 from yggdrasil import tools
 _json_encoder = json.Encoder
 _json_decoder = json.Decoder
+_yaml_loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_yaml_loader_cache = {}
 
 
 def indent_char2int(indent):
@@ -72,12 +74,9 @@ class JSONEncoder(_json_encoder):
     
 
 class JSONDecoder(_json_decoder):
-    r"""Decoder class for Ygg messages."""
-
-    def string(self, s):
-        r"""Try to parse string with class."""
-        # TODO: Do this dynamically for classes based on an attribute
-        return string2import(s)
+    r"""Decoder class for Ygg messages. Strings are not converted to
+    classes/functions here, that is done by the class and function types
+    when the schema for a message indicates a string is a class/function."""
 
     
 def encode_json(obj, fd=None, indent=None, sort_keys=True, **kwargs):
@@ -175,6 +174,42 @@ def encode_yaml(obj, fd=None, indent=None,
     return yaml.dump(encode_data_readable(obj), **kwargs)
 
 
+def get_yaml_loader(Loader=None, sorted_dict_type=None):
+    r"""Get a YAML loader class that will use a specified class to contain
+    mapping objects. Loader classes are cached so that they are only created
+    once for each set of arguments.
+
+    Args:
+        Loader (type, optional): YAML loader class that the returned class
+            should be based on. Defaults to yaml.CSafeLoader if libyaml is
+            available and yaml.SafeLoader otherwise.
+        sorted_dict_type (type, optional): Class that should be used to
+            contain mapping objects while preserving order. Defaults to
+            None and is ignored.
+
+    Returns:
+        type: YAML loader class.
+
+    """
+    if Loader is None:
+        Loader = _yaml_loader
+    key = (Loader, sorted_dict_type)
+    if key not in _yaml_loader_cache:
+        class OrderedLoader(Loader):
+            pass
+
+        if sorted_dict_type is not None:
+            def construct_mapping(loader, node):
+                loader.flatten_mapping(node)
+                return sorted_dict_type(loader.construct_pairs(node))
+
+            OrderedLoader.add_constructor(
+                yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG,
+                construct_mapping)
+        _yaml_loader_cache[key] = OrderedLoader
+    return _yaml_loader_cache[key]
+
+
 def decode_yaml(msg, sorted_dict_type=None, **kwargs):
     r"""Decode a Python object from a YAML serialization.
 
@@ -189,26 +224,7 @@ def decode_yaml(msg, sorted_dict_type=None, **kwargs):
         object: Deserialized Python object.
 
     """
-    class OrderedLoader(kwargs.get('Loader', yaml.Loader)):
-        pass
-
-    if sorted_dict_type is not None:
-        def construct_mapping(loader, node):
-            loader.flatten_mapping(node)
-            return sorted_dict_type(loader.construct_pairs(node))
-
-        OrderedLoader.add_constructor(
-            yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG,
-            construct_mapping)
-
-    def construct_scalar(loader, node):
-        out = loader.construct_scalar(node)
-        out = string2import(out)
-        return out
-
-    OrderedLoader.add_constructor(
-        yaml.resolver.BaseResolver.DEFAULT_SCALAR_TAG,
-        construct_scalar)
-    kwargs['Loader'] = OrderedLoader
+    kwargs['Loader'] = get_yaml_loader(Loader=kwargs.get('Loader', None),
+                                       sorted_dict_type=sorted_dict_type)
     out = yaml.load(msg, **kwargs)
     return out
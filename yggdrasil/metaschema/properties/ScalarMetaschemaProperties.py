@@ -35,12 +35,12 @@ for t, t_np in _valid_types.items():
 # For some reason windows fails to check types on ints in some cases
 _python_scalars['int'].append(np.signedinteger)
 _python_scalars['uint'].append(np.unsignedinteger)
-_all_python_scalars = [units._unit_quantity]
+_all_python_scalars = [units._unit_quantity_type]
 for k in _python_scalars.keys():
-    _python_scalars[k].append(units._unit_quantity)
+    _python_scalars[k].append(units._unit_quantity_type)
     _all_python_scalars += list(_python_scalars[k])
     _python_scalars[k] = tuple(_python_scalars[k])
-_all_python_arrays = tuple(set([np.ndarray, units._unit_array]))
+_all_python_arrays = tuple(set([np.ndarray, units._unit_array_type]))
 _all_python_scalars = tuple(set(_all_python_scalars))
 
 
@@ -10,7 +10,9 @@ import socket
 from yggdrasil.tools import YggClass
 from yggdrasil.config import ygg_cfg, cfg_environment
 from yggdrasil import platform, yamlfile
+from yggdrasil.components import import_component
 from yggdrasil.drivers import create_driver
+from yggdrasil.drivers.CompiledModelDriver import run_build_jobs
 
 
 COLOR_TRACE = '\033[30;43;22m'
@@ -37,6 +39,9 @@ class YggRunner(YggClass):
             Defaults to environment variable 'RMQ_DEBUG'.
         ygg_debug_prefix (str, optional): Prefix for Ygg debug messages.
             Defaults to namespace.
+        jobs (int, optional): Maximum number of compilation processes that
+            should be run at the same time. Defaults to None and the 'jobs'
+            option in the 'build' section of the config file is used.
 
     Attributes:
         namespace (str): Name that should be used to uniquely identify any RMQ
@@ -50,13 +55,15 @@ class YggRunner(YggClass):
             drivers.
         interrupt_time (float): Time of last interrupt signal.
         error_flag (bool): True if one or more models raises an error.
+        driver_times (dict): Time (in seconds) spent loading and starting
+            each driver.
 
     ..todo:: namespace, host, and rank do not seem strictly necessary.
 
     """
     def __init__(self, modelYmls, namespace=None, host=None, rank=0,
                  ygg_debug_level=None, rmq_debug_level=None,
-                 ygg_debug_prefix=None):
+                 ygg_debug_prefix=None, jobs=None):
         super(YggRunner, self).__init__('runner')
         if namespace is None:
             namespace = ygg_cfg.get('rmq', 'namespace', False)
@@ -74,20 +81,59 @@ class YggRunner(YggClass):
         self._outputchannels = {}
         self._old_handlers = {}
         self.error_flag = False
+        self.driver_times = {}
         self.debug("Running in %s with path %s namespace %s rank %d",
                    os.getcwd(), sys.path, namespace, rank)
         # Update environment based on config
         cfg_environment()
+        if jobs is not None:
+            ygg_cfg.set('build', 'jobs', str(jobs))
         # Parse yamls
         drivers = yamlfile.parse_yaml(modelYmls)
         self.inputdrivers = drivers['input']
         self.outputdrivers = drivers['output']
         self.modeldrivers = drivers['model']
+        self.add_model_replicas()
         for x in self.outputdrivers.values():
             self._outputchannels[x['args']] = x
         for x in self.inputdrivers.values():
             self._inputchannels[x['args']] = x
 
+    def add_model_replicas(self):
+        r"""Add entries for the additional copies of models that have more
+        than one replica. Copies share the I/O drivers and clients of the
+        original model.
+
+        Raises:
+            ValueError: If a model with more than one replica is not a server
+                or has input/output channels other than the server channel.
+
+        """
+        for yml in list(self.modeldrivers.values()):
+            nreplica = yml.get('replicas', 1)
+            if nreplica == 1:
+                continue
+            if not yml.get('is_server', False):
+                raise ValueError(("Model '%s' has %d replicas, but is not a "
+                                  "server. Replicas are only supported for "
+                                  "server models.") % (yml['name'], nreplica))
+            others = [x['name'] for x in chain(yml['input_drivers'],
+                                               yml['output_drivers'])
+                      if 'ServerDriver' not in x['driver']]
+            if others:
+                raise ValueError(("Model '%s' has %d replicas, but has "
+                                  "input/output channels other than the server "
+                                  "channel (%s). Replicated server models "
+                                  "cannot have other channels.")
+                                 % (yml['name'], nreplica, others))
+            yml['replica_names'] = []
+            for i in range(1, nreplica):
+                rep = dict(yml, name='%s_replica%d' % (yml['name'], i),
+                           replica_index=i, replica_of=yml['name'])
+                rep.pop('replica_names')
+                self.modeldrivers[rep['name']] = rep
+                yml['replica_names'].append(rep['name'])
+
     def pprint(self, *args):
         r"""Print with color."""
         s = ''.join(str(i) for i in args)
@@ -168,7 +214,7 @@ class YggRunner(YggClass):
             t0 = timer()
         times = {}
         times['init'] = timer()
-        self.loadDrivers()
+        self.loadDrivers(start_connections=True)
         times['load drivers'] = timer()
         self.startDrivers()
         times['start drivers'] = timer()
@@ -188,6 +234,9 @@ class YggRunner(YggClass):
             tprev = times[k]
         self.info(40 * '=')
         self.info('%20s\t%f', "Total", tprev - t0)
+        for k, v in self.driver_times.items():
+            self.info('%20s\t%s', k, ', '.join(
+                '%s: %f' % (kk, vv) for kk, vv in v.items()))
         return times
 
     @property
@@ -226,6 +275,7 @@ class YggRunner(YggClass):
 
         """
         self.debug('Creating %s, a %s', yml['name'], yml['driver'])
+        t0 = time.time()
         curpath = os.getcwd()
         if 'ClientDriver' in yml['driver']:
             yml.setdefault('comm_address', self.serverdrivers[yml['args']])
@@ -239,8 +289,72 @@ class YggRunner(YggClass):
             os.chdir(curpath)
         if 'ServerDriver' in yml['driver']:
             self.serverdrivers[yml['args']] = instance.comm_address
+        self.driver_times.setdefault(yml['name'], {})['load'] = (
+            time.time() - t0)
         return instance
 
+    def createDrivers(self, create, drivers):
+        r"""Create a set of independent drivers, creating drivers that
+        share a working directory at the same time.
+
+        Args:
+            create (function): Method that should be used to create each
+                driver (e.g. createInputDriver).
+            drivers (list): Yaml objects containing driver information.
+
+        """
+        # The working directory is global so only drivers that use the same
+        # working directory can be created at the same time
+        groups = {}
+        for yml in drivers:
+            groups.setdefault(yml.get('working_dir', None), []).append(yml)
+
+        def create_driver(yml):
+            try:
+                return create(yml)
+            except BaseException:  # pragma: debug
+                self.error("%s could not be created.", yml['name'])
+                raise
+        curpath = os.getcwd()
+        try:
+            for working_dir, ymls in groups.items():
+                os.chdir(working_dir or curpath)
+                run_build_jobs(create_driver, [(x, ) for x in ymls])
+        finally:
+            os.chdir(curpath)
+
+    def startDriver(self, yml):
+        r"""Start a driver if it has not already been started.
+
+        Args:
+            yml (yaml): Yaml object containing driver information.
+
+        """
+        d = yml['instance']
+        if not d.was_started:
+            self.debug("Starting driver %s", yml['name'])
+            t0 = time.time()
+            d.start()
+            self.driver_times.setdefault(yml['name'], {})['start'] = (
+                time.time() - t0)
+
+    def waitConnections(self, drivers):
+        r"""Wait for connection drivers to enter their loops.
+
+        Args:
+            drivers (iterator): Yaml objects containing connection driver
+                information.
+
+        """
+        for driver in drivers:
+            d = driver['instance']
+            if d.was_loop:
+                continue
+            self.debug("Checking driver %s", driver['name'])
+            d.wait_for_loop()
+            assert(d.was_loop)
+            assert(not d.errors)
+
     def createModelDriver(self, yml):
         r"""Create a model driver instance from the yaml information.
 
@@ -254,7 +368,17 @@ class YggRunner(YggClass):
         yml['env'] = {}
         for iod in self.io_drivers(yml['name']):
             yml['env'].update(iod['instance'].env)
+            if 'ServerDriver' in iod['driver']:
+                yml['env'].update(
+                    iod['instance'].replica_env[yml.get('replica_index', 0)])
             iod['models'].append(yml['name'])
+        if 'replica_of' in yml:
+            # Channel names are prefixed by the name of the model
+            prefix = yml['replica_of'] + ':'
+            for k in list(yml['env'].keys()):
+                if k.startswith(prefix):
+                    new_key = yml['name'] + ':' + k[len(prefix):]
+                    yml['env'][new_key] = yml['env'].pop(k)
         drv = self.createDriver(yml)
         if 'client_of' in yml:
             for srv in yml['client_of']:
@@ -308,26 +432,53 @@ class YggRunner(YggClass):
         drv = self.createDriver(yml)
         return drv
         
-    def loadDrivers(self):
+    def compileDependencies(self):
+        r"""Compile the internal libraries required by the models, compiling
+        libraries for different languages at the same time."""
+        drivers = []
+        for yml in self.modeldrivers.values():
+            drv = import_component('model', yml['driver'], without_schema=True)
+            if hasattr(drv, 'compile_dependencies') and (drv not in drivers):
+                drivers.append(drv)
+        if drivers:
+            self.debug("Compiling dependencies for %s",
+                       [x.language for x in drivers])
+            run_build_jobs(lambda x: x.compile_dependencies(),
+                           [(x, ) for x in drivers])
+
+    def loadDrivers(self, start_connections=False):
         r"""Load all of the necessary drivers, doing the IO drivers first
-        and adding IO driver environmental variables back tot he models."""
+        and adding IO driver environmental variables back tot he models.
+        Drivers within each stage (input, output, model) are independent
+        and are created at the same time.
+
+        Args:
+            start_connections (bool, optional): If True, the IO drivers are
+                started as soon as they are created so that they are running
+                while the models are created. Defaults to False.
+
+        """
         self.debug('')
-        driver = dict(name='name')
         try:
+            # Compile libraries required by models
+            self.compileDependencies()
             # Create input drivers
             self.debug("Loading input drivers")
-            for driver in self.inputdrivers.values():
-                self.createInputDriver(driver)
+            self.createDrivers(self.createInputDriver,
+                               self.inputdrivers.values())
             # Create output drivers
             self.debug("Loading output drivers")
-            for driver in self.outputdrivers.values():
-                self.createOutputDriver(driver)
+            self.createDrivers(self.createOutputDriver,
+                               self.outputdrivers.values())
+            # Start connections
+            if start_connections:
+                for driver in self.io_drivers():
+                    self.startDriver(driver)
             # Create model drivers
             self.debug("Loading model drivers")
-            for driver in self.modeldrivers.values():
-                self.createModelDriver(driver)
+            self.createDrivers(self.createModelDriver,
+                               self.modeldrivers.values())
         except BaseException:  # pragma: debug
-            self.error("%s could not be created.", driver['name'])
             self.terminate()
             raise
 
@@ -340,28 +491,20 @@ class YggRunner(YggClass):
         try:
             # Start connections
             for driver in self.io_drivers():
-                self.debug("Starting driver %s", driver['name'])
-                d = driver['instance']
-                if not d.was_started:
-                    d.start()
-            # Ensure connections in loop
-            for driver in self.io_drivers():
-                self.debug("Checking driver %s", driver['name'])
-                d = driver['instance']
-                d.wait_for_loop()
-                assert(d.was_loop)
-                assert(not d.errors)
-            # Start models
+                self.startDriver(driver)
+            # Start each model once its connections are in loop
             for driver in self.modeldrivers.values():
-                self.debug("Starting driver %s", driver['name'])
-                d = driver['instance']
                 for n2 in driver.get('client_of', []):
-                    d2 = self.modeldrivers[n2]['instance']
-                    if not d2.was_started:
-                        self.debug("Starting server '%s' before client", d2.name)
-                        d2.start()
-                if not d.was_started:
-                    d.start()
+                    d2 = self.modeldrivers[n2]
+                    if not d2['instance'].was_started:
+                        self.debug("Starting server '%s' before client",
+                                   n2)
+                        self.waitConnections(self.io_drivers(n2))
+                        self.startDriver(d2)
+                self.waitConnections(self.io_drivers(driver['name']))
+                self.startDriver(driver)
+            # Ensure connections not used by models are in loop
+            self.waitConnections(self.io_drivers())
         except BaseException:  # pragma: debug
             self.error("%s did not start", driver['name'])
             self.terminate()
@@ -442,6 +585,8 @@ class YggRunner(YggClass):
                 iod = self.inputdrivers['%s:%s' % (srv_name, srv_name)]
                 iod['instance'].on_client_exit()
                 srv['instance'].stop()
+                for rep_name in srv.get('replica_names', []):
+                    self.modeldrivers[rep_name]['instance'].stop()
 
     def terminate(self):
         r"""Immediately stop all drivers, beginning with IO drivers."""
@@ -39,6 +39,28 @@ def ordered_load(stream, object_pairs_hook=SchemaDict, **kwargs):
     return out
 
 
+def import_schema_classes(schema):
+    r"""Import classes specified as strings by the 'class' property in a
+    loaded schema. Strings are not converted to classes when YAML is
+    loaded so this must be done for schemas that contain 'instance' types.
+
+    Args:
+        schema (dict, list): Loaded schema. Classes are replaced in place.
+
+    """
+    from yggdrasil.metaschema.datatypes.ClassMetaschemaType import (
+        ClassMetaschemaType)
+    if isinstance(schema, dict):
+        for k, v in schema.items():
+            if (k == 'class') and isinstance(v, str):
+                schema[k] = ClassMetaschemaType.decode_data(v, None)
+            else:
+                import_schema_classes(v)
+    elif isinstance(schema, list):
+        for v in schema:
+            import_schema_classes(v)
+
+
 def ordered_dump(data, **kwargs):
     r"""Dump object as a YAML document, representing SchemaDict objects as
     mapping type.
@@ -828,7 +850,7 @@ class SchemaRegistry(object):
                      'wait_for_creation', 'working_dir',
                      'read_meth', 'in_temp',
                      'serializer', 'datatype'],
-            'model': ['client_of', 'is_server', 'preserve_cache',
+            'model': ['client_of', 'is_server', 'replicas', 'preserve_cache',
                       'products', 'source_products', 'working_dir',
                       'overwrite', 'skip_interpreter']}
         prop_order = {
@@ -900,9 +922,10 @@ class SchemaRegistry(object):
         """
         with open(fname, 'r') as f:
             contents = f.read()
-            schema = ordered_load(contents, Loader=yaml.SafeLoader)
+            schema = ordered_load(contents)
         if schema is None:
             raise Exception("Failed to load schema from %s" % fname)
+        import_schema_classes(schema)
         # Create components
         for k, v in schema.get('definitions', {}).items():
             icomp = ComponentSchema.from_schema(v, schema_registry=self)
@@ -58,6 +58,7 @@ class AsciiTableSerialize(DefaultSerialize):
     has_header = True
     default_read_meth = 'readline'  # because default for as_array is False
     default_datatype = {'type': 'array'}
+    _compiled_format = None
 
     def update_serializer(self, *args, **kwargs):
         # Transform scalar into array for table
@@ -107,6 +108,15 @@ class AsciiTableSerialize(DefaultSerialize):
                     fmts=fmts, delimiter=self.delimiter, newline=self.newline,
                     comment=b'')
 
+    @property
+    def compiled_format(self):
+        r"""serialize.CompiledFormat: Compiled version of the format string
+        used to format/parse messages."""
+        if ((self._compiled_format is None)
+                or (self._compiled_format.fmt_str != self.format_str)):
+            self._compiled_format = serialize.compile_format(self.format_str)
+        return self._compiled_format
+
     def update_field_names(self):
         r"""list: Names for each field in the data type."""
         if (self.field_names is None) and self.initialized:
@@ -138,7 +148,7 @@ class AsciiTableSerialize(DefaultSerialize):
             out = serialize.array_to_table(args, self.format_str,
                                            use_astropy=self.use_astropy)
         else:
-            out = serialize.format_message(args, self.format_str)
+            out = self.compiled_format.format(args)
         return tools.str2bytes(out)
 
     def func_deserialize(self, msg):
@@ -159,10 +169,13 @@ class AsciiTableSerialize(DefaultSerialize):
                                            names=self.get_field_names(as_bytes=True))
             out = self.datatype.coerce_type(out)
         else:
-            out = list(serialize.process_message(msg, self.format_str))
+            if not isinstance(msg, (str, bytes)):
+                raise TypeError("Message must be a string or bytes string type.")
+            out = list(self.compiled_format.parse(msg))
         field_units = self.get_field_units()
         if field_units is not None:
-            out = [units.add_units(x, u, dtype=data2dtype(x))
+            out = [x if units.is_null_unit(u)
+                   else units.add_units(x, u, dtype=data2dtype(x))
                    for x, u in zip(out, field_units)]
         return out
 
@@ -78,6 +78,84 @@ class JSONSerialize(SerializeBase):
             out = [objects]
         return out
         
+    def get_append_state(self, obj, msg):
+        r"""Get the information required to append the serialization of
+        another object to a file so that the file contains the serialization
+        of the concatenated objects (see concatenate).
+
+        Args:
+            obj (object): Object contained by the file.
+            msg (bytes): Serialization of obj that was written to the file.
+
+        Returns:
+            dict: Append state that should be passed to serialize_append or
+                None if objects cannot be appended to the file.
+
+        """
+        if isinstance(obj, list) and obj:
+            out = {'type': 'array'}
+        elif (isinstance(obj, dict) and obj
+              and all([isinstance(k, str) for k in obj.keys()])):
+            out = {'type': 'object', 'first_key': min(obj.keys()),
+                   'last_key': max(obj.keys())}
+        else:
+            return None
+        out['size'] = len(msg)
+        return out
+
+    def is_append_compatible(self, state, new_state):
+        r"""Determine if an object can be appended to a file.
+
+        Args:
+            state (dict): Append state for the current file contents.
+            new_state (dict): Append state for the object that will be
+                appended.
+
+        Returns:
+            bool: True if the serialization of the concatenated objects can
+                be created by appending to the file, False otherwise.
+
+        """
+        if (new_state is None) or (new_state['type'] != state['type']):
+            return False
+        # Keys are sorted so the new members can only be added to the end if
+        # they come after the existing keys (this also excludes updates to
+        # existing keys)
+        if state['type'] == 'object':
+            return (new_state['first_key'] > state['last_key'])
+        return True
+
+    def serialize_append(self, obj, state):
+        r"""Serialize an object so that it can be written to a file that
+        already contains serialized objects without rewriting the parts of
+        the file that will not change. The resulting file will be identical to
+        the serialization of the concatenated objects (see concatenate).
+
+        Args:
+            obj (object): Object to serialize.
+            state (dict): Append state describing the current contents of the
+                file as returned by get_append_state. If the object can be
+                appended, the state will be updated to reflect the new contents.
+
+        Returns:
+            tuple(bytes, int): Serialized message and the position in the file
+                that it should be written to (the file should be truncated at
+                this position first). None is returned if the object cannot
+                be appended and the entire file must be rewritten.
+
+        """
+        new_state = self.get_append_state(obj, b'')
+        if not self.is_append_compatible(state, new_state):
+            return None
+        msg = self.func_serialize(obj)
+        # Overwrite the closing bracket (and any whitespace preceding it) with
+        # the members of the new object
+        pos = state['size'] - (len(msg) - len(msg[:-1].rstrip()))
+        msg = b',' + msg[1:]
+        new_state.pop('first_key', None)
+        state.update(new_state, size=(pos + len(msg)))
+        return msg, pos
+        
     @classmethod
     def get_testing_options(cls, **kwargs):
         r"""Method to return a dictionary of testing options for this class.
@@ -5,6 +5,10 @@ from yggdrasil import platform
 from yggdrasil.serialize.SerializeBase import SerializeBase
 
 
+# Size of the header preceding the variables in a level 5 .mat file
+_mat_header_size = 128
+
+
 class MatSerialize(SerializeBase):
     r"""Class for serializing a python object into a bytes message using the
     Matlab .mat format."""
@@ -73,6 +77,54 @@ class MatSerialize(SerializeBase):
             total.update(x)
         return [total]
         
+    def get_append_state(self, obj, msg):
+        r"""Get the information required to append the serialization of
+        another object to a file so that the file contains the serialization
+        of the concatenated objects (see concatenate).
+
+        Args:
+            obj (object): Object contained by the file.
+            msg (bytes): Serialization of obj that was written to the file.
+
+        Returns:
+            dict: Append state that should be passed to serialize_append or
+                None if objects cannot be appended to the file.
+
+        """
+        if not isinstance(obj, dict):
+            return None
+        return {'keys': set(obj.keys()), 'size': len(msg)}
+
+    def serialize_append(self, obj, state):
+        r"""Serialize an object so that it can be written to a file that
+        already contains serialized objects without rewriting the parts of
+        the file that will not change. The resulting file will be identical to
+        the serialization of the concatenated objects (see concatenate) with
+        the exception of the creation time stamp in the header.
+
+        Args:
+            obj (object): Object to serialize.
+            state (dict): Append state describing the current contents of the
+                file as returned by get_append_state. If the object can be
+                appended, the state will be updated to reflect the new contents.
+
+        Returns:
+            tuple(bytes, int): Serialized message and the position in the file
+                that it should be written to (the file should be truncated at
+                this position first). None is returned if the object cannot
+                be appended and the entire file must be rewritten.
+
+        """
+        # Variables that replace existing ones must be written in place
+        if (not isinstance(obj, dict)) or state['keys'].intersection(obj.keys()):
+            return None
+        # Each variable is a self-contained element following the header
+        msg = self.func_serialize(obj)[_mat_header_size:]
+        pos = state['size']
+        state['keys'].update(obj.keys())
+        state['size'] += len(msg)
+        return msg, pos
+
     @classmethod
     def get_testing_options(cls):
         r"""Method to return a dictionary of testing options for this class.
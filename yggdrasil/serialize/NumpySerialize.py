@@ -0,0 +1,77 @@
+import io as sio
+import numpy as np
+from yggdrasil.serialize.SerializeBase import SerializeBase
+
+
+class NumpySerialize(SerializeBase):
+    r"""Class for serializing a numpy array into a bytes message using the
+    numpy .npy format."""
+
+    _seritype = 'npy'
+    _schema_subtype_description = ('Serializes numpy arrays using the numpy '
+                                   '.npy format.')
+    concats_as_str = False
+
+    def func_serialize(self, args):
+        r"""Serialize a message.
+
+        Args:
+            args (np.ndarray): Array to be serialized.
+
+        Returns:
+            bytes, str: Serialized message.
+
+        """
+        fd = sio.BytesIO()
+        np.save(fd, np.asarray(args), allow_pickle=False)
+        out = fd.getvalue()
+        fd.close()
+        return out
+
+    def func_deserialize(self, msg):
+        r"""Deserialize a message.
+
+        Args:
+            msg (str, bytes): Message to be deserialized.
+
+        Returns:
+            np.ndarray: Deserialized array.
+
+        """
+        fd = sio.BytesIO(msg)
+        out = np.load(fd, allow_pickle=False)
+        fd.close()
+        return out
+
+    @classmethod
+    def concatenate(cls, objects, **kwargs):
+        r"""Concatenate objects to get object that would be recieved if
+        the concatenated serialization were deserialized.
+
+        Args:
+            objects (list): Objects to be concatenated.
+            **kwargs: Additional keyword arguments are ignored.
+
+        Returns:
+            list: Set of objects that results from concatenating those provided.
+
+        """
+        if len(objects) == 0:
+            return []
+        return [np.concatenate([np.atleast_1d(x) for x in objects])]
+
+    @classmethod
+    def get_testing_options(cls):
+        r"""Method to return a dictionary of testing options for this class.
+
+        Returns:
+            dict: Dictionary of variables to use for testing.
+
+        """
+        msg1 = np.arange(6, dtype='float64').reshape((3, 2))
+        msg2 = np.arange(6, 10, dtype='float64').reshape((2, 2))
+        out = super(NumpySerialize, cls).get_testing_options()
+        out['objects'] = [msg1, msg2]
+        out['contents'] = cls().func_serialize(
+            cls.concatenate(out['objects'])[0])
+        return out
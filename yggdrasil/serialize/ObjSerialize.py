@@ -9,6 +9,7 @@ class ObjSerialize(PlySerialize):
     _seritype = 'obj'
     _schema_subtype_description = ('Serialize 3D structures using Obj format.')
     default_datatype = {'type': 'obj'}
+    dict_class = ObjDict
 
     def func_serialize(self, args):
         r"""Serialize a message.
@@ -33,7 +34,12 @@ class ObjSerialize(PlySerialize):
             obj: Deserialized message.
 
         """
-        return ObjDict(self.datatype.decode_data(msg, self.typedef))
+        out = self.datatype.decode_data(msg, self.typedef)
+        if isinstance(out, self.dict_class):
+            # Decoded objects are already valid and do not need to be
+            # validated again
+            return out
+        return self.dict_class(out)
 
     @classmethod
     def get_testing_options(cls):
@@ -3,7 +3,9 @@ import copy
 import numpy as np
 import warnings
 import io as sio
+import struct
 from yggdrasil import platform, serialize, units
+from yggdrasil.metaschema.encoder import encode_json, decode_json
 from yggdrasil.metaschema.datatypes.JSONArrayMetaschemaType import (
     JSONArrayMetaschemaType)
 from yggdrasil.serialize.AsciiTableSerialize import AsciiTableSerialize
@@ -18,6 +20,11 @@ class PandasSerialize(AsciiTableSerialize):
             serialized from/to tables. Defaults to False.
         str_as_bytes (bool, optional): If True, strings in columns are
             read as bytes. Defaults to False.
+        binary (bool, optional): If True, frames are serialized in a binary
+            columnar format rather than as CSV. Frames that cannot be
+            represented in the binary format (e.g. columns containing mixed
+            objects) are still serialized as CSV. Deserialization detects
+            the format automatically. Defaults to False.
 
     """
 
@@ -26,11 +33,14 @@ class PandasSerialize(AsciiTableSerialize):
     _schema_properties = {'no_header': {'type': 'boolean',
                                         'default': False},
                           'str_as_bytes': {'type': 'boolean',
-                                           'default': False}}
+                                           'default': False},
+                          'binary': {'type': 'boolean',
+                                     'default': False}}
     _schema_excluded_from_inherit = ['as_array']
     default_read_meth = 'read'
     as_array = True
     concats_as_str = False
+    binary_prefix = b'YGGPDBIN'
     # has_header = False
 
     def __init__(self, *args, **kwargs):
@@ -123,6 +133,112 @@ class PandasSerialize(AsciiTableSerialize):
             out = np.dtype('U%d' % out.itemsize)
         return out
     
+    def prepare_frame(self, frame):
+        r"""Apply field names to a frame prior to serialization.
+
+        Args:
+            frame (pandas.DataFrame): Frame that will be serialized. The
+                columns of the frame may be modified.
+
+        Returns:
+            pandas.DataFrame: Frame with columns for serialization.
+
+        """
+        frame = self.apply_field_names(frame, self.field_names)
+        if not self.no_header:
+            cols = frame.columns.tolist()
+            if cols == list(range(len(cols))):
+                frame = self.apply_field_names(frame, ['f%d' % i for i in
+                                                       range(len(cols))])
+        return frame
+
+    def serialize_binary(self, frame):
+        r"""Serialize a frame in the binary columnar format. The message
+        consists of binary_prefix, the size of a JSON header describing
+        the columns as a little endian unsigned 64bit integer, the JSON
+        header, and the raw column buffers. Numeric columns are written as
+        the bytes of the underlying array and string columns are written
+        as the UTF-8 encoding of the concatenated strings followed by the
+        number of characters in each string.
+
+        Args:
+            frame (pandas.DataFrame): Frame to serialize.
+
+        Returns:
+            bytes: Serialized message. None is returned if the frame cannot
+                be represented in the binary format.
+
+        """
+        if not frame.columns.is_unique:
+            return None
+        header = {'nrows': len(frame), 'columns': []}
+        buffers = []
+        for c in frame.columns:
+            if not isinstance(c, (str, int)):
+                return None
+            arr = frame[c].to_numpy()
+            if arr.dtype.kind in 'biufc':
+                arr = np.ascontiguousarray(arr)
+                header['columns'].append({'name': c, 'dtype': arr.dtype.str})
+                buffers.append(arr.tobytes())
+                continue
+            if arr.dtype.kind != 'O':
+                return None
+            strs = []
+            for x in arr:
+                if isinstance(x, bytes):
+                    x = x.decode('utf-8')
+                elif not isinstance(x, str):
+                    return None
+                strs.append(x)
+            data = ''.join(strs).encode('utf-8')
+            lengths = np.array([len(x) for x in strs], dtype='<i8')
+            header['columns'].append({'name': c, 'dtype': 'string',
+                                      'size': len(data)})
+            buffers += [data, lengths.tobytes()]
+        header = encode_json(header)
+        return b''.join([self.binary_prefix,
+                         struct.pack('<Q', len(header)), header]
+                        + buffers)
+
+    def deserialize_binary(self, msg):
+        r"""Deserialize a frame from the binary columnar format produced by
+        serialize_binary.
+
+        Args:
+            msg (bytes): Message to be deserialized.
+
+        Returns:
+            pandas.DataFrame: Deserialized frame.
+
+        """
+        pos = len(self.binary_prefix)
+        header_size = struct.unpack('<Q', msg[pos:(pos + 8)])[0]
+        pos += 8
+        header = decode_json(msg[pos:(pos + header_size)])
+        pos += header_size
+        nrows = header['nrows']
+        data = {}
+        for col in header['columns']:
+            if col['dtype'] == 'string':
+                chars = msg[pos:(pos + col['size'])].decode('utf-8')
+                pos += col['size']
+                ends = np.cumsum(np.frombuffer(msg, dtype='<i8', count=nrows,
+                                               offset=pos))
+                pos += 8 * nrows
+                starts = np.concatenate([[0], ends[:-1]])
+                values = np.empty(nrows, dtype=object)
+                values[:] = [chars[i:j] for i, j in zip(starts.tolist(),
+                                                        ends.tolist())]
+            else:
+                dtype = np.dtype(col['dtype'])
+                values = np.frombuffer(msg, dtype=dtype, count=nrows,
+                                       offset=pos).copy()
+                pos += dtype.itemsize * nrows
+            data[col['name']] = values
+        return pandas.DataFrame(data, columns=[col['name'] for col
+                                               in header['columns']])
+
     def func_serialize(self, args):
         r"""Serialize a message.
 
@@ -136,20 +252,20 @@ class PandasSerialize(AsciiTableSerialize):
         if not isinstance(args, pandas.DataFrame):
             raise TypeError(("Pandas DataFrame required. Invalid type "
                              + "of '%s' provided.") % type(args))
+        if (self.field_names is None) and (not self.no_header):
+            self.field_names = self.get_field_names()
+        if self.binary:
+            out = self.serialize_binary(
+                self.prepare_frame(args.copy(deep=False)))
+            if out is not None:
+                return out
         fd = sio.StringIO()
         # For Python 3 and higher, bytes need to be encoded
         args_ = copy.deepcopy(args)
         for c in args.columns:
             if isinstance(args_[c][0], bytes):
                 args_[c] = args_[c].apply(lambda s: s.decode('utf-8'))
-        if (self.field_names is None) and (not self.no_header):
-            self.field_names = self.get_field_names()
-        args_ = self.apply_field_names(args_, self.field_names)
-        if not self.no_header:
-            cols = args_.columns.tolist()
-            if cols == list(range(len(cols))):
-                args_ = self.apply_field_names(args_, ['f%d' % i for i in
-                                                       range(len(cols))])
+        args_ = self.prepare_frame(args_)
         args_.to_csv(fd, index=False,
                      # Not in pandas <0.24
                      # line_terminator=self.newline.decode("utf-8"),
@@ -175,7 +291,6 @@ class PandasSerialize(AsciiTableSerialize):
             obj: Deserialized Python object.
 
         """
-        fd = sio.BytesIO(msg)
         names = None
         dtype = None
         if self.initialized:
@@ -190,17 +305,23 @@ class PandasSerialize(AsciiTableSerialize):
                     dtype[n] = object
                 else:
                     dtype[n] = np_dtype[n]
-        kws = dict(sep=self.delimiter.decode("utf-8"),
-                   names=names,
-                   dtype=dtype,
-                   encoding='utf8',
-                   skipinitialspace=True)
-        if self.no_header:
-            kws['header'] = None
-        out = pandas.read_csv(fd, **kws)
-        out = out.dropna(axis='columns', how='all')
-        fd.close()
-        if self.str_as_bytes:
+        if msg.startswith(self.binary_prefix):
+            out = self.deserialize_binary(msg)
+            if self.no_header:
+                out.columns = range(len(out.columns))
+        else:
+            fd = sio.BytesIO(msg)
+            kws = dict(sep=self.delimiter.decode("utf-8"),
+                       names=names,
+                       dtype=dtype,
+                       encoding='utf8',
+                       skipinitialspace=True)
+            if self.no_header:
+                kws['header'] = None
+            out = pandas.read_csv(fd, **kws)
+            out = out.dropna(axis='columns', how='all')
+            fd.close()
+        if self.str_as_bytes and (len(out) > 0):
             # Make sure strings are bytes
             for c, d in zip(out.columns, out.dtypes):
                 if (d == object) and isinstance(out[c][0], str):
@@ -316,7 +437,7 @@ class PandasSerialize(AsciiTableSerialize):
         
     @classmethod
     def get_testing_options(cls, not_as_frames=False, no_names=False,
-                            no_header=False, **kwargs):
+                            no_header=False, binary=False, **kwargs):
         r"""Method to return a dictionary of testing options for this class.
 
         Args:
@@ -327,6 +448,9 @@ class PandasSerialize(AsciiTableSerialize):
                 names are not provided to the deserializer. Defaults to False.
             no_header (bool, optional): If True, an example is returned
             where a header is not included. Defaults to False.
+            binary (bool, optional): If True, an example is returned where
+                frames are serialized in the binary format. Defaults to
+                False.
 
         Returns:
             dict: Dictionary of variables to use for testing.
@@ -342,6 +466,8 @@ class PandasSerialize(AsciiTableSerialize):
             if k in out['kwargs']:
                 del out['kwargs'][k]
         out['extra_kwargs'] = {}
+        if binary:
+            out['kwargs']['binary'] = True
         if no_names:
             for x in [out['kwargs'], out]:
                 if 'field_names' in x:
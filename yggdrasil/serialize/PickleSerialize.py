@@ -1,11 +1,16 @@
 import sys
 import pickle
+import struct
 import io as sio
 from yggdrasil.serialize.DefaultSerialize import DefaultSerialize
 
 
 class PickleSerialize(DefaultSerialize):
     r"""Class for serializing a python object into a bytes message by pickling.
+    When pickle protocol 5 is available, large buffers (e.g. the data in
+    numpy arrays) are pickled out-of-band and appended to the message after
+    the pickle stream so that they are not copied into and back out of the
+    stream.
     """
 
     _seritype = 'pickle'
@@ -13,6 +18,60 @@ class PickleSerialize(DefaultSerialize):
                                    'pickle.')
     _default_type = {'type': 'bytes'}
     is_framed = True
+    buffer_prefix = b'YGGPKL5\x00'
+    buffer_alignment = 64
+    min_buffer_size = 1024
+    _header_format = '<QQ'
+    _header_size = len(buffer_prefix) + struct.calcsize(_header_format)
+    _last_frame = None
+
+    @classmethod
+    def get_buffer_layout(cls, data_size, buffer_sizes):
+        r"""Determine the location of the pickle stream and out-of-band
+        buffers in a message. Buffers are aligned relative to the start of
+        the message.
+
+        Args:
+            data_size (int): Size of the pickle stream.
+            buffer_sizes (list): Sizes of the out-of-band buffers.
+
+        Returns:
+            tuple(int, list, int): Position of the pickle stream, positions
+                of the buffers, and the total size of the message.
+
+        """
+        pos = cls._header_size + 8 * len(buffer_sizes)
+        data_pos = pos
+        pos += data_size
+        buffer_pos = []
+        for x in buffer_sizes:
+            pos += (-pos) % cls.buffer_alignment
+            buffer_pos.append(pos)
+            pos += x
+        return data_pos, buffer_pos, pos
+
+    @classmethod
+    def get_message_size(cls, msg):
+        r"""Determine the size of the message containing out-of-band
+        buffers that starts at the beginning of the provided bytes.
+
+        Args:
+            msg (bytes): Start of a message containing out-of-band buffers.
+
+        Returns:
+            int: Size of the message. None is returned if the header is
+                incomplete.
+
+        """
+        if len(msg) < cls._header_size:
+            return None
+        data_size, nbuffers = struct.unpack_from(
+            cls._header_format, msg, len(cls.buffer_prefix))
+        if len(msg) < (cls._header_size + 8 * nbuffers):
+            return None
+        buffer_sizes = struct.unpack_from('<%dQ' % nbuffers, msg,
+                                          cls._header_size)
+        return cls.get_buffer_layout(data_size, buffer_sizes)[-1]
 
     def func_serialize(self, args):
         r"""Serialize a message.
@@ -24,7 +83,31 @@ class PickleSerialize(DefaultSerialize):
             bytes, str: Serialized message.
 
         """
-        return pickle.dumps(args)
+        if pickle.HIGHEST_PROTOCOL < 5:  # pragma: no cover
+            return pickle.dumps(args)
+        buffers = []
+
+        def buffer_callback(x):
+            x = x.raw()
+            if x.nbytes < self.min_buffer_size:
+                return True
+            buffers.append(x)
+            return False
+
+        data = pickle.dumps(args, protocol=5, buffer_callback=buffer_callback)
+        if not buffers:
+            return data
+        buffer_sizes = [x.nbytes for x in buffers]
+        data_pos, buffer_pos, _ = self.get_buffer_layout(len(data),
+                                                         buffer_sizes)
+        parts = [self.buffer_prefix,
+                 struct.pack(self._header_format, len(data), len(buffers)),
+                 struct.pack('<%dQ' % len(buffers), *buffer_sizes), data]
+        pos = data_pos + len(data)
+        for x, x_pos in zip(buffers, buffer_pos):
+            parts += [b'\x00' * (x_pos - pos), x]
+            pos = x_pos + x.nbytes
+        return b''.join(parts)
 
     def func_deserialize(self, msg):
         r"""Deserialize a message.
@@ -36,7 +119,28 @@ class PickleSerialize(DefaultSerialize):
             obj: Deserialized Python object.
 
         """
-        return pickle.loads(msg)
+        last_frame, self._last_frame = self._last_frame, None
+        if (last_frame is not None) and (last_frame[0] == msg):
+            # Frame was already unpickled when it was read from a file
+            return last_frame[1]
+        if not msg.startswith(self.buffer_prefix):
+            return pickle.loads(msg)
+        data_size, nbuffers = struct.unpack_from(
+            self._header_format, msg, len(self.buffer_prefix))
+        buffer_sizes = struct.unpack_from('<%dQ' % nbuffers, msg,
+                                          self._header_size)
+        data_pos, buffer_pos, _ = self.get_buffer_layout(data_size,
+                                                         buffer_sizes)
+        msg = memoryview(msg)
+        buffers = []
+        for x_pos, x_size in zip(buffer_pos, buffer_sizes):
+            x = msg[x_pos:(x_pos + x_size)]
+            if msg.readonly:
+                # Copy buffers so that the reconstructed objects are writable
+                x = bytearray(x)
+            buffers.append(x)
+        return pickle.loads(msg[data_pos:(data_pos + data_size)],
+                            buffers=buffers)
 
     @classmethod
     def get_first_frame(cls, msg):
@@ -51,6 +155,11 @@ class PickleSerialize(DefaultSerialize):
                 are found, an empty string will be returned.
 
         """
+        if msg.startswith(cls.buffer_prefix):
+            used = cls.get_message_size(msg)
+            if (used is None) or (len(msg) < used):
+                return b''
+            return msg[:used]
         fd = sio.BytesIO(msg)
         try:
             pickle.load(fd)
@@ -60,6 +169,51 @@ class PickleSerialize(DefaultSerialize):
         fd.close()
         return msg[:used]
 
+    def read_frame(self, fd):
+        r"""Read one frame from a file. Frames without out-of-band buffers
+        are unpickled directly from the file to find their end and the
+        resulting object is kept so that deserializing the returned frame
+        does not unpickle it a second time.
+
+        Args:
+            fd (file): File object opened in binary mode that is positioned at
+                the start of a frame.
+
+        Returns:
+            bytes: Frame read from the file. If a complete frame cannot be read,
+                an empty string will be returned and the file position will
+                not be changed.
+
+        """
+        self._last_frame = None
+        start = fd.tell()
+        if fd.read(len(self.buffer_prefix)) == self.buffer_prefix:
+            fd.seek(start)
+            header = fd.read(self._header_size)
+            if len(header) == self._header_size:
+                nbuffers = struct.unpack_from(self._header_format, header,
+                                              len(self.buffer_prefix))[1]
+                header += fd.read(8 * nbuffers)
+            size = self.get_message_size(header)
+            fd.seek(start)
+            if size is not None:
+                out = fd.read(size)
+                if len(out) == size:
+                    return out
+                fd.seek(start)
+            return b''
+        fd.seek(start)
+        try:
+            obj = pickle.Unpickler(fd).load()
+        except (EOFError, pickle.UnpicklingError):
+            fd.seek(start)
+            return b''
+        end = fd.tell()
+        fd.seek(start)
+        out = fd.read(end - start)
+        self._last_frame = (out, obj)
+        return out
+
     @classmethod
     def concatenate(cls, objects, **kwargs):
         r"""Concatenate objects to get object that would be recieved if
@@ -90,8 +244,8 @@ class PickleSerialize(DefaultSerialize):
                 + b'\x80\x03C\x0fTest message 2\nq\x00.')
         else:  # pragma: Python 3.8
             out['contents'] = (
-                b'\x80\x04\x95\x11\x00\x00\x00\x00\x00\x00\x00C\r'
-                + b'Test message\n\x94.\x80\x04\x95\x13'
+                b'\x80\x05\x95\x11\x00\x00\x00\x00\x00\x00\x00C\r'
+                + b'Test message\n\x94.\x80\x05\x95\x13'
                 + b'\x00\x00\x00\x00\x00\x00\x00C\x0f'
                 + b'Test message 2\n\x94.')
         return out
@@ -27,7 +27,13 @@ class PlySerialize(SerializeBase):
         'newline': {'type': 'string',
                     'default': _default_newline_str}}
     default_datatype = {'type': 'ply'}
+    # New objects are not appended to existing files. Added elements change
+    # the element counts in the header (Ply) and shift every section after
+    # the vertices (Ply & Obj). Because files must be identical to the
+    # serialization of the concatenated objects, each send would still
+    # rewrite the file from the header onward.
     concats_as_str = False
+    dict_class = PlyDict
 
     def __init__(self, *args, **kwargs):
         r"""Initialize immediately as default is only type."""
@@ -57,7 +63,12 @@ class PlySerialize(SerializeBase):
             obj: Deserialized message.
 
         """
-        return PlyDict(self.datatype.decode_data(msg, self.typedef))
+        out = self.datatype.decode_data(msg, self.typedef)
+        if isinstance(out, self.dict_class):
+            # Decoded objects are already valid and do not need to be
+            # validated again
+            return out
+        return self.dict_class(out)
 
     @classmethod
     def concatenate(cls, objects, **kwargs):
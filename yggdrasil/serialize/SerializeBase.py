@@ -169,6 +169,43 @@ class SerializeBase(tools.YggClass):
         """
         return objects
 
+    def get_append_state(self, obj, msg):
+        r"""Get the information required to append the serialization of
+        another object to a file so that the file contains the serialization
+        of the concatenated objects (see concatenate).
+
+        Args:
+            obj (object): Object contained by the file.
+            msg (bytes): Serialization of obj that was written to the file.
+
+        Returns:
+            dict: Append state that should be passed to serialize_append or
+                None if objects cannot be appended to the file.
+
+        """
+        return None
+
+    def serialize_append(self, obj, state):
+        r"""Serialize an object so that it can be written to a file that
+        already contains serialized objects without rewriting the parts of
+        the file that will not change. The resulting file will be identical to
+        the serialization of the concatenated objects (see concatenate).
+
+        Args:
+            obj (object): Object to serialize.
+            state (dict): Append state describing the current contents of the
+                file as returned by get_append_state. If the object can be
+                appended, the state will be updated to reflect the new contents.
+
+        Returns:
+            tuple(bytes, int): Serialized message and the position in the file
+                that it should be written to (the file should be truncated at
+                this position first). None is returned if the object cannot
+                be appended and the entire file must be rewritten.
+
+        """
+        return None
+
     @classmethod
     def get_testing_options(cls, table_example=False, array_columns=False,
                             include_oldkws=False, table_string_type='bytes'):
@@ -1,18 +1,11 @@
 import re
 import copy
+import functools
 import numpy as np
-import pandas
 import io as sio
 from yggdrasil import platform, units, scanf, tools
-try:
-    from astropy.io import ascii as apy_ascii
-    from astropy.table import Table as apy_Table
-    _use_astropy = True
-except ImportError:  # pragma: no cover
-    apy_ascii, apy_Table = None, None
-    # print("astropy is not installed, reading/writing as an array will be "
-    #       + "disabled. astropy can be installed using 'pip install astropy'.")
-    _use_astropy = False
+_astropy = None
+_DataFrame = tools.lazy_type('pandas', 'DataFrame')
 
 
 _fmt_char = b'%'
@@ -23,6 +16,8 @@ _fmt_char_str = _fmt_char.decode("utf-8")
 _default_comment_str = _default_comment.decode("utf-8")
 _default_delimiter_str = _default_delimiter.decode("utf-8")
 _default_newline_str = _default_newline.decode("utf-8")
+_table_chunk_size = 10000
+_format_cache_size = 128
 
 
 def extract_formats(fmt_str):
@@ -302,25 +297,37 @@ def format_message(args, fmt_str):
             format fields.
 
     """
-    if not isinstance(args, (tuple, list)):
-        args = (args, )
-    nfmt = len(extract_formats(fmt_str))
-    args_ = []
-    if len(args) < nfmt:
-        raise RuntimeError("Number of arguments (%d) does not match " % len(args)
-                           + "number of format fields (%d)." % nfmt)
-    for a0 in args:
-        a = units.get_data(a0)
-        if np.iscomplexobj(a):
-            args_ += [a.real, a.imag]
-        elif isinstance(a, bytes) and isinstance(fmt_str, str):
-            args_.append(a.decode("utf-8"))
-        elif isinstance(a, str) and isinstance(fmt_str, bytes):
-            args_.append(a.encode("utf-8"))
+    return compile_format(fmt_str).format(args)
+
+
+def format_rows(arr, fmt_str):
+    r"""Format the rows in a structured array using a format string. The
+    columns are converted to Python objects all at once so that the output
+    is the same as calling format_message on each row.
+
+    Args:
+        arr (np.ndarray): Structured array with one field for each format
+            code in fmt_str.
+        fmt_str (str, bytes): Format string that should be used to format
+            each row.
+
+    Returns:
+        str, bytes: Formatted rows. The type will match the type of the
+            fmt_str.
+
+    """
+    cols = []
+    for n in arr.dtype.names:
+        x = arr[n]
+        if np.iscomplexobj(x):
+            cols += [x.real.tolist(), x.imag.tolist()]
+        elif (x.dtype.kind == 'S') and isinstance(fmt_str, str):
+            cols.append(np.char.decode(x, 'utf-8').tolist())
+        elif (x.dtype.kind == 'U') and isinstance(fmt_str, bytes):
+            cols.append(np.char.encode(x, 'utf-8').tolist())
         else:
-            args_.append(a)
-    out = fmt_str % tuple(args_)
-    return out
+            cols.append(x.tolist())
+    return fmt_str[:0].join([fmt_str % row for row in zip(*cols)])
 
 
 def process_message(msg, fmt_str):
@@ -342,22 +349,157 @@ def process_message(msg, fmt_str):
     """
     if not isinstance(msg, (str, bytes)):
         raise TypeError("Message must be a string or bytes string type.")
-    nfmt = len(extract_formats(fmt_str))
-    py_fmt_str = cformat2pyscanf(fmt_str)
-    args = scanf.scanf(py_fmt_str, msg)
-    if args is None:
-        nargs = 0
-    else:
-        nargs = len(args)
-        if len(args) > 1:
-            dtype = cformat2nptype(fmt_str)
-            dtype_list = [dtype[i] for i in range(nargs)]
-            args = tuple([np.array([a], idtype)[0] for
-                          a, idtype in zip(args, dtype_list)])
-    if nargs != nfmt:
-        raise ValueError("%d arguments were extracted, " % nargs
-                         + "but format string expected %d." % nfmt)
-    return args
+    return compile_format(fmt_str).parse(msg)
+
+
+class CompiledFormat(object):
+    r"""Information required to format/parse messages using a format string
+    that is computed once so that it can be reused for each message.
+
+    Args:
+        fmt_str (str, bytes): Format string.
+
+    Attributes:
+        fmt_str (str, bytes): Format string.
+        fmts (list): Format codes in the format string.
+        nfmt (int): Number of format codes in the format string.
+        dtype (np.dtype): Numpy data type for the format string. None if
+            there are not any format codes in the format string.
+        regex (re.Pattern): Regular expression used to parse messages. None
+            if there are not any format codes in the format string.
+        casts (list): Functions used to cast strings extracted by regex.
+        dtype_casts (list): Functions used to cast each extracted value to
+            the numpy type of the field when there is more than one field.
+
+    """
+
+    def __init__(self, fmt_str):
+        self.fmt_str = fmt_str
+        self.fmts = extract_formats(fmt_str)
+        self.nfmt = len(self.fmts)
+        self.dtype = None
+        self.regex = None
+        self.casts = []
+        self.dtype_casts = []
+        if self.nfmt == 0:
+            return
+        self.dtype = cformat2nptype(fmt_str)
+        self.regex, self.casts = scanf.scanf_compile(
+            tools.bytes2str(cformat2pyscanf(fmt_str)))
+        if self.nfmt > 1:
+            self.dtype_casts = [self.get_dtype_cast(self.dtype[i])
+                                for i in range(self.nfmt)]
+
+    @staticmethod
+    def get_dtype_cast(dtype):
+        r"""Get a function that will cast a value to a numpy data type in
+        the same way as np.array([value], dtype)[0].
+
+        Args:
+            dtype (np.dtype): Data type that values should be cast to.
+
+        Returns:
+            callable: Casting function.
+
+        """
+        if (dtype.kind == 'S') and dtype.itemsize:
+            nchar = dtype.itemsize
+
+            def cast_bytes(x):
+                return np.bytes_(x[:nchar])
+
+            return cast_bytes
+        return dtype.type
+
+    def format(self, args):
+        r"""Format a message from a list of arguments.
+
+        Args:
+            args (list, obj): List of arguments or single argument that should
+                be formatted.
+
+        Returns:
+            str, bytes: Formatted message. The type will match the type of the
+                fmt_str.
+
+        Raises:
+            RuntimeError: If the number of arguments does not match the number
+                of format fields.
+
+        """
+        if not isinstance(args, (tuple, list)):
+            args = (args, )
+        if len(args) < self.nfmt:
+            raise RuntimeError("Number of arguments (%d) does not match "
+                               % len(args)
+                               + "number of format fields (%d)." % self.nfmt)
+        as_bytes = isinstance(self.fmt_str, bytes)
+        args_ = []
+        for a0 in args:
+            a = units.get_data(a0)
+            if np.iscomplexobj(a):
+                args_ += [a.real, a.imag]
+            elif isinstance(a, bytes) and (not as_bytes):
+                args_.append(a.decode("utf-8"))
+            elif isinstance(a, str) and as_bytes:
+                args_.append(a.encode("utf-8"))
+            else:
+                args_.append(a)
+        return self.fmt_str % tuple(args_)
+
+    def parse(self, msg):
+        r"""Extract python objects from a message.
+
+        Args:
+            msg (str, bytes): Message that should be parsed.
+
+        Returns:
+            tuple: Variables extracted from the message.
+
+        Raises:
+            ValueError: If there are not any format codes in the format string.
+            ValueError: If the expected number of variables cannot be
+                extracted from the message.
+
+        """
+        if self.regex is None:
+            raise ValueError("Could not locate any format codes in the "
+                             + "provided format string (%s)." % self.fmt_str)
+        as_bytes = isinstance(msg, bytes)
+        if as_bytes:
+            msg = msg.decode("utf-8")
+        found = self.regex.search(msg)
+        if found:
+            args = [c(g) for c, g in zip(self.casts, found.groups())]
+            if as_bytes:
+                args = [a.encode("utf-8") if isinstance(a, str) else a
+                        for a in args]
+            nargs = len(args)
+            if nargs > 1:
+                args = [c(a) for c, a in zip(self.dtype_casts, args)]
+            args = tuple(args)
+        else:
+            args = None
+            nargs = 0
+        if nargs != self.nfmt:
+            raise ValueError("%d arguments were extracted, " % nargs
+                             + "but format string expected %d." % self.nfmt)
+        return args
+
+
+@functools.lru_cache(maxsize=_format_cache_size)
+def compile_format(fmt_str):
+    r"""Get the compiled version of a format string. Compiled formats are
+    cached so that they are only created once for each format string.
+
+    Args:
+        fmt_str (str, bytes): Format string.
+
+    Returns:
+        CompiledFormat: Compiled format string.
+
+    """
+    return CompiledFormat(fmt_str)
 
 
 def combine_flds(arrs, dtype=None):
@@ -559,7 +701,7 @@ def consolidate_array(arrs, dtype=None):
                                  + "data type (%s)." % dtype)
     elif isinstance(arrs, (list, tuple)):
         if isinstance(arrs[0], (np.ndarray, np.void,
-                                units._unit_array)):
+                                units._unit_array_type)):
             if len(arrs[0].dtype) > 1:
                 out = combine_eles(arrs, dtype=dtype)
             else:
@@ -644,6 +786,29 @@ def table2format(fmts=[], delimiter=None, newline=None, comment=None):
     return fmt_str
 
 
+def import_astropy():
+    r"""Import the astropy modules used to read/write tables the first time
+    they are needed.
+
+    Returns:
+        tuple: astropy.io.ascii module and astropy.table.Table class. Both
+            are None if astropy is not installed.
+
+    """
+    global _astropy
+    if _astropy is None:
+        try:
+            from astropy.io import ascii as apy_ascii
+            from astropy.table import Table as apy_Table
+            _astropy = (apy_ascii, apy_Table)
+        except ImportError:  # pragma: no cover
+            # print("astropy is not installed, reading/writing as an array "
+            #       + "will be disabled. astropy can be installed using "
+            #       + "'pip install astropy'.")
+            _astropy = (None, None)
+    return _astropy
+
+
 def array_to_table(arrs, fmt_str, use_astropy=False):
     r"""Serialize an array as an ASCII table.
 
@@ -659,8 +824,9 @@ def array_to_table(arrs, fmt_str, use_astropy=False):
         bytes: ASCII table.
 
     """
-    if not _use_astropy:
-        use_astropy = False
+    if use_astropy:
+        apy_ascii, apy_Table = import_astropy()
+        use_astropy = (apy_ascii is not None)
     dtype = cformat2nptype(fmt_str)
     if len(dtype) == 0:
         dtype = np.dtype([('f0', dtype)])
@@ -679,9 +845,8 @@ def array_to_table(arrs, fmt_str, use_astropy=False):
     else:
         fd = sio.BytesIO()
         fmt_str = tools.str2bytes(fmt_str)
-        for ele in arr1:
-            line = format_message(ele.tolist(), fmt_str)
-            fd.write(line)
+        for i in range(0, len(arr1), _table_chunk_size):
+            fd.write(format_rows(arr1[i:(i + _table_chunk_size)], fmt_str))
         # fmt = fmt_str.split(info['newline'])[0]
         # np.savetxt(fd, arr1,
         #            fmt=fmt, delimiter=info['delimiter'],
@@ -716,8 +881,9 @@ def table_to_array(msg, fmt_str=None, use_astropy=False, names=None,
         np.ndarray: Table contents as an array.
     
     """
-    if not _use_astropy:
-        use_astropy = False
+    if use_astropy:
+        apy_ascii, apy_Table = import_astropy()
+        use_astropy = (apy_ascii is not None)
     if fmt_str is None:
         dtype = None
         info = dict(delimiter=delimiter, comment=comment)
@@ -775,17 +941,93 @@ def table_to_array(msg, fmt_str=None, use_astropy=False, names=None,
         if dtype is not None:
             arr = arr.astype(dtype)
     else:
-        np_ver = tuple([float(x) for x in (np.__version__).split('.')])
-        np_kws.update(autostrip=True, dtype=None, names=names)
-        if (np_ver >= (1.0, 14.0, 0.0)):
-            np_kws['encoding'] = 'bytes'
-        arr = np.genfromtxt(fd, **np_kws)
+        arr = None
         if dtype is not None:
-            arr = arr.astype(dtype)
+            arr = read_table(fd, dtype, delimiter=info.get('delimiter', None),
+                             comment=info.get('comment', None),
+                             encoding=encoding)
+        if arr is None:
+            fd.seek(0)
+            np_ver = tuple([float(x) for x in (np.__version__).split('.')])
+            np_kws.update(autostrip=True, dtype=None, names=names)
+            if (np_ver >= (1.0, 14.0, 0.0)):
+                np_kws['encoding'] = 'bytes'
+            arr = np.genfromtxt(fd, **np_kws)
+            if dtype is not None:
+                arr = arr.astype(dtype)
     fd.close()
     return arr
 
 
+def read_table(fd, dtype, delimiter=None, comment=None, encoding='utf-8'):
+    r"""Parse an ASCII table with a known data type using the pandas C
+    parser. Columns are parsed directly into their final types rather than
+    having their types inferred from the table contents.
+
+    Args:
+        fd (file): File-like object containing the table.
+        dtype (np.dtype): Structured data type of the table rows.
+        delimiter (str, bytes, optional): String used to separate columns.
+            Defaults to _default_delimiter.
+        comment (str, bytes, optional): String used to denote comments.
+            Defaults to None and comments are not stripped.
+        encoding (str, optional): Encoding that should be used to decode
+            the table. Defaults to 'utf-8'.
+
+    Returns:
+        np.ndarray: Table contents as an array. None is returned if the
+            table cannot be parsed by the pandas C parser (e.g. a
+            multi-character delimiter or a value that cannot be cast to the
+            column type).
+
+    """
+    if dtype.names is None:
+        out = read_table(fd, np.dtype([('f0', dtype)]), delimiter=delimiter,
+                         comment=comment, encoding=encoding)
+        if out is not None:
+            out = out['f0']
+        return out
+    if delimiter is None:
+        delimiter = _default_delimiter
+    delimiter = tools.bytes2str(delimiter)
+    np_kws = dict(sep=delimiter, header=None, names=list(dtype.names),
+                  engine='c', skipinitialspace=True, na_filter=False,
+                  encoding=encoding, dtype={})
+    if len(delimiter) != 1:
+        return None
+    if comment is not None:
+        comment = tools.bytes2str(comment).strip()
+        if len(comment) != 1:
+            return None
+        np_kws['comment'] = comment
+    for n in dtype.names:
+        if dtype[n].kind in 'SUc':
+            np_kws['dtype'][n] = str
+        else:
+            np_kws['dtype'][n] = dtype[n]
+    import pandas
+    try:
+        frame = pandas.read_csv(fd, **np_kws)
+    except pandas.errors.EmptyDataError:
+        return np.zeros(0, dtype)
+    except (ValueError, TypeError, OverflowError):
+        return None
+    arr = np.empty(len(frame), dtype)
+    try:
+        for n in dtype.names:
+            x = frame[n].to_numpy()
+            if dtype[n].kind in 'SU':
+                x = np.char.strip(x.astype('U'))
+                if dtype[n].kind == 'S':
+                    x = np.char.encode(x, encoding)
+            elif dtype[n].kind == 'c':
+                x = x.astype('U').astype(dtype[n])
+            arr[n] = x
+    except (ValueError, TypeError):
+        return None
+    return arr
+
+
 def array_to_bytes(arrs, dtype=None, order='C'):
     r"""Serialize an array to bytes.
 
@@ -1245,6 +1487,7 @@ def numpy2pandas(arr):
     """
     if not isinstance(arr, np.ndarray):
         raise TypeError("arr must be a numpy array, not %s." % type(arr))
+    import pandas
     out = pandas.DataFrame(arr)
     return out
 
@@ -1261,7 +1504,7 @@ def pandas2numpy(frame, index=False):
         np.ndarray: Structured numpy array.
 
     """
-    if not isinstance(frame, pandas.DataFrame):
+    if not isinstance(frame, _DataFrame):
         raise TypeError("frame must be a pandas data frame, not %s." % type(frame))
     arr = frame.to_records(index=index)
     # Covert object type to string
@@ -1316,7 +1559,7 @@ def pandas2dict(frame):
         dict: Dictionary with contents from the input frame.
 
     """
-    if not isinstance(frame, pandas.DataFrame):
+    if not isinstance(frame, _DataFrame):
         raise TypeError("frame must be a pandas data frame, not %s." % type(frame))
     return numpy2dict(pandas2numpy(frame))
 
@@ -1333,6 +1576,7 @@ def list2pandas(l, names=None):
         pandas.DataFrame: Pandas data frame with contents from the input list.
 
     """
+    import pandas
     out = numpy2pandas(list2numpy(l, names=names))
     if names is None:
         out.columns = pandas.RangeIndex(len(l))
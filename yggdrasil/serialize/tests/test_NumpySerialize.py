@@ -0,0 +1,7 @@
+from yggdrasil.serialize.tests import test_SerializeBase as parent
+
+
+class TestNumpySerialize(parent.TestSerializeBase):
+    r"""Test class for TestNumpySerialize class."""
+
+    _cls = 'NumpySerialize'
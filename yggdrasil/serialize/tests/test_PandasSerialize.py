@@ -43,3 +43,18 @@ class TestPandasSerializeBytes(TestPandasSerialize):
     r"""Test class for PandasSerialize class when strings are bytes."""
 
     testing_option_kws = {'table_string_type': 'bytes'}
+
+
+class TestPandasSerializeBinary(TestPandasSerialize):
+    r"""Test class for PandasSerialize class with binary serialization."""
+
+    testing_option_kws = {'binary': True}
+
+    def test_binary_format(self):
+        r"""Test that frames are serialized in the binary format and that
+        frames with mixed object columns cannot be."""
+        x = self.instance.func_serialize(self.testing_options['objects'][0])
+        assert(x.startswith(self.instance.binary_prefix))
+        frame = self.testing_options['objects'][0].copy()
+        frame[frame.columns[0]] = [None] + frame[frame.columns[0]].tolist()[1:]
+        assert(self.instance.serialize_binary(frame) is None)
@@ -1,3 +1,5 @@
+import io
+import numpy as np
 from yggdrasil.serialize.tests import test_SerializeBase as parent
 
 
@@ -9,3 +11,38 @@ class TestPickleSerialize(parent.TestSerializeBase):
     def test_get_first_frame(self):
         r"""Test get_first_frame for empty message."""
         self.assert_equal(self.import_cls.get_first_frame(b'not a pickle'), b'')
+
+    def test_read_frame(self):
+        r"""Test read_frame for complete and incomplete frames."""
+        msg = self.instance.func_serialize(b'Test message')
+        fd = io.BytesIO(msg + msg[:-1])
+        self.assert_equal(self.instance.read_frame(fd), msg)
+        self.assert_equal(fd.tell(), len(msg))
+        self.assert_equal(self.instance.read_frame(fd), b'')
+        self.assert_equal(fd.tell(), len(msg))
+
+    def test_read_frame_decoded_once(self):
+        r"""Test that frames read from a file are only unpickled once."""
+        obj = {'a': [1, 2, 3]}
+        msg = self.instance.func_serialize(obj)
+        fd = io.BytesIO(msg)
+        self.assert_equal(self.instance.read_frame(fd), msg)
+        decoded = self.instance._last_frame[1]
+        assert(self.instance.func_deserialize(msg) is decoded)
+        # The decoded object is only used for the frame it was read from
+        out = self.instance.func_deserialize(msg)
+        self.assert_equal(out, obj)
+        assert(out is not decoded)
+
+    def test_out_of_band_buffers(self):
+        r"""Test serialization of objects with out-of-band buffers."""
+        obj = {'a': np.arange(1000, dtype='float64'),
+               'b': np.ones((20, 30), order='F'), 'c': 'test'}
+        msg = self.instance.func_serialize(obj)
+        self.assert_equal(self.instance.func_deserialize(msg), obj)
+        self.assert_equal(self.import_cls.get_first_frame(msg + msg), msg)
+        self.assert_equal(self.import_cls.get_first_frame(msg[:-1]), b'')
+        fd = io.BytesIO(msg + msg[:-1])
+        self.assert_equal(self.instance.read_frame(fd), msg)
+        self.assert_equal(self.instance.read_frame(fd), b'')
+        self.assert_equal(fd.tell(), len(msg))
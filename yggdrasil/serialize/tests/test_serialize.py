@@ -1,3 +1,4 @@
+import io
 import numpy as np
 from yggdrasil import serialize, platform
 from yggdrasil.tests import assert_raises, assert_equal
@@ -189,6 +190,33 @@ def test_format_message():
     assert_raises(ValueError, serialize.process_message, b'hello', "%d")
 
 
+def test_compile_format():
+    r"""Test compiling a format string."""
+    fmt = b'%5s\t%ld\t%lf\t%g%+gj\n'
+    x = serialize.compile_format(fmt)
+    assert(serialize.compile_format(fmt) is x)
+    assert_equal(x.nfmt, 4)
+    assert_equal(x.dtype, serialize.cformat2nptype(fmt))
+    args = (b'hello', 1, 1.5, 1.0 - 2.0j)
+    msg = x.format(args)
+    assert_equal(msg, serialize.format_message(args, fmt))
+    assert_equal(x.parse(msg), args)
+    assert_equal(x.get_dtype_cast(np.dtype('S2'))(b'hello'), b'he')
+    assert_raises(ValueError, serialize.compile_format('hello').parse, 'hello')
+
+
+def test_format_rows():
+    r"""Test formatting rows in an array matches formatting each row."""
+    for fmt in [b'%5s\t%ld\t%lf\t%g%+gj\n', '%5s\t%ld\t%lf\t%g%+gj\n']:
+        dtype = serialize.cformat2nptype(fmt)
+        arr = np.ones(3, dtype)
+        arr['f0'][0] = b'hello'
+        arr['f3'][1] = 1.5 - 2j
+        res = fmt[:0].join([serialize.format_message(x.tolist(), fmt)
+                            for x in arr])
+        assert_equal(serialize.format_rows(arr, fmt), res)
+
+
 def test_combine_flds():
     r"""Test combine_flds."""
     names0 = ['f0', 'f1', 'f2', 'f3']
@@ -385,6 +413,23 @@ def test_array_to_table():
             np.testing.assert_array_equal(arr1, arr0)
 
 
+def test_read_table():
+    r"""Test parsing a table with a known data type."""
+    fmt = b'# %5s\t%ld\t%lf\t%g%+gj\n'
+    dtype = serialize.cformat2nptype(fmt)
+    arr0 = np.ones(3, dtype)
+    arr0['f0'][0] = b'hello'
+    arr0['f3'][1] = 1.5 - 2j
+    tab = serialize.array_to_table(arr0, fmt)
+    np.testing.assert_array_equal(
+        serialize.read_table(io.BytesIO(tab), dtype, comment=b'# '), arr0)
+    np.testing.assert_array_equal(
+        serialize.read_table(io.BytesIO(b''), dtype), np.zeros(0, dtype))
+    assert(serialize.read_table(io.BytesIO(tab), dtype,
+                                delimiter=b'::') is None)
+    assert(serialize.read_table(io.BytesIO(b'a\tb\tc\td\n'), dtype) is None)
+
+
 def test_array_to_bytes():
     r"""Test conversion of arrays to bytes and back."""
     names0 = ['f0', 'f1', 'f2', 'f3']
@@ -1,4 +1,8 @@
-from yggdrasil.tests import assert_raises
+import os
+import json
+import shutil
+import tempfile
+from yggdrasil.tests import assert_raises, assert_equal
 from yggdrasil import components
 
 
@@ -33,3 +37,34 @@ def test_create_component():
     assert(not components.isinstance_component(x, ['comm']))
     x = components.create_component('serializer')
     assert(components.isinstance_component(x, ['serializer']))
+
+
+def test_manifest():
+    r"""Test loading and regenerating the component manifest."""
+    from yggdrasil.schema import get_schema
+    s = get_schema()
+    manifest = components.get_manifest()
+    for k, v in manifest.items():
+        assert_equal(sorted(v['classes'].keys()), s.get(k).classes)
+        assert_equal(v['default_subtype'], s.get(k).default_subtype)
+    assert_equal(components.get_component_properties('serializer', 'direct'),
+                 s.get('serializer').get_subtype_properties('direct'))
+    assert(components.get_component_properties('serializer', 'invalid') is None)
+    assert(components.get_component_properties('invalid', 'direct') is None)
+    # Stale manifests should be regenerated
+    fname = os.path.join(tempfile.mkdtemp(), 'manifest.json')
+    try:
+        with open(fname, 'w') as fd:
+            json.dump({'version': components._manifest_version,
+                       'schema_hash': 'invalid', 'components': {}}, fd)
+        x = components.load_manifest(fname)
+        assert_equal(x['components'], manifest)
+        assert_equal(components.load_manifest(fname), x)
+        # Partially written manifests should be regenerated
+        with open(fname, 'w') as fd:
+            fd.write('{"version": ')
+        assert_equal(components.load_manifest(fname), x)
+        assert_equal(os.listdir(os.path.dirname(fname)),
+                     [os.path.basename(fname)])
+    finally:
+        shutil.rmtree(os.path.dirname(fname))
@@ -0,0 +1,152 @@
+import os
+import sys
+import shutil
+import subprocess
+import tempfile
+import numpy as np
+from yggdrasil import memoize, units
+from yggdrasil.tests import YggTestBase, assert_raises, assert_equal
+
+
+def test_content_hash():
+    r"""Test content_hash."""
+    x = np.arange(10)
+    assert_equal(memoize.content_hash(x), memoize.content_hash(x.copy()))
+    assert(memoize.content_hash(x) != memoize.content_hash(x + 1))
+    assert(memoize.content_hash(x)
+           != memoize.content_hash(x.astype('float64')))
+    assert(memoize.content_hash(x)
+           != memoize.content_hash(x.reshape((2, 5))))
+    assert(memoize.content_hash(units.add_units(x, 'cm'))
+           != memoize.content_hash(units.add_units(x, 'm')))
+    assert_equal(memoize.content_hash({'a': 1, 'b': [b'c', 'd', None]}),
+                 memoize.content_hash({'b': [b'c', 'd', None], 'a': 1}))
+    assert(memoize.content_hash([1, 2]) != memoize.content_hash((1, 2)))
+    assert(memoize.content_hash(1) != memoize.content_hash(1.0))
+    assert(memoize.content_hash(b'a') != memoize.content_hash('a'))
+    assert_equal(memoize.content_hash(np.array([1, 'a'], dtype=object)),
+                 memoize.content_hash(np.array([1, 'a'], dtype=object)))
+    assert_equal(memoize.content_hash(set([1, 2])),
+                 memoize.content_hash(set([1, 2])))
+    assert(memoize.content_hash(set([1, 2]))
+           != memoize.content_hash(frozenset([1, 2])))
+
+
+def test_content_hash_set():
+    r"""Test that content_hash for sets is stable between processes."""
+    code = ('from yggdrasil import memoize; '
+            'print(memoize.content_hash(set(["a", "b", "c", "d"])))')
+    out = set()
+    for seed in ['1', '2', '3']:
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        out.add(subprocess.check_output([sys.executable, '-c', code],
+                                        env=env).strip())
+    assert_equal(len(out), 1)
+
+
+def test_repr_key():
+    r"""Test repr_key."""
+    x = np.zeros(2000)
+    y = x.copy()
+    y[1000] = 5
+    assert(memoize.repr_key(x) != memoize.repr_key(y))
+    assert_equal(memoize.repr_key(x), memoize.repr_key(x.copy()))
+    assert_equal(memoize.repr_key((1, 'a', b'b', None)),
+                 "tuple(1, 'a', b'b', None)")
+    assert_equal(memoize.repr_key({'b': 1, 'a': [2]}),
+                 "{'a': list(2), 'b': 1}")
+
+
+class TestFunctionCache(YggTestBase):
+    r"""Test class for FunctionCache."""
+
+    def setup(self, *args, **kwargs):
+        r"""Initialize the call counter."""
+        self.ncall = 0
+        super(TestFunctionCache, self).setup(*args, **kwargs)
+
+    def function(self, x):
+        r"""Function for testing the cache."""
+        self.ncall += 1
+        return 2 * x
+
+    def test_error(self):
+        r"""Test error on unsupported key method."""
+        assert_raises(ValueError, memoize.FunctionCache,
+                      self.function, key='invalid')
+
+    def test_call(self):
+        r"""Test calling the cached function."""
+        for key in ['hash', 'repr']:
+            self.ncall = 0
+            x = memoize.FunctionCache(self.function, key=key)
+            assert_equal(x(1), 2)
+            assert_equal(x(1), 2)
+            assert_equal(x(2), 4)
+            assert_equal(self.ncall, 2)
+            assert_equal((x.hits, x.misses), (1, 2))
+            assert_equal(x.status, '1 hits, 2 misses, 2 cached (%d bytes)'
+                         % x.nbytes)
+            x.clear()
+            assert_equal(x.nbytes, 0)
+            assert_equal(x(1), 2)
+            assert_equal(self.ncall, 3)
+
+    def test_repr_large_array(self):
+        r"""Test that the repr key distinguishes large arrays with
+        truncated representations."""
+        x = memoize.FunctionCache(lambda a: a.sum(), key='repr')
+        arr = np.zeros(2000)
+        assert_equal(x(arr), 0.0)
+        arr = arr.copy()
+        arr[1000] = 5
+        assert_equal(x(arr), 5.0)
+
+    def test_array(self):
+        r"""Test that cached arrays are not modified by the caller."""
+        x = memoize.FunctionCache(self.function)
+        arr = np.arange(5)
+        out = x(arr)
+        out[0] = 10
+        np.testing.assert_array_equal(x(arr.copy()), 2 * arr)
+        assert_equal(self.ncall, 1)
+
+    def test_size(self):
+        r"""Test removal of least recently used results."""
+        x = memoize.FunctionCache(self.function, size=2)
+        x(1)
+        x(2)
+        x(1)
+        x(3)
+        assert_equal(self.ncall, 3)
+        x(1)
+        assert_equal(self.ncall, 3)
+        x(2)
+        assert_equal(self.ncall, 4)
+
+    def test_max_bytes(self):
+        r"""Test limiting the size of results in memory."""
+        arr = np.arange(100, dtype='int64')
+        x = memoize.FunctionCache(self.function, max_bytes=1000)
+        x(arr)
+        x(arr + 1)
+        assert_equal(len(x._cache), 1)
+        assert(x.nbytes <= 1000)
+        x(arr + 1)
+        assert_equal(self.ncall, 2)
+        x(np.arange(1000))
+        assert_equal(len(x._cache), 1)
+        assert_equal(self.ncall, 3)
+
+    def test_directory(self):
+        r"""Test persisting results in a directory."""
+        directory = tempfile.mkdtemp()
+        try:
+            x = memoize.FunctionCache(self.function, directory=directory)
+            assert_equal(x(1), 2)
+            y = memoize.FunctionCache(self.function, directory=directory)
+            assert_equal(y(1), 2)
+            assert_equal(self.ncall, 1)
+            assert_equal((y.hits, y.misses), (1, 0))
+        finally:
+            shutil.rmtree(directory)
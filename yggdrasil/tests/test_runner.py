@@ -2,8 +2,9 @@ import os
 import unittest
 import signal
 import uuid
+import tempfile
 from yggdrasil import runner, tools, platform
-from yggdrasil.tests import YggTestBase, assert_raises
+from yggdrasil.tests import YggTestBase, assert_raises, assert_equal
 # from yggdrasil.tests import yamls as sc_yamls
 from yggdrasil.examples import yamls as ex_yamls
 
@@ -67,6 +68,117 @@ def test_runner_error():
                   ['fake_yaml.yml'], 'test_ygg_run')
     
 
+def write_replica_yaml(replicas=2, is_server=True):
+    r"""Write a YAML file for a python rpcFib server with replicas.
+
+    Args:
+        replicas (int, optional): Number of server replicas. Defaults to 2.
+        is_server (bool, optional): If True, the replicated model is a
+            server and a client model is included. Defaults to True.
+
+    Returns:
+        str: Full path to the YAML file.
+
+    """
+    srcdir = os.path.join(os.path.dirname(ex_yamls['rpcFib']['python'][0]),
+                          'src')
+    lines = ['models:',
+             '  - name: rpcFibSrv',
+             '    language: python',
+             '    args:',
+             '      - %s' % os.path.join(srcdir, 'rpcFibSrv.py'),
+             '      - "0.01"',
+             '    replicas: %d' % replicas,
+             '    is_server: %s' % is_server]
+    if is_server:
+        lines += ['  - name: rpcFibCliPar',
+                  '    language: python',
+                  '    args:',
+                  '      - %s' % os.path.join(srcdir, 'rpcFibCliPar.py'),
+                  '      - "4"',
+                  '    client_of: rpcFibSrv']
+    fname = os.path.join(tempfile.gettempdir(),
+                         'replicas_%s.yml' % str(uuid.uuid4()))
+    with open(fname, 'w') as fd:
+        fd.write('\n'.join(lines))
+    return fname
+
+
+def test_runner_replicas():
+    r"""Test running a server model with replicas."""
+    fname = write_replica_yaml()
+    try:
+        cr = runner.get_runner([fname])
+        assert_equal(sorted(cr.modeldrivers.keys()),
+                     ['rpcFibCliPar', 'rpcFibSrv', 'rpcFibSrv_replica1'])
+        cr.run()
+        assert(not cr.error_flag)
+        srv = cr.inputdrivers['rpcFibSrv:rpcFibSrv']['instance']
+        assert_equal(srv.replicas, 2)
+        assert_equal(len(srv.replica_env), 2)
+        assert_equal(sum(srv.replica_nsent), 4)
+        assert(min(srv.replica_nsent) > 0)
+    finally:
+        os.remove(fname)
+
+
+def test_runner_client_after_server():
+    r"""Test that a server is started before a client listed first and
+    that loading/starting times are recorded for each driver."""
+    fname = write_replica_yaml(replicas=1)
+    try:
+        cr = runner.get_runner([fname])
+        # Put the client first so the server must be started out of order
+        cr.modeldrivers = dict(reversed(list(cr.modeldrivers.items())))
+        started = []
+        start_driver = cr.startDriver
+
+        def record_start(yml):
+            if not yml['instance'].was_started:
+                started.append(yml['name'])
+            start_driver(yml)
+        cr.startDriver = record_start
+        cr.run()
+        assert(not cr.error_flag)
+        assert(started.index('rpcFibSrv') < started.index('rpcFibCliPar'))
+        # The connections for each model are started before the model
+        for name in ['rpcFibSrv', 'rpcFibCliPar']:
+            for iod in cr.io_drivers(name):
+                assert(started.index(iod['name']) < started.index(name))
+        for drv in cr.all_drivers:
+            assert_equal(sorted(cr.driver_times[drv['name']].keys()),
+                         ['load', 'start'])
+    finally:
+        os.remove(fname)
+
+
+def test_runner_load_error():
+    r"""Test that connections started before an error creating a model
+    are terminated."""
+    cr = runner.get_runner([ex_yamls['hello']['python']])
+
+    def create_error(yml):
+        raise RuntimeError("Test error creating %s" % yml['name'])
+    cr.createModelDriver = create_error
+    assert_raises(RuntimeError, cr.loadDrivers, start_connections=True)
+    iodrivers = list(cr.io_drivers())
+    assert(iodrivers)
+    for drv in iodrivers:
+        assert(drv['instance'].was_started)
+        assert(not drv['instance'].is_alive())
+    cr.cleanup()
+
+
+def test_runner_replicas_error():
+    r"""Test error when replicas are specified for a model that is not a
+    server."""
+    fname = write_replica_yaml(is_server=False)
+    try:
+        assert_raises(ValueError, runner.get_runner, [fname])
+    finally:
+        os.remove(fname)
+
+
 class TestYggRunner(YggTestBase):
     r"""Tests of the YggRunner class."""
     def setup(self, *args, **kwargs):
@@ -86,3 +198,35 @@ class TestYggRunner(YggTestBase):
         assert_raises(Exception, self.runner.createInputDriver, yml)
         yml['driver'] = 'OutputDriver'
         assert_raises(Exception, self.runner.createOutputDriver, yml)
+
+    def test_createDrivers(self):
+        r"""Test that drivers are created in their working directories
+        and that the working directory is restored afterwards."""
+        curpath = os.getcwd()
+        dirs = [tempfile.mkdtemp(), tempfile.mkdtemp()]
+        try:
+            drivers = [{'name': 'a', 'working_dir': dirs[0]},
+                       {'name': 'b', 'working_dir': dirs[1]},
+                       {'name': 'c', 'working_dir': dirs[0]},
+                       {'name': 'd'}]
+            cwds = {}
+
+            def create(yml):
+                cwds[yml['name']] = os.getcwd()
+            self.runner.createDrivers(create, drivers)
+            assert_equal(os.getcwd(), curpath)
+            for yml in drivers:
+                assert_equal(os.path.realpath(cwds[yml['name']]),
+                             os.path.realpath(yml.get('working_dir',
+                                                      curpath)))
+
+            def create_error(yml):
+                if yml['name'] == 'b':
+                    raise RuntimeError("Test error")
+            assert_raises(RuntimeError, self.runner.createDrivers,
+                          create_error, drivers)
+            assert_equal(os.getcwd(), curpath)
+        finally:
+            os.chdir(curpath)
+            for x in dirs:
+                os.rmdir(x)
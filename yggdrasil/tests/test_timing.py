@@ -3,7 +3,8 @@ import sys
 import copy
 import unittest
 from yggdrasil import tools, timing, platform
-from yggdrasil.tests import YggTestClass, assert_raises, long_running
+from yggdrasil.tests import (
+    YggTestClass, assert_raises, assert_equal, long_running)
 
 
 _test_size = 1
@@ -40,6 +41,18 @@ def test_get_source():
             assert(os.path.isfile(fname))
 
 
+def test_time_transform_chain():
+    r"""Test timing of a chain of transforms."""
+    out = timing.time_transform_chain(nrows=100, nrep=2)
+    assert_equal(sorted(out.keys()), ['recv', 'send'])
+
+
+def test_time_format_compilation():
+    r"""Test timing of formatting/parsing with a format string."""
+    out = timing.time_format_compilation(nrows=10)
+    assert_equal(sorted(out.keys()), ['format_message', 'process_message'])
+
+
 def test_platform_error():
     r"""Test error when test cannot be performed."""
     test_platform_map = {'MacOS': 'Linux',
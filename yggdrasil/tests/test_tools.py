@@ -1,5 +1,6 @@
 import os
 import sys
+import shutil
 import tempfile
 from yggdrasil import tools, platform
 from yggdrasil.tests import YggTestClass, assert_equal, assert_warns
@@ -85,6 +86,66 @@ def test_get_installed():
     tools.get_installed_comm()
 
 
+def test_discovery_cache():
+    r"""Test caching of language/tool discovery results."""
+    from yggdrasil.config import ygg_cfg
+    tempdir = tempfile.mkdtemp()
+    exe = os.path.join(tempdir, 'tool')
+    with open(exe, 'w') as fd:
+        fd.write('')
+    os.chmod(exe, 0o755)
+    calls = []
+
+    class Tool(object):
+        @classmethod
+        def get_executable(cls):
+            return exe
+
+        @classmethod
+        @tools.discovery_cache(executable='get_executable')
+        def probe(cls, x):
+            calls.append(x)
+            return [x]
+
+    old_file = ygg_cfg.get('discovery', 'cache_file', '')
+    old_jobs = ygg_cfg.get('build', 'jobs', '')
+    ygg_cfg.set('discovery', 'cache_file', os.path.join(tempdir, 'cache.json'))
+    try:
+        assert_equal(Tool.probe(1), [1])
+        assert_equal(Tool.probe(1), [1])
+        assert_equal(calls, [1])
+        # Results persist on disk
+        tools.clear_discovery_cache()
+        assert_equal(Tool.probe(1), [1])
+        assert_equal(calls, [1])
+        # Changes to the executable
+        os.utime(exe, (0, 0))
+        assert_equal(Tool.probe(1), [1])
+        assert_equal(calls, [1, 1])
+        # Options that don't affect discovery
+        env = tools.get_discovery_environment()
+        ygg_cfg.set('build', 'jobs', '2')
+        assert_equal(tools.get_discovery_environment(), env)
+        assert_equal(Tool.probe(1), [1])
+        assert_equal(calls, [1, 1])
+        # Changes to the environment
+        ygg_cfg.add_section('test_discovery')
+        ygg_cfg.set('test_discovery', 'test', 'value')
+        assert_equal(Tool.probe(1), [1])
+        assert_equal(calls, [1, 1, 1])
+        ygg_cfg.remove_section('test_discovery')
+        # Disabled cache
+        ygg_cfg.set('discovery', 'cache', 'False')
+        assert_equal(Tool.probe(1), [1])
+        assert_equal(calls, [1, 1, 1, 1])
+    finally:
+        ygg_cfg.set('discovery', 'cache', 'True')
+        ygg_cfg.set('discovery', 'cache_file', old_file)
+        ygg_cfg.set('build', 'jobs', old_jobs)
+        tools.clear_discovery_cache()
+        shutil.rmtree(tempdir)
+
+
 def test_which():
     r"""Test location of executable."""
     assert(tools.which(sys.executable) is not None)
@@ -79,6 +79,32 @@ class TestUnits(YggTestBase):
         assert(units.are_compatible('d', 'hr'))
         assert(units.are_compatible('hr', 'd'))
 
+    def test_get_conversion_factor(self):
+        r"""Test get_conversion_factor."""
+        self.assert_equal(units.get_conversion_factor('cm', 'm'), (0.01, 0.0))
+        factor, offset = units.get_conversion_factor('degC', 'degF')
+        self.assert_equal(np.round(10 * factor - offset, 6), 50.0)
+        self.assert_raises(ValueError, units.get_conversion_factor, 'cm', 's')
+
+    def test_convert_fields(self):
+        r"""Test convert_fields."""
+        arr = np.array([(1, 100.0, 2.0), (2, 200.0, 4.0)],
+                       dtype=[('a', 'i4'), ('b', 'f8'), ('c', 'f8')])
+        assert(units.convert_fields(arr, ['', 'cm', 'g'],
+                                    ['n/a', 'cm', 'g']) is arr)
+        x = units.convert_fields(arr, ['', 'cm', 'g'], ['', 'm', 'kg'])
+        np.testing.assert_array_equal(x['a'], arr['a'])
+        np.testing.assert_allclose(x['b'], [1.0, 2.0])
+        np.testing.assert_allclose(x['c'], [0.002, 0.004])
+        self.assert_raises(ValueError, units.convert_fields, arr,
+                           ['', 'cm', 'g'], ['', 's', 'kg'])
+        # Integer fields are promoted for non-integral conversions
+        arr = np.array([(250, 250)], dtype=[('a', 'i4'), ('b', 'i4')])
+        x = units.convert_fields(arr, ['cm', 'm'], ['m', 'cm'])
+        self.assert_equal(x.dtype, np.dtype([('a', 'f8'), ('b', 'i4')]))
+        np.testing.assert_allclose(x['a'], [2.5])
+        np.testing.assert_array_equal(x['b'], [25000])
+
     def test_convert_R_unit_string(self):
         r"""Test convert_R_unit_string."""
         pairs = [('g', 'g'), ('g2', '(g**2)'),
@@ -18,16 +18,9 @@ from yggdrasil import tools, runner, examples, platform
 from yggdrasil import platform as ygg_platform
 from yggdrasil.tests import YggTestBase
 from yggdrasil.drivers import MatlabModelDriver
-import matplotlib as mpl
-if os.environ.get('DISPLAY', '') == '':  # pragma: debug
-    mpl.use('Agg')
-elif ygg_platform._is_mac:
-    mpl.use('TkAgg')
-import matplotlib.pyplot as plt  # noqa: E402
 logger = logging.getLogger(__name__)
 _linewidth = 2
 _legend_fontsize = 14
-mpl.rc('font', size=18)
 _pyperf_warmups = 0
 _python_version = '%d.%d' % (sys.version_info[0], sys.version_info[1])
 
@@ -39,6 +32,26 @@ _python_version = '%d.%d' % (sys.version_info[0], sys.version_info[1])
 #  - Add functions for overwriting specific entries
 
 
+def get_pyplot():
+    r"""Import matplotlib and set the backend and font size used for plots.
+    matplotlib is imported when the first plot is created since it is slow
+    to import.
+
+    Returns:
+        module: matplotlib.pyplot
+
+    """
+    if 'matplotlib.pyplot' not in sys.modules:
+        import matplotlib as mpl
+        if os.environ.get('DISPLAY', '') == '':  # pragma: debug
+            mpl.use('Agg')
+        elif ygg_platform._is_mac:
+            mpl.use('TkAgg')
+        mpl.rc('font', size=18)
+    import matplotlib.pyplot as plt
+    return plt
+
+
 def get_lang_list():
     r"""Get the list of testable languages on the current platform.
 
@@ -738,6 +751,7 @@ class TimedRun(YggTestBase, tools.YggClass):
         if axs is None:
             figure_size = (15.0, 6.0)
             figure_buff = 0.75
+            plt = get_pyplot()
             fig, axs = plt.subplots(1, 2, figsize=figure_size, sharey=True)
             axs[0].set_xlabel('Message Count (size = %d)' % msg_size0)
             axs[0].set_ylabel('Time (s)')
@@ -839,6 +853,7 @@ class TimedRun(YggTestBase, tools.YggClass):
             yerr = np.array(yerr)
         # Create axes if not provded
         if axs is None:
+            plt = get_pyplot()
             fig, axs = plt.subplots()
             axs.set_xlabel(xname)
             axs.set_ylabel('Time (s)')
@@ -1314,7 +1329,7 @@ def plot_scalings(compare='comm_type', compare_values=None,
         v = fits[k]
         print(fmt_row % (k, v[0], v[1]))
     # Save plot
-    plt.savefig(plotfile, dpi=600)
+    get_pyplot().savefig(plotfile, dpi=600)
     logger.info('plotfile: %s', plotfile)
     if cleanup_plot:
         os.remove(plotfile)
@@ -1354,3 +1369,75 @@ def pyperfjson_to_pandas(json_file):
                     data[mk].append(mv)
     x_pd = pd.DataFrame(data)
     return x_pd
+
+
+def time_transform_chain(nrows=3000000, nrep=5):
+    r"""Time the application of a chain of transforms (select_fields ->
+    map_fields -> array) to a large structured array by comms sending and
+    receiving the array.
+
+    Args:
+        nrows (int, optional): Number of rows in the array. Defaults to
+            3000000 (~100 MB).
+        nrep (int, optional): Number of times the chain should be applied
+            in each direction. Defaults to 5.
+
+    Returns:
+        dict: Minimum time (in seconds) taken to transform the array for
+            each direction ('send' and 'recv').
+
+    """
+    from yggdrasil.communication.CommBase import CommBase
+    dtype = np.dtype([('a', 'f8'), ('b', 'i8'), ('c', 'f8'), ('d', 'S8')])
+    msg = np.zeros(nrows, dtype=dtype)
+    transform = [{'transformtype': 'select_fields',
+                  'selected': ['a', 'b', 'c']},
+                 {'transformtype': 'map_fields',
+                  'map': {'a': 'x', 'b': 'y'}},
+                 {'transformtype': 'array'}]
+    out = {}
+    for direction in ['send', 'recv']:
+        comm = CommBase('timed_transform_%s' % direction, address='address',
+                        direction=direction, transform=transform)
+        try:
+            times = []
+            for _ in range(nrep):
+                t0 = time.perf_counter()
+                comm.apply_transform(msg)
+                times.append(time.perf_counter() - t0)
+        finally:
+            comm.close()
+        out[direction] = min(times)
+        logger.info('%s: %f s per message', direction, out[direction])
+    return out
+
+
+def time_format_compilation(fmt_str=b'%5s\t%ld\t%lf\t%g%+gj\n', nrows=20000):
+    r"""Time the formatting and parsing of table rows using a format string.
+
+    Args:
+        fmt_str (bytes, optional): Format string used to format/parse rows.
+            Defaults to a row with bytes, integer, float, and complex fields.
+        nrows (int, optional): Number of rows that should be formatted and
+            parsed. Defaults to 20000.
+
+    Returns:
+        dict: Time (in seconds) per row for 'format_message' and
+            'process_message'.
+
+    """
+    from yggdrasil import serialize
+    args = (b'one', 1, 1.0, complex(1, 1))
+    row = serialize.format_message(args, fmt_str)
+    out = {}
+    t0 = time.perf_counter()
+    for _ in range(nrows):
+        serialize.format_message(args, fmt_str)
+    out['format_message'] = (time.perf_counter() - t0) / nrows
+    t0 = time.perf_counter()
+    for _ in range(nrows):
+        serialize.process_message(row, fmt_str)
+    out['process_message'] = (time.perf_counter() - t0) / nrows
+    for k, v in out.items():
+        logger.info('%s: %f us per row', k, 1e6 * v)
+    return out
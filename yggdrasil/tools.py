@@ -6,10 +6,6 @@ import pprint
 import os
 import sys
 import sysconfig
-try:
-    from distutils import sysconfig as distutils_sysconfig
-except ImportError:  # pragma: debug
-    distutils_sysconfig = None
 import warnings
 import copy
 import shutil
@@ -20,6 +16,9 @@ import atexit
 import uuid as uuid_gen
 import subprocess
 import importlib
+import functools
+import json
+import hashlib
 from yggdrasil import platform
 from yggdrasil.components import import_component, ComponentBase
 
@@ -38,6 +37,25 @@ if ((logging.getLogger("yggdrasil").getEffectiveLevel()
 _thread_registry = {}
 _lock_registry = {}
 _main_thread = threading.main_thread()
+_safe_eval_lists = {
+    'math': ['acos', 'asin', 'atan', 'atan2', 'ceil', 'cos',
+             'cosh', 'degrees', 'e', 'exp', 'fabs', 'floor', 'fmod',
+             'frexp', 'hypot', 'ldexp', 'log', 'log10', 'modf', 'pi',
+             'pow', 'radians', 'sin', 'sinh', 'sqrt', 'tan', 'tanh'],
+    'builtins': ['abs', 'any', 'bool', 'bytes', 'float', 'int', 'len',
+                 'list', 'map', 'max', 'min', 'repr', 'set', 'str',
+                 'sum', 'tuple', 'type'],
+    'numpy': ['array', 'int8', 'int16', 'int32', 'int64',
+              'uint8', 'uint16', 'uint32', 'uint64',
+              'float16', 'float32', 'float64'],
+    'yggdrasil.units': ['get_data', 'add_units'],
+    'unyt.array': ['unyt_quantity', 'unyt_array']}
+_safe_eval_globals = None
+_discovery_cache_version = 1
+_discovery_cache = {'environment': None, 'entries': {}}
+_discovery_state = {'path': None, 'values': {}}
+_discovery_config_exclude = ['build', 'discovery', 'debug']
+_discovery_lock = threading.RLock()
 
 
 def apply_recurse(x, func, **kwargs):
@@ -221,9 +239,12 @@ def get_python_c_library(allow_failure=False, libtype=None):
     for k in ['stdlib', 'purelib', 'platlib', 'platstdlib', 'data']:
         dir_try.append(paths[k])
     dir_try.append(os.path.join(paths['data'], 'lib'))
-    if distutils_sysconfig is not None:
+    try:
+        from distutils import sysconfig as distutils_sysconfig
         dir_try.append(os.path.dirname(
             distutils_sysconfig.get_python_lib(True, True)))
+    except ImportError:  # pragma: debug
+        pass
     dir_try = set(dir_try)
     for idir in dir_try:
         x = os.path.join(idir, base)
@@ -547,6 +568,249 @@ def remove_path(fpath, timer_class=None, timeout=None):
             raise RuntimeError("Failed to remove file: %s" % fpath)
 
 
+def get_discovery_cache_file(cfg=None):
+    r"""Get the file where the results of language/tool discovery (e.g.
+    is_installed, language_version) are cached between runs.
+
+    Args:
+        cfg (:class:`yggdrasil.config.YggConfigParser`, optional):
+            Config parser with the 'discovery' options that should be used.
+            Defaults to :data:`yggdrasil.config.ygg_cfg`.
+
+    Returns:
+        str: Full path to the cache file. None is returned if the discovery
+            cache is disabled.
+
+    """
+    from yggdrasil import config
+    if cfg is None:
+        cfg = config.ygg_cfg
+    if str(cfg.get('discovery', 'cache', 'True')).lower() in ['false', '0']:
+        return None
+    return os.path.expanduser(cfg.get(
+        'discovery', 'cache_file',
+        os.path.join(config.usr_dir, '.ygg_discovery_cache.json')))
+
+
+def get_discovery_environment(cfg=None):
+    r"""Get a hash of the environment that language/tool discovery results
+    depend on. This includes the yggdrasil version, the Python executable,
+    the PATH, the active conda/virtualenv environment, the modification
+    times of the Python package directories, and the configuration options
+    (excluding the sections in _discovery_config_exclude that do not affect
+    discovery).
+
+    Args:
+        cfg (:class:`yggdrasil.config.YggConfigParser`, optional):
+            Config parser that should be included. Defaults to
+            :data:`yggdrasil.config.ygg_cfg`.
+
+    Returns:
+        str: Hex digest of the environment. None is returned if yggdrasil
+            has not finished importing.
+
+    """
+    version = getattr(sys.modules.get('yggdrasil', None), '__version__', None)
+    if version is None:  # pragma: debug
+        return None
+    if cfg is None:
+        from yggdrasil.config import ygg_cfg as cfg
+    packages = []
+    paths = sysconfig.get_paths()
+    for k in ['purelib', 'platlib']:
+        x = paths.get(k, None)
+        if x and os.path.isdir(x):
+            packages.append([x, os.stat(x).st_mtime])
+    env = {'version': [_discovery_cache_version, version],
+           'executable': sys.executable,
+           'environ': [os.environ.get(k, None) for k in
+                       ['PATH', 'CONDA_PREFIX', 'CONDA_DEFAULT_ENV',
+                        'VIRTUAL_ENV']],
+           'packages': packages,
+           'config': [[k, cfg.items(k, raw=True)] for k in cfg.sections()
+                      if k not in _discovery_config_exclude]}
+    return hashlib.sha1(
+        json.dumps(env, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def get_discovery_state(cfg=None):
+    r"""Get the discovery cache file and environment hash, computing them
+    once per process. They are only recomputed if the PATH changes, if
+    either config parser is modified, or after clear_discovery_cache is
+    called.
+
+    Args:
+        cfg (:class:`yggdrasil.config.YggConfigParser`, optional):
+            Config parser that should be included in the environment.
+            Defaults to :data:`yggdrasil.config.ygg_cfg`.
+
+    Returns:
+        tuple(str, str): The cache file (see get_discovery_cache_file) and
+            environment hash (see get_discovery_environment).
+
+    """
+    from yggdrasil.config import ygg_cfg
+    if cfg is None:
+        cfg = ygg_cfg
+    path = os.environ.get('PATH', None)
+    key = (id(cfg), getattr(cfg, 'revision', None),
+           getattr(ygg_cfg, 'revision', None))
+    with _discovery_lock:
+        if _discovery_state['path'] != path:
+            _discovery_state['path'] = path
+            _discovery_state['values'] = {}
+        out = _discovery_state['values'].get(key, None)
+    if out is None:
+        out = (get_discovery_cache_file(), get_discovery_environment(cfg=cfg))
+        if out[1] is not None:
+            with _discovery_lock:
+                _discovery_state['values'][key] = out
+    return out
+
+
+def get_file_mtimes(files):
+    r"""Get the modification times of a set of files.
+
+    Args:
+        files (list): Paths to files.
+
+    Returns:
+        dict: Mapping between file paths and modification times. Files that
+            do not exist have a modification time of None.
+
+    """
+    out = {}
+    for x in files:
+        try:
+            out[x] = os.stat(x).st_mtime
+        except OSError:
+            out[x] = None
+    return out
+
+
+def load_discovery_cache(environment, fname=None):
+    r"""Load the discovery cache for an environment from disk into memory.
+
+    Args:
+        environment (str): Hash of the environment (see
+            get_discovery_environment) that entries should be loaded for.
+        fname (str, optional): File that the cache should be loaded from.
+            Defaults to get_discovery_cache_file.
+
+    """
+    global _discovery_cache
+    if fname is None:
+        fname = get_discovery_cache_file()
+    out = {'environment': environment, 'entries': {}}
+    if fname and os.path.isfile(fname):
+        try:
+            with open(fname, 'r') as fd:
+                contents = json.load(fd)
+            if contents.get('environment', None) == environment:
+                out['entries'] = contents['entries']
+        except BaseException as e:  # pragma: debug
+            logger.debug("Error loading discovery cache from %s: %s"
+                         % (fname, e))
+    _discovery_cache = out
+
+
+def dump_discovery_cache(fname=None):
+    r"""Write the discovery cache for the current environment to disk.
+
+    Args:
+        fname (str, optional): File that the cache should be written to.
+            Defaults to get_discovery_cache_file.
+
+    """
+    if fname is None:
+        fname = get_discovery_cache_file()
+    if not fname:
+        return
+    tmp = '%s.%d.%d' % (fname, os.getpid(), threading.get_ident())
+    try:
+        with open(tmp, 'w') as fd:
+            json.dump(_discovery_cache, fd)
+        os.replace(tmp, fname)
+    except BaseException as e:  # pragma: debug
+        logger.debug("Error storing discovery cache in %s: %s"
+                     % (fname, e))
+        if os.path.isfile(tmp):
+            os.remove(tmp)
+
+
+def clear_discovery_cache(remove_file=False):
+    r"""Clear the results of language/tool discovery and the discovery
+    environment from memory.
+
+    Args:
+        remove_file (bool, optional): If True, the cache file is also
+            removed. Defaults to False.
+
+    """
+    global _discovery_cache
+    with _discovery_lock:
+        _discovery_cache = {'environment': None, 'entries': {}}
+        _discovery_state['values'] = {}
+        fname = get_discovery_cache_file()
+        if remove_file and fname and os.path.isfile(fname):
+            os.remove(fname)
+
+
+def discovery_cache(executable=None):
+    r"""Decorator for caching the result of a function that discovers
+    information about languages/tools on the current machine. Results are
+    kept in memory and in the file returned by get_discovery_cache_file so
+    that they are reused between runs until the environment (see
+    get_discovery_environment) or the executable changes. Results must be
+    JSON serializable.
+
+    Args:
+        executable (str, optional): Name of a class method that returns the
+            executable that the result depends on. If provided, the
+            function must be a class method and the result is invalidated
+            when the executable's modification time changes. Defaults to
+            None.
+
+    Returns:
+        function: Decorator.
+
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            fname, environment = get_discovery_state(
+                cfg=getattr(args[0], 'cfg', None) if args else None)
+            if (not fname) or (environment is None):
+                return function(*args, **kwargs)
+            key = '%s.%s:%s' % (function.__module__, function.__qualname__,
+                                repr((args, sorted(kwargs.items()))))
+            with _discovery_lock:
+                if _discovery_cache['environment'] != environment:
+                    load_discovery_cache(environment, fname=fname)
+                entry = _discovery_cache['entries'].get(key, None)
+            if ((entry is not None)
+                    and (get_file_mtimes(entry['files']) == entry['files'])):
+                return copy.deepcopy(entry['value'])
+            out = function(*args, **kwargs)
+            files = []
+            if executable is not None:
+                try:
+                    exe = which(getattr(args[0], executable)())
+                except NotImplementedError:
+                    exe = None
+                if exe is not None:
+                    files.append(exe)
+            with _discovery_lock:
+                if _discovery_cache['environment'] == environment:
+                    _discovery_cache['entries'][key] = {
+                        'value': copy.deepcopy(out),
+                        'files': get_file_mtimes(files)}
+                    dump_discovery_cache(fname=fname)
+            return out
+        return wrapper
+    return decorator
+
+
 def get_supported_platforms():
     r"""Get a list of the platforms supported by yggdrasil.
 
@@ -639,6 +903,7 @@ def is_comm_installed(comm, language=None):
     return cmm.is_installed(language=language)
 
 
+@discovery_cache()
 def get_installed_lang():
     r"""Get a list of the languages that are supported by yggdrasil on the
     current machine. This checks for the necessary interpreters, licenses, and/or
@@ -656,6 +921,7 @@ def get_installed_lang():
     return out
 
 
+@discovery_cache()
 def get_installed_comm(language=None):
     r"""Get a list of the communication channel types that are supported by
     yggdrasil on the current machine. This checks the operating system,
@@ -797,11 +1063,47 @@ def sleep(interval):
     time.sleep(interval)
 
 
+def get_safe_eval_globals():
+    r"""Get the limited set of builtins and Python library functions that
+    are available to statements evaluated by safe_eval. The dictionary is
+    created the first time it is requested and then reused.
+
+    Returns:
+        dict: Global variables for safe_eval.
+
+    """
+    global _safe_eval_globals
+    if _safe_eval_globals is None:
+        out = {"__builtins__": None}
+        for mod_name, func_list in _safe_eval_lists.items():
+            mod = importlib.import_module(mod_name)
+            for func in func_list:
+                out[func] = getattr(mod, func)
+        _safe_eval_globals = out
+    return _safe_eval_globals
+
+
+@functools.lru_cache(maxsize=256)
+def compile_statement(statement):
+    r"""Compile a statement so that it can be evaluated by safe_eval without
+    being parsed again. Compiled statements are cached.
+
+    Args:
+        statement (str): Statement that should be compiled.
+
+    Returns:
+        code: Compiled statement.
+
+    """
+    return compile(statement, '<statement>', 'eval')
+
+
 def safe_eval(statement, **kwargs):
     r"""Run eval with a limited set of builtins and Python libraries/functions.
 
     Args:
-        statement (str): Statement that should be evaluated.
+        statement (str, code): Statement that should be evaluated or a
+            statement compiled by compile_statement.
         **kwargs: Additional keyword arguments are variables that are made available
             to the statement during evaluation.
 
@@ -809,24 +1111,8 @@ def safe_eval(statement, **kwargs):
         object: Result of the eval.
 
     """
-    safe_dict = {}
-    _safe_lists = {'math': ['acos', 'asin', 'atan', 'atan2', 'ceil', 'cos',
-                            'cosh', 'degrees', 'e', 'exp', 'fabs', 'floor', 'fmod',
-                            'frexp', 'hypot', 'ldexp', 'log', 'log10', 'modf', 'pi',
-                            'pow', 'radians', 'sin', 'sinh', 'sqrt', 'tan', 'tanh'],
-                   'builtins': ['abs', 'any', 'bool', 'bytes', 'float', 'int', 'len',
-                                'list', 'map', 'max', 'min', 'repr', 'set', 'str',
-                                'sum', 'tuple', 'type'],
-                   'numpy': ['array', 'int8', 'int16', 'int32', 'int64',
-                             'uint8', 'uint16', 'uint32', 'uint64',
-                             'float16', 'float32', 'float64'],
-                   'yggdrasil.units': ['get_data', 'add_units'],
-                   'unyt.array': ['unyt_quantity', 'unyt_array']}
-    for mod_name, func_list in _safe_lists.items():
-        mod = importlib.import_module(mod_name)
-        for func in func_list:
-            safe_dict[func] = getattr(mod, func)
-    safe_dict.update(kwargs)
+    if isinstance(statement, str):
+        statement = compile_statement(statement)
     # The following replaces <Class Name(a, b)> style reprs with calls to classes
     # identified in self._no_eval_class
     # regex = r'<([^<>]+)\(([^\(\)]+)\)>'
@@ -840,7 +1126,7 @@ def safe_eval(statement, **kwargs):
     #                          % (match.group(0), statement))
     #     statement = statement.replace(match.group(0),
     #                                   '%s(%s)' % (cls_repl, match.group(2)), 1)
-    return eval(statement, {"__builtins__": None}, safe_dict)
+    return eval(statement, get_safe_eval_globals(), kwargs)
 
 
 def eval_kwarg(x):
@@ -861,6 +1147,50 @@ def eval_kwarg(x):
     return x
 
 
+class LazyTypeMeta(type):
+    r"""Metaclass for placeholders that stand in for a type defined by a
+    module that is slow to import (see lazy_type)."""
+
+    def get_type(cls):
+        r"""Get the type that the placeholder stands in for.
+
+        Returns:
+            type: The type if the module defining it has been imported,
+                None otherwise.
+
+        """
+        mod = sys.modules.get(cls.module, None)
+        if mod is None:
+            return None
+        return getattr(mod, cls.type_name)
+
+    def __instancecheck__(cls, obj):
+        t = cls.get_type()
+        return (t is not None) and isinstance(obj, t)
+
+    def __subclasscheck__(cls, subclass):
+        t = cls.get_type()
+        return (t is not None) and issubclass(subclass, t)
+
+
+def lazy_type(module, type_name):
+    r"""Get a placeholder for a type that can be used in isinstance and
+    issubclass checks without importing the module that defines the type.
+    An object cannot be an instance of the type unless the module has been
+    imported, so checks are False until the module is imported elsewhere.
+
+    Args:
+        module (str): Full name of the module that defines the type.
+        type_name (str): Name of the type in the module.
+
+    Returns:
+        type: Placeholder for the type.
+
+    """
+    return LazyTypeMeta(type_name, (object, ),
+                        {'module': module, 'type_name': type_name})
+
+
 class YggPopen(subprocess.Popen):
     r"""Uses Popen to open a process without a buffer. If not already set,
     the keyword arguments 'bufsize', 'stdout', and 'stderr' are set to
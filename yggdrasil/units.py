@@ -1,17 +1,47 @@
 import re
+import threading
+import functools
 import numpy as np
-import unyt
 from yggdrasil import tools
-_ureg_unyt = unyt.UnitRegistry('mks')
-_unit_quantity = unyt.array.unyt_quantity
-_unit_array = unyt.array.unyt_array
-_ureg_unyt.add("ac", 4046.86, dimensions=unyt.dimensions.area,
-               tex_repr=r"\rm{ac}", offset=0.0, prefixable=False)
-_ureg_unyt.add("a", 100.0, dimensions=unyt.dimensions.area,
-               tex_repr=r"\rm{a}", offset=0.0, prefixable=True)
-unyt._unit_lookup_table.inv_name_alternatives["acre"] = "ac"
-unyt._unit_lookup_table.inv_name_alternatives["are"] = "a"
-unyt._unit_lookup_table.inv_name_alternatives["hectare"] = "ha"
+_ureg_unyt = None
+_ureg_lock = threading.Lock()
+# Placeholders for type checks that do not require importing unyt
+_unit_quantity_type = tools.lazy_type('unyt.array', 'unyt_quantity')
+_unit_array_type = tools.lazy_type('unyt.array', 'unyt_array')
+_unit_cache_size = 256
+
+
+def import_unyt():
+    r"""Import unyt and create the unit registry used by yggdrasil. unyt is
+    slow to import so this is done the first time units are used.
+
+    Returns:
+        module: The unyt module.
+
+    """
+    global _ureg_unyt
+    import unyt
+    with _ureg_lock:
+        if _ureg_unyt is None:
+            ureg = unyt.UnitRegistry('mks')
+            ureg.add("ac", 4046.86, dimensions=unyt.dimensions.area,
+                     tex_repr=r"\rm{ac}", offset=0.0, prefixable=False)
+            ureg.add("a", 100.0, dimensions=unyt.dimensions.area,
+                     tex_repr=r"\rm{a}", offset=0.0, prefixable=True)
+            alternatives = unyt._unit_lookup_table.inv_name_alternatives
+            alternatives["acre"] = "ac"
+            alternatives["are"] = "a"
+            alternatives["hectare"] = "ha"
+            _ureg_unyt = ureg
+    return unyt
+
+
+def __getattr__(name):
+    r"""Import unyt when the unyt array classes are accessed."""
+    if name in ['_unit_quantity', '_unit_array']:
+        return getattr(import_unyt().array, name.replace('_unit_', 'unyt_'))
+    raise AttributeError("module '%s' has no attribute '%s'"
+                         % (__name__, name))
 
 
 def convert_R_unit_string(r_str):
@@ -103,6 +133,8 @@ def add_units(arr, unit_str, dtype=None):
         unyt.unyt_array: Array with units.
 
     """
+    if not unit_str:
+        return arr
     unit_str = tools.bytes2str(unit_str)
     if is_null_unit(unit_str):
         return arr
@@ -113,17 +145,21 @@ def add_units(arr, unit_str, dtype=None):
             dtype = arr.dtype
         else:
             dtype = np.array([arr]).dtype
+    unit = as_unit(unit_str)
+    unyt = import_unyt()
     if isinstance(arr, np.ndarray) and (arr.ndim > 0):
-        out = unyt.unyt_array(arr, unit_str, dtype=dtype,
+        out = unyt.unyt_array(arr, unit, dtype=dtype,
                               registry=_ureg_unyt)
     else:
-        out = unyt.unyt_quantity(arr, unit_str, dtype=dtype,
+        out = unyt.unyt_quantity(arr, unit, dtype=dtype,
                                  registry=_ureg_unyt)
     return out
 
 
+@functools.lru_cache(maxsize=_unit_cache_size)
 def are_compatible(units1, units2):
-    r"""Check if two units are compatible.
+    r"""Check if two units are compatible. Results are cached for each
+    pair of unit strings.
 
     Args:
         units1 (str): First units string.
@@ -138,14 +174,98 @@ def are_compatible(units1, units2):
         return True
     if (not is_unit(units1)) or (not is_unit(units2)):
         return False
-    x = add_units(1, units1)
     try:
-        convert_to(x, units2)
+        get_conversion_factor(units1, units2)
     except ValueError:
         return False
     return True
 
 
+@functools.lru_cache(maxsize=_unit_cache_size)
+def get_conversion_factor(units1, units2):
+    r"""Get the factor and offset required to convert values from one set
+    of units to another. Results are cached for each pair of unit strings.
+
+    Args:
+        units1 (str): Units to convert from.
+        units2 (str): Units to convert to.
+
+    Returns:
+        tuple(float, float): Factor and offset such that values in units2 are
+            equal to (values in units1 * factor) - offset.
+
+    Raises:
+        ValueError: If the units are not compatible.
+
+    """
+    unyt = import_unyt()
+    try:
+        factor, offset = as_unit(units1).get_conversion_factor(
+            as_unit(units2))
+    except unyt.exceptions.UnitConversionError as e:
+        raise ValueError(str(e))
+    return factor, (offset or 0.0)
+
+
+def convert_fields(arr, field_units, new_units):
+    r"""Convert the fields in a structured array from one set of units to
+    another. The conversion is a single vectorized operation for each field.
+
+    Args:
+        arr (np.ndarray): Structured array.
+        field_units (list): Units of each field in arr.
+        new_units (list): Units that each field should be converted to.
+
+    Returns:
+        np.ndarray: Structured array with converted values. If none of the
+            fields require conversion, arr is returned unchanged. Integer
+            fields are promoted to floats if the conversion factor or
+            offset is not integral.
+
+    Raises:
+        ValueError: If the units for a field are not compatible.
+
+    """
+    conversions = []
+    for name, u1, u2 in zip(arr.dtype.names, field_units, new_units):
+        u1 = tools.bytes2str(u1 or '')
+        u2 = tools.bytes2str(u2 or '')
+        if (is_null_unit(u1) or is_null_unit(u2) or (u1 == u2)):
+            continue
+        factor, offset = get_conversion_factor(u1, u2)
+        if (factor != 1.0) or (offset != 0.0):
+            conversions.append((name, factor, offset))
+    if not conversions:
+        return arr
+    dtype = arr.dtype
+    promoted = {name: np.dtype((np.result_type(dtype[name].base,
+                                               factor, offset),
+                                dtype[name].shape))
+                for name, factor, offset in conversions
+                if not is_integral_conversion(factor, offset)}
+    if any(promoted[name] != dtype[name] for name in promoted):
+        dtype = np.dtype([(name, promoted.get(name, dtype[name]))
+                          for name in dtype.names])
+    out = arr.astype(dtype, copy=True)
+    for name, factor, offset in conversions:
+        out[name] = arr[name] * factor - offset
+    return out
+
+
+def is_integral_conversion(factor, offset):
+    r"""Determine if a unit conversion maps integers to integers.
+
+    Args:
+        factor (float): Conversion factor.
+        offset (float): Conversion offset.
+
+    Returns:
+        bool: True if both the factor and offset are whole numbers.
+
+    """
+    return (float(factor).is_integer() and float(offset).is_integer())
+
+
 def is_null_unit(ustr):
     r"""Determines if a string is a null unit.
 
@@ -161,6 +281,25 @@ def is_null_unit(ustr):
     return False
 
 
+@functools.lru_cache(maxsize=_unit_cache_size)
+def _parse_unit(ustr):
+    r"""Parse a unit string. Results are cached for each string.
+
+    Args:
+        ustr (str): Unit string.
+
+    Returns:
+        tuple(unyt.Unit, str): Unit object and None if the string could be
+            parsed, None and the error message otherwise.
+
+    """
+    unyt = import_unyt()
+    try:
+        return unyt.Unit(ustr, registry=_ureg_unyt), None
+    except unyt.exceptions.UnitParseError as e:
+        return None, str(e)
+
+
 def as_unit(ustr):
     r"""Get unit object for the string.
 
@@ -174,10 +313,16 @@ def as_unit(ustr):
         ValueError: If the string is not a recognized unit.
 
     """
-    try:
-        out = unyt.Unit(ustr, registry=_ureg_unyt)
-    except unyt.exceptions.UnitParseError as e:
-        raise ValueError(str(e))
+    if not isinstance(ustr, str):
+        unyt = import_unyt()
+        try:
+            out = unyt.Unit(ustr, registry=_ureg_unyt)
+        except unyt.exceptions.UnitParseError as e:
+            raise ValueError(str(e))
+        return out
+    out, err = _parse_unit(ustr)
+    if out is None:
+        raise ValueError(err)
     return out
 
 
@@ -218,8 +363,9 @@ def convert_to(arr, new_units):
         return arr
     if not has_units(arr):
         return add_units(arr, new_units)
+    unyt = import_unyt()
     try:
-        out = arr.to(new_units)
+        out = arr.to(as_unit(tools.bytes2str(new_units)))
     except unyt.exceptions.UnitConversionError as e:
         raise ValueError(str(e))
     return out
@@ -271,6 +271,7 @@ def parse_model(yml, existing):
                'datatype': {'type': 'bytes'},
                'driver': 'ServerDriver',
                'args': yml['name'] + '_SERVER',
+               'replicas': yml.get('replicas', 1),
                'working_dir': yml['working_dir']}
         yml['inputs'].append(srv)
         yml['clients'] = []